@@ -51,3 +51,12 @@ def repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Repo:
     """Mocking tmp_path
     """
     return get_repo(request, tmp_path_factory)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path_factory: TempPathFactory):
+    """Keeps the demisto-sdk caches of each test in a temporary directory
+    """
+    cache_dir_path = tmp_path_factory.mktemp('demisto-sdk-cache')
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(cache_dir_path))
+    return cache_dir_path
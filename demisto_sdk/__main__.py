@@ -2,6 +2,8 @@
 import os
 import re
 import sys
+from multiprocessing import cpu_count
+from typing import Tuple
 
 from pkg_resources import get_distribution
 
@@ -266,6 +268,16 @@ def unify(**kwargs):
 @click.option(
     '--silence-init-prints', is_flag=True,
     help='Whether to skip the initialization prints.')
+@click.option(
+    '-w', '--workers', type=int, default=1, show_default=True,
+    help='The number of worker processes to validate the files with, used with -a.')
+@click.option(
+    '--no-cache', is_flag=True,
+    help='Validate all the files without reading or saving cached validation results.')
+@click.option(
+    '--watch', is_flag=True,
+    help='Keep running after the validation of the input path, and validate again the files which are changed in '
+         'it, until stopped with Ctrl+C. Used with -i.')
 @pass_config
 def validate(config, **kwargs):
     sys.path.append(config.configuration.env_dir)
@@ -274,6 +286,9 @@ def validate(config, **kwargs):
     if file_path and not os.path.isfile(file_path) and not os.path.isdir(file_path):
         print_error(f'File {file_path} was not found')
         return 1
+    elif kwargs['watch'] and (not file_path or kwargs['use_git'] or kwargs.get('validate_all')):
+        print_error('The --watch flag can only be used with the -i flag')
+        return 1
     else:
         is_external_repo = tools.is_external_repository()
 
@@ -288,7 +303,10 @@ def validate(config, **kwargs):
                                     is_external_repo=is_external_repo,
                                     print_ignored_files=kwargs['print_ignored_files'],
                                     no_docker_checks=kwargs['no_docker_checks'],
-                                    silence_init_prints=kwargs['silence_init_prints'])
+                                    silence_init_prints=kwargs['silence_init_prints'],
+                                    workers=kwargs['workers'], use_cache=not kwargs['no_cache'])
+        if kwargs['watch']:
+            return validator.run_validation_in_watch_mode()
         return validator.run_validation()
 
 
@@ -385,6 +403,10 @@ def secrets(config, **kwargs):
 @click.option("--no-pwsh-analyze", is_flag=True, help="Do NOT run powershell analyze")
 @click.option("--no-pwsh-test", is_flag=True, help="Do NOT run powershell test")
 @click.option("-kc", "--keep-container", is_flag=True, help="Keep the test container")
+@click.option("-ec", "--exec-in-container", is_flag=True,
+              help="Copy every package into one container of its test image and run the docker checks in it, "
+                   "instead of building an image of every package. Unless the containers are kept, they are reused "
+                   "by the next packages, up to --parallel containers")
 @click.option("--test-xml", help="Path to store pytest xml results", type=click.Path(exists=True, resolve_path=True))
 @click.option("--failure-report", help="Path to store failed packs report",
               type=click.Path(exists=True, resolve_path=True))
@@ -392,7 +414,8 @@ def secrets(config, **kwargs):
               type=click.Path(exists=True, resolve_path=True))
 def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, parallel: int, no_flake8: bool,
          no_bandit: bool, no_mypy: bool, no_vulture: bool, no_pylint: bool, no_test: bool, no_pwsh_analyze: bool,
-         no_pwsh_test: bool, keep_container: bool, test_xml: str, failure_report: str, log_path: str):
+         no_pwsh_test: bool, keep_container: bool, exec_in_container: bool, test_xml: str, failure_report: str,
+         log_path: str):
     """Lint command will perform:\n
         1. Package in host checks - flake8, bandit, mypy, vulture.\n
         2. Package in docker image checks -  pylint, pytest, powershell - test, powershell - analyze.\n
@@ -415,7 +438,8 @@ def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, para
                                          no_pwsh_test=no_pwsh_test,
                                          keep_container=keep_container,
                                          test_xml=test_xml,
-                                         failure_report=failure_report)
+                                         failure_report=failure_report,
+                                         exec_in_container=exec_in_container)
 
 
 # ====================== format ====================== #
@@ -766,6 +790,9 @@ def generate_doc(**kwargs):
 )
 @click.option(
     "-o", "--output", help="Output file path, the default is the Tests directory.", required=False)
+@click.option(
+    "--full", help="Ignore the id_set manifest and process all the content files.", is_flag=True,
+    default=False, show_default=True)
 def id_set_command(**kwargs):
     id_set_creator = IDSetCreator(**kwargs)
     id_set_creator.create_id_set()
@@ -855,27 +882,60 @@ def update_pack_releasenotes(**kwargs):
     '-h', '--help'
 )
 @click.option(
-    "-p", "--pack_folder_name", help="Pack folder name to find dependencies.", required=True)
+    "-p", "--pack_folder_name", help="Pack folder name to find dependencies. Can be provided multiple times",
+    required=False, multiple=True)
+@click.option(
+    "-a", "--all-packs", help="Find the dependencies of all the content packs in one pass.", is_flag=True,
+    required=False)
 @click.option(
     "-i", "--id_set_path", help="Path to id set json file.", required=False)
 @click.option(
     "--no-update", help="Use to find the pack dependencies without updating the pack metadata.", required=False,
     is_flag=True)
+@click.option(
+    "--graph-output", help="Path to a json file to dump the packs dependency graph to.",
+    required=False)
+@click.option(
+    "-w", "--workers", help="The number of worker processes to find the dependencies with. Defaults to the number of "
+                            "CPUs.", type=int, required=False)
 @click.option(
     "-v", "--verbose", help="Path to debug md file. will state pack dependency per item.",
     hidden=True, required=False)
 def find_dependencies_command(**kwargs):
-    pack_name = kwargs.get('pack_folder_name', '')
+    pack_names: Tuple[str, ...] = kwargs.get('pack_folder_name') or ()
+    graph_output_path = kwargs.get('graph_output')
+    workers = kwargs.get('workers')
     id_set_path = kwargs.get('id_set_path')
     verbose = kwargs.get('verbose')
     update_pack_metadata = not kwargs.get('no_update')
 
+    if bool(pack_names) == bool(kwargs.get('all_packs')):
+        print_error('Please provide either pack folder names (-p) or the --all-packs flag.')
+        return 1
+
     try:
-        PackDependencies.find_dependencies(pack_name=pack_name,
-                                           id_set_path=id_set_path,
-                                           debug_file_path=verbose,
-                                           update_pack_metadata=update_pack_metadata,
-                                           )
+        if kwargs.get('all_packs'):
+            PackDependencies.find_all_packs_dependencies(id_set_path=id_set_path,
+                                                         debug_file_path=verbose,
+                                                         update_pack_metadata=update_pack_metadata,
+                                                         graph_output_path=graph_output_path,
+                                                         workers=workers or cpu_count(),
+                                                         )
+        elif len(pack_names) > 1 or graph_output_path or workers:
+            # a single pack is calculated like multiple packs for the dependency graph and the worker processes
+            PackDependencies.find_packs_dependencies(pack_names,
+                                                     id_set_path=id_set_path,
+                                                     debug_file_path=verbose,
+                                                     update_pack_metadata=update_pack_metadata,
+                                                     graph_output_path=graph_output_path,
+                                                     workers=workers or cpu_count(),
+                                                     )
+        else:
+            PackDependencies.find_dependencies(pack_name=pack_names[0],
+                                               id_set_path=id_set_path,
+                                               debug_file_path=verbose,
+                                               update_pack_metadata=update_pack_metadata,
+                                               )
     except ValueError as exp:
         print_error(str(exp))
 
@@ -946,3 +946,7 @@ VALIDATED_PACK_ITEM_TYPES = [
     'Classifiers',
     'Layouts'
 ]
+
+# Set to change the directory in which the demisto-sdk caches are kept
+CACHE_DIR_ENV_VAR = 'DEMISTO_SDK_CACHE_DIR'
+DEFAULT_CACHE_DIR = '.demisto-sdk-cache'
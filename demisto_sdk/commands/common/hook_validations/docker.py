@@ -1,5 +1,11 @@
+import json
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
 
 from pkg_resources import parse_version
 
@@ -7,7 +13,8 @@ import requests
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import (get_cache_dir, get_yaml,
+                                               print_warning)
 
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()
@@ -21,6 +28,100 @@ ACCEPT_HEADER = {
 # use 10 seconds timeout for requests
 TIMEOUT = 10
 DEFAULT_REGISTRY = 'registry-1.docker.io'
+DOCKER_HUB_URL = 'https://hub.docker.com'
+# Set to fetch the docker image tags from another registry, given as a host or as a url, e.g. http://localhost:5000
+DOCKER_REGISTRY_ENV_VAR = 'DEMISTO_SDK_DOCKER_REGISTRY'
+# The latest tags of the docker images are fetched again after an hour
+DOCKER_TAGS_CACHE_TTL = timedelta(hours=1)
+# The number of docker images the latest tags of which are fetched concurrently
+DOCKER_PREFETCH_WORKERS = 8
+
+# The requests sessions by process, so forked processes do not share the connections of their parent
+_SESSIONS: Dict[int, requests.Session] = {}
+# The docker tags caches by path
+_DOCKER_TAGS_CACHES: Dict[str, 'DockerTagsCache'] = {}
+_DOCKER_TAGS_CACHES_LOCK = threading.Lock()
+
+
+def get_docker_registry() -> str:
+    return os.environ.get(DOCKER_REGISTRY_ENV_VAR, DEFAULT_REGISTRY)
+
+
+def get_registry_url(registry: str) -> str:
+    """Returns the url of a registry given as a host, which is accessed over https, or as a url."""
+    return registry if '://' in registry else f'https://{registry}'
+
+
+def get_session() -> requests.Session:
+    """Returns the requests session of this process, which keeps the connections to the registries open."""
+    pid = os.getpid()
+    if pid not in _SESSIONS:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=DOCKER_PREFETCH_WORKERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _SESSIONS[pid] = session
+    return _SESSIONS[pid]
+
+
+class DockerTagsCache:
+    """
+    The latest tags of docker images by registry, kept in memory and on disk for DOCKER_TAGS_CACHE_TTL so following
+    runs do not fetch them again.
+
+    Attributes:
+        cache_path (str): The path of the file the tags are kept in.
+        tags (dict): The latest tag of every image and the time it was fetched, by registry and image name.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.tags = self.load()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(registry: str, docker_image_name: str) -> str:
+        return f'{registry}/{docker_image_name}'
+
+    def load(self) -> dict:
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, registry: str, docker_image_name: str) -> Optional[str]:
+        """Returns the latest tag of a docker image, or None if it was not fetched in the last DOCKER_TAGS_CACHE_TTL"""
+        cached_tag = self.tags.get(self.get_key(registry, docker_image_name))
+        if cached_tag and time.time() - cached_tag['time'] < DOCKER_TAGS_CACHE_TTL.total_seconds():
+            return cached_tag['tag']
+        return None
+
+    def set(self, registry: str, docker_image_name: str, tag: str):
+        """Keeps the latest tag of a docker image, along with the tags other processes saved meanwhile."""
+        with self._lock:
+            self.tags[self.get_key(registry, docker_image_name)] = {'tag': tag, 'time': time.time()}
+            for key, saved_tag in self.load().items():
+                if key not in self.tags or self.tags[key]['time'] < saved_tag['time']:
+                    self.tags[key] = saved_tag
+
+            temp_path = f'{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(temp_path, 'w') as cache_file:
+                    json.dump(self.tags, cache_file)
+                os.replace(temp_path, self.cache_path)
+            except OSError as err:
+                print_warning(f'Could not save the docker image tags to the cache {self.cache_path}. Error: {err}')
+
+
+def get_docker_tags_cache() -> DockerTagsCache:
+    """Returns the docker tags cache of this process."""
+    cache_path = os.path.join(get_cache_dir('docker'), 'latest_tags.json')
+    with _DOCKER_TAGS_CACHES_LOCK:
+        if cache_path not in _DOCKER_TAGS_CACHES:
+            _DOCKER_TAGS_CACHES[cache_path] = DockerTagsCache(cache_path)
+        return _DOCKER_TAGS_CACHES[cache_path]
 
 
 class DockerImageValidator(BaseValidator):
@@ -132,8 +233,9 @@ class DockerImageValidator(BaseValidator):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
-            'https://{}/v2/'.format(registry),
+        session = get_session()
+        res = session.get(
+            '{}/v2/'.format(get_registry_url(registry)),
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
             verify=verify_ssl
@@ -152,7 +254,7 @@ class DockerImageValidator(BaseValidator):
                 'scope': 'repository:{}:pull'.format(image_name),
                 'service': service
             }
-            res = requests.get(
+            res = session.get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -240,47 +342,98 @@ class DockerImageValidator(BaseValidator):
                     return ''
                 return "no-tag-required"
         try:
-            tag = ''
-            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-            headers = ACCEPT_HEADER.copy()
-            if auth_token:
-                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            return DockerImageValidator.get_latest_tag_from_registry(docker_image_name)
+        except (requests.exceptions.RequestException, Exception):
+            if not docker_image_name:
+                docker_image_name = yml_docker_image
+            error_message, error_code = Errors.docker_tag_not_fetched(docker_image_name)
+            if self.handle_error(error_message, error_code, file_path=self.file_path):
+                return ''
+
+            return "no-tag-required"
+
+    @staticmethod
+    def fetch_latest_tag_from_registry(docker_image_name, registry):
+        """Fetches the latest tag of a docker image from the docker hub, or from the registry API.
 
+        Args:
+            docker_image_name: The name of the docker image
+            registry: The registry to fetch the tags from
+
+        Returns:
+            The last updated docker image tag, or an empty string if the image has no tags
+        """
+        session = get_session()
+        if registry == DEFAULT_REGISTRY:
             # first try to get the docker image tags using normal http request
-            res = requests.get(
-                url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
+            res = session.get(
+                url='{}/v2/repositories/{}/tags'.format(DOCKER_HUB_URL, docker_image_name),
                 verify=False,
                 timeout=TIMEOUT,
             )
             if res.status_code == 200:
                 tags = res.json().get('results', [])
                 # if http request successful find the latest tag by date in the response
-                if tags:
-                    tag = DockerImageValidator.find_latest_tag_by_date(tags)
+                return DockerImageValidator.find_latest_tag_by_date(tags) if tags else ''
+
+        # if http request did not succeed than get tags using the API.
+        # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
+        auth_token = DockerImageValidator.docker_auth(docker_image_name, False, registry)
+        headers = ACCEPT_HEADER.copy()
+        if auth_token:
+            headers['Authorization'] = 'Bearer {}'.format(auth_token)
+
+        res = session.get(
+            '{}/v2/{}/tags/list'.format(get_registry_url(registry), docker_image_name),
+            headers=headers,
+            timeout=TIMEOUT,
+            verify=False
+        )
+        res.raise_for_status()
+        # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
+        tags = res.json().get('tags', [])
+        return DockerImageValidator.lexical_find_latest_tag(tags) if tags else ''
 
-            else:
-                # if http request did not succeed than get tags using the API.
-                # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-                res = requests.get(
-                    'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
-                    headers=headers,
-                    timeout=TIMEOUT,
-                    verify=False
-                )
-                res.raise_for_status()
-                # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
-                tags = res.json().get('tags', [])
-                if tags:
-                    tag = DockerImageValidator.lexical_find_latest_tag(tags)
-            return tag
-        except (requests.exceptions.RequestException, Exception):
-            if not docker_image_name:
-                docker_image_name = yml_docker_image
-            error_message, error_code = Errors.docker_tag_not_fetched(docker_image_name)
-            if self.handle_error(error_message, error_code, file_path=self.file_path):
-                return ''
+    @staticmethod
+    def get_latest_tag_from_registry(docker_image_name):
+        """Returns the latest tag of a docker image from the docker tags cache, or fetches and caches it.
 
-            return "no-tag-required"
+        Args:
+            docker_image_name: The name of the docker image
+
+        Returns:
+            The last updated docker image tag
+        """
+        registry = get_docker_registry()
+        docker_tags_cache = get_docker_tags_cache()
+        tag = docker_tags_cache.get(registry, docker_image_name)
+        if tag is None:
+            tag = DockerImageValidator.fetch_latest_tag_from_registry(docker_image_name, registry)
+            if tag:
+                docker_tags_cache.set(registry, docker_image_name, tag)
+
+        return tag
+
+    @staticmethod
+    def prefetch_latest_tags(docker_image_names: Iterable[str]):
+        """Fetches the latest tags of several docker images concurrently into the docker tags cache, so the
+        validations of the files which use them do not wait for the registry one by one.
+        Failures are ignored here, and reported by the validations which fetch the tags again.
+
+        Args:
+            docker_image_names: The names of the docker images
+        """
+        def prefetch_latest_tag(docker_image_name):
+            try:
+                DockerImageValidator.get_latest_tag_from_registry(docker_image_name)
+            except Exception:
+                pass
+
+        # create the session and the cache before the concurrent fetches share them
+        get_session()
+        get_docker_tags_cache()
+        with ThreadPoolExecutor(max_workers=DOCKER_PREFETCH_WORKERS) as executor:
+            list(executor.map(prefetch_latest_tag, set(docker_image_names)))
 
     def parse_docker_image(self, docker_image):
         """Verify that the docker image is of demisto format & parse the name and tag
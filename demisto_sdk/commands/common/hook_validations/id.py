@@ -3,14 +3,14 @@ import os
 import re
 from collections import OrderedDict
 from distutils.version import LooseVersion
+from typing import Callable, Optional
 
 import demisto_sdk.commands.common.constants as constants
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import (collect_ids,
-                                               get_script_or_integration_id)
+from demisto_sdk.commands.common.id_set import IdSet, IdSetSection
 from demisto_sdk.commands.common.update_id_set import (get_integration_data,
                                                        get_playbook_data,
                                                        get_script_data)
@@ -31,6 +31,7 @@ class IDSetValidator(BaseValidator):
         playbook_set (set): Set of all the data regarding playbooks in our system.
         integration_set (set): Set of all the data regarding integrations in our system.
         test_playbook_set (set): Set of all the data regarding test playbooks in our system.
+        files_data (dict): The id_set data extracted from the validated files, by the extracting function and path.
     """
     SCRIPTS_SECTION = "scripts"
     PLAYBOOK_SECTION = "playbooks"
@@ -44,6 +45,7 @@ class IDSetValidator(BaseValidator):
         super().__init__(ignored_errors=ignored_errors, print_as_warnings=print_as_warnings)
         self.is_circle = is_circle
         self.configuration = configuration
+        self.files_data: dict = {}
         if not is_test_run and self.is_circle:
             self.id_set = self.load_id_set()
             self.id_set_path = os.path.join(self.configuration.env_dir, 'configs', 'id_set.json')
@@ -55,7 +57,7 @@ class IDSetValidator(BaseValidator):
     def load_id_set(self):
         with open(self.ID_SET_PATH, 'r') as id_set_file:
             try:
-                id_set = json.load(id_set_file)
+                id_set = IdSet(json.load(id_set_file))
             except ValueError as ex:
                 if "Expecting property name" in str(ex):
                     error_message, error_code = Errors.id_set_conflicts()
@@ -66,8 +68,40 @@ class IDSetValidator(BaseValidator):
 
                 raise
 
+            # the indexes are built once, so every validated file is looked up in them instead of in the sections
+            id_set.build_indexes()
             return id_set
 
+    def get_file_data(self, get_data: Callable, file_path: str, data_dictionary: Optional[dict] = None,
+                      **kwargs) -> OrderedDict:
+        """Extracts the id_set data of a validated file once, from its already loaded content when it is given.
+
+        Args:
+            get_data (Callable): The update_id_set function which extracts the data of the file type.
+            file_path (string): Path to the file.
+            data_dictionary (dict): The loaded content of the file, which is read from the file if not given.
+            kwargs: Additional arguments of the extracting function.
+
+        Returns:
+            OrderedDict. The file id mapped to its id_set data.
+        """
+        key = (get_data.__name__, file_path)
+        if key not in self.files_data:
+            self.files_data[key] = get_data(file_path, data_dictionary=data_dictionary or None, **kwargs)
+        return self.files_data[key]
+
+    def get_package_script_data(self, file_path: str, package_path: str, data_dictionary: Optional[dict] = None):
+        """Extracts the id_set data of a script package, reusing the loaded content if the file is the script yml.
+
+        Returns:
+            tuple. The package yml path and the script id_set data.
+        """
+        unifier = Unifier(package_path)
+        yml_path, code = unifier.get_script_or_integration_package_data()
+        if yml_path != file_path:
+            data_dictionary = None
+        return yml_path, self.get_file_data(get_script_data, yml_path, data_dictionary, script_code=code)
+
     def is_valid_in_id_set(self, file_path: str, obj_data: OrderedDict, obj_set: list):
         """Check if the file is represented correctly in the id_set
 
@@ -82,15 +116,14 @@ class IDSetValidator(BaseValidator):
         is_found = False
         file_id = list(obj_data.keys())[0]
 
-        for checked_instance in obj_set:
-            checked_instance_id = list(checked_instance.keys())[0]
-            checked_instance_data = checked_instance[checked_instance_id]
+        obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
+        obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
+
+        for checked_instance in IdSetSection.of(obj_set).get_by_id(file_id):
+            checked_instance_data = checked_instance[file_id]
             checked_instance_toversion = checked_instance_data.get('toversion', '99.99.99')
             checked_instance_fromversion = checked_instance_data.get('fromversion', '0.0.0')
-            obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
-            obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
-            if checked_instance_id == file_id and checked_instance_toversion == obj_to_version and \
-                    checked_instance_fromversion == obj_from_version:
+            if checked_instance_toversion == obj_to_version and checked_instance_fromversion == obj_from_version:
                 is_found = True
                 if checked_instance_data != obj_data[file_id]:
                     error_message, error_code = Errors.id_set_not_updated(file_path)
@@ -104,11 +137,12 @@ class IDSetValidator(BaseValidator):
 
         return is_found
 
-    def is_file_valid_in_set(self, file_path):
+    def is_file_valid_in_set(self, file_path, data_dictionary=None):
         """Check if the file is represented correctly in the id_set
 
         Args:
             file_path (string): Path to the file.
+            data_dictionary (dict): The loaded content of the file, which is read from the file if not given.
 
         Returns:
             bool. Whether the file is represented correctly in the id_set or not.
@@ -116,31 +150,30 @@ class IDSetValidator(BaseValidator):
         is_valid = True
         if self.is_circle:  # No need to check on local env because the id_set will contain this info after the commit
             if re.match(constants.PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_data = get_playbook_data(file_path)
+                playbook_data = self.get_file_data(get_playbook_data, file_path, data_dictionary)
                 is_valid = self.is_valid_in_id_set(file_path, playbook_data, self.playbook_set)
 
             elif re.match(constants.TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_data = get_playbook_data(file_path)
+                playbook_data = self.get_file_data(get_playbook_data, file_path, data_dictionary)
                 is_valid = self.is_valid_in_id_set(file_path, playbook_data, self.test_playbook_set)
 
             elif re.match(constants.TEST_SCRIPT_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.PACKS_SCRIPT_NON_SPLIT_YML_REGEX, file_path, re.IGNORECASE):
 
-                script_data = get_script_data(file_path)
+                script_data = self.get_file_data(get_script_data, file_path, data_dictionary)
                 is_valid = self.is_valid_in_id_set(file_path, script_data, self.script_set)
 
             elif re.match(constants.PACKS_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.PACKS_INTEGRATION_NON_SPLIT_YML_REGEX, file_path, re.IGNORECASE):
 
-                integration_data = get_integration_data(file_path)
+                integration_data = self.get_file_data(get_integration_data, file_path, data_dictionary)
                 is_valid = self.is_valid_in_id_set(file_path, integration_data, self.integration_set)
 
             elif re.match(constants.PACKS_SCRIPT_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.PACKS_SCRIPT_PY_REGEX, file_path, re.IGNORECASE):
 
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, code = unifier.get_script_or_integration_package_data()
-                script_data = get_script_data(yml_path, script_code=code)
+                yml_path, script_data = self.get_package_script_data(file_path, os.path.dirname(file_path),
+                                                                     data_dictionary)
                 is_valid = self.is_valid_in_id_set(yml_path, script_data, self.script_set)
 
         return is_valid
@@ -159,28 +192,22 @@ class IDSetValidator(BaseValidator):
         is_duplicated = False
         obj_data_list = list(obj_data.values())
         dict_value = obj_data_list[0]
-        obj_toversion = dict_value.get('toversion', '99.99.99')
-        obj_fromversion = dict_value.get('fromversion', '0.0.0')
-
-        for section, section_data in self.id_set.items():
-            for instance in section_data:
-                instance_id = list(instance.keys())[0]
-                instance_to_version = instance[instance_id].get('toversion', '99.99.99')
-                instance_from_version = instance[instance_id].get('fromversion', '0.0.0')
-                if obj_id == instance_id:
-                    if section != obj_type and LooseVersion(obj_fromversion) < LooseVersion(instance_to_version):
-                        is_duplicated = True
-                        break
-
-                    elif obj_fromversion == instance_from_version and obj_toversion == instance_to_version:
-                        if instance[instance_id] != obj_data[obj_id]:
-                            is_duplicated = True
-                            break
-
-                    elif (LooseVersion(obj_fromversion) <= LooseVersion(instance_to_version) and
-                          (LooseVersion(obj_toversion) >= LooseVersion(instance_from_version))):
-                        is_duplicated = True
-                        break
+        obj_toversion = LooseVersion(dict_value.get('toversion', '99.99.99'))
+        obj_fromversion = LooseVersion(dict_value.get('fromversion', '0.0.0'))
+
+        for instance in IdSet.of(self.id_set).get_entries(obj_id):
+            if instance.section != obj_type and obj_fromversion < instance.to_version:
+                is_duplicated = True
+                break
+
+            elif obj_fromversion == instance.from_version and obj_toversion == instance.to_version:
+                if instance.data != obj_data[obj_id]:
+                    is_duplicated = True
+                    break
+
+            elif obj_fromversion <= instance.to_version and obj_toversion >= instance.from_version:
+                is_duplicated = True
+                break
 
         if is_duplicated:
             error_message, error_code = Errors.duplicated_id(obj_id)
@@ -189,11 +216,12 @@ class IDSetValidator(BaseValidator):
 
         return is_duplicated
 
-    def is_file_has_used_id(self, file_path):
+    def is_file_has_used_id(self, file_path, data_dictionary=None):
         """Check if the ID of the given file already exist in the system.
 
         Args:
             file_path (string): Path to the file.
+            data_dictionary (dict): The loaded content of the file, which is read from the file if not given.
 
         Returns:
             bool. Whether the ID of the given file already exist in the system or not.
@@ -203,42 +231,36 @@ class IDSetValidator(BaseValidator):
         if self.is_circle:
             if re.match(constants.TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.TEST_PLAYBOOK_SECTION
-                obj_id = collect_ids(file_path)
-                obj_data = get_playbook_data(file_path)
+                obj_data = self.get_file_data(get_playbook_data, file_path, data_dictionary)
 
             elif re.match(constants.PACKS_SCRIPT_NON_SPLIT_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.SCRIPTS_SECTION
-                obj_id = get_script_or_integration_id(file_path)
-                obj_data = get_script_data(file_path)
+                obj_data = self.get_file_data(get_script_data, file_path, data_dictionary)
 
             elif re.match(constants.PACKS_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.PACKS_INTEGRATION_NON_SPLIT_YML_REGEX, file_path, re.IGNORECASE):
 
                 obj_type = self.INTEGRATION_SECTION
-                obj_id = get_script_or_integration_id(file_path)
-                obj_data = get_integration_data(file_path)
+                obj_data = self.get_file_data(get_integration_data, file_path, data_dictionary)
 
             elif re.match(constants.PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 obj_type = self.PLAYBOOK_SECTION
-                obj_id = collect_ids(file_path)
-                obj_data = get_playbook_data(file_path)
+                obj_data = self.get_file_data(get_playbook_data, file_path, data_dictionary)
 
             elif re.match(constants.PACKS_SCRIPT_YML_REGEX, file_path, re.IGNORECASE) or \
                     re.match(constants.PACKS_SCRIPT_PY_REGEX, file_path, re.IGNORECASE):
 
-                unifier = Unifier(os.path.dirname(os.path.dirname(file_path)))
-                yml_path, code = unifier.get_script_or_integration_package_data()
-
-                obj_data = get_script_data(yml_path, script_code=code)
-
+                _, obj_data = self.get_package_script_data(file_path, os.path.dirname(os.path.dirname(file_path)),
+                                                           data_dictionary)
                 obj_type = self.SCRIPTS_SECTION
-                obj_id = get_script_or_integration_id(yml_path)
 
             else:  # In case of a json file
                 is_json_file = True
 
             if not is_json_file:
+                # the data of the file is keyed by its id
+                obj_id = next(iter(obj_data))
                 is_used = self.is_id_duplicated(obj_id, obj_data, obj_type)
 
         return is_used
@@ -30,6 +30,12 @@ from demisto_sdk.commands.find_dependencies.find_dependencies import \
 CONTRIBUTORS_LIST = ['partner', 'developer', 'community']
 SUPPORTED_CONTRIBUTORS_LIST = ['partner', 'developer']
 ISO_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+CORE_PACKS_LIST_PATH = 'Tests/Marketplace/core_packs_list.json'
+
+
+def get_core_pack_list():
+    """Fetches the list of the core packs, which are not reported as dependencies, from the content repo"""
+    return tools.get_remote_file(CORE_PACKS_LIST_PATH) or []
 
 
 class PackUniqueFilesValidator(BaseValidator):
@@ -37,10 +43,14 @@ class PackUniqueFilesValidator(BaseValidator):
     Existence and validity of this files is essential."""
 
     def __init__(self, pack, pack_path=None, validate_dependencies=False, ignored_errors=None, print_as_warnings=False,
-                 should_version_raise=False, id_set_path=None):
+                 should_version_raise=False, id_set_path=None, id_set=None, core_pack_list=None,
+                 dependencies_cache=None):
         """Inits the content pack validator with pack's name, pack's path, and unique files to content packs such as:
         secrets whitelist file, pack-ignore file, pack-meta file and readme file
         :param pack: content package name, which is the directory name of the pack
+        :param id_set: an already loaded id set to find the pack dependencies with, instead of loading id_set_path
+        :param core_pack_list: an already fetched core packs list, instead of fetching it from the content repo
+        :param dependencies_cache: the already calculated first level dependencies of packs, shared by validators
         """
         super().__init__(ignored_errors=ignored_errors, print_as_warnings=print_as_warnings)
         self.pack = pack
@@ -53,6 +63,9 @@ class PackUniqueFilesValidator(BaseValidator):
         self._errors = []
         self.should_version_raise = should_version_raise
         self.id_set_path = id_set_path
+        self.id_set = id_set
+        self.core_pack_list = core_pack_list
+        self.dependencies_cache = dependencies_cache
 
     # error handling
     def _add_error(self, error, file_path):
@@ -292,11 +305,13 @@ class PackUniqueFilesValidator(BaseValidator):
     def validate_pack_dependencies(self, id_set_path=None):
         click.secho(f'\n================= Running pack dependencies validation on {self.pack}=================',
                     fg="bright_cyan")
-        core_pack_list = tools.get_remote_file('Tests/Marketplace/core_packs_list.json') or []
+        core_pack_list = self.core_pack_list
+        if core_pack_list is None:
+            core_pack_list = get_core_pack_list()
 
         first_level_dependencies = PackDependencies.find_dependencies(
             self.pack, id_set_path=id_set_path, silent_mode=True, exclude_ignored_dependencies=False,
-            update_pack_metadata=False)
+            update_pack_metadata=False, id_set=self.id_set, dependencies_cache=self.dependencies_cache)
 
         for core_pack in core_pack_list:
             first_level_dependencies.pop(core_pack, None)
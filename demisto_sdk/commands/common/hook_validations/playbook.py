@@ -1,10 +1,11 @@
-from typing import Dict
+from typing import Dict, Set
 
 import click
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.content_entity_validator import \
     ContentEntityValidator
 from demisto_sdk.commands.common.tools import LOG_COLORS
+from demisto_sdk.commands.common.update_id_set import build_tasks_graph
 
 
 class PlaybookValidator(ContentEntityValidator):
@@ -223,21 +224,18 @@ class PlaybookValidator(ContentEntityValidator):
         Return:
             bool. if the Playbook has root is connected to all tasks.
         """
-        start_task_id = self.current_file.get('starttaskid')
-        tasks = self.current_file.get('tasks', {})
-        tasks_bucket = set()
-        next_tasks_bucket = set()
-        for task_id, task in tasks.items():
-            if task_id != start_task_id:
-                tasks_bucket.add(task_id)
-            next_tasks = task.get('nexttasks', {})
-            for next_task_ids in next_tasks.values():
-                if next_task_ids:
-                    next_tasks_bucket.update(next_task_ids)
-        orphan_tasks = tasks_bucket.difference(next_tasks_bucket)
-        if orphan_tasks:
+        tasks = self.current_file.get('tasks') or {}
+        tasks_graph = build_tasks_graph(self.current_file, print_logs=False)
+        unconnected_tasks = set(tasks).difference(tasks_graph.reachable)
+        if unconnected_tasks:
+            next_tasks_bucket: Set[str] = set()
+            for task_id in unconnected_tasks:
+                for next_task_ids in (tasks[task_id].get('nexttasks') or {}).values():
+                    next_tasks_bucket.update(next_task_ids or [])
+            # report the tasks which the unconnected flows start from, or the whole flows if they are cyclic
+            orphan_tasks = unconnected_tasks.difference(next_tasks_bucket) or unconnected_tasks
             error_message, error_code = Errors.playbook_unconnected_tasks(orphan_tasks)
-            if not self.handle_error(error_message, error_code, file_path=self.file_path):
+            if self.handle_error(error_message, error_code, file_path=self.file_path):
                 return False
 
-        return tasks_bucket.issubset(next_tasks_bucket)
+        return True
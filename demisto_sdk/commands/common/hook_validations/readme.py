@@ -1,5 +1,12 @@
+import atexit
+import json
 import os
+import queue
+import threading
+from functools import lru_cache
 from pathlib import Path
+from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired
+from typing import IO, Dict, Optional, Tuple
 
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
@@ -9,6 +16,128 @@ from demisto_sdk.commands.common.tools import (get_content_path, print_warning,
 
 NO_HTML = '<!-- NOT_HTML_DOC -->'
 YES_HTML = '<!-- HTML_DOC -->'
+MDX_PARSE_PATH = Path(__file__).parent.parent / 'mdx-parse.js'
+MDX_NODE_MODULES = ['@mdx-js/mdx', 'fs-extra', 'commander']
+# The seconds to wait for the MDX server to parse a file, before the file is parsed by a node process of its own
+MDX_SERVER_PARSE_TIMEOUT = 60
+
+# The MDX servers by process and content path, so forked processes start servers of their own
+_MDX_SERVERS: Dict[Tuple[int, str], 'MDXServer'] = {}
+
+
+def get_node_env(node_modules_path: Path) -> dict:
+    """Returns the environment variables of the node processes, with the content node modules in the NODE_PATH"""
+    env = os.environ.copy()
+    env['NODE_PATH'] = str(node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
+    return env
+
+
+@lru_cache(maxsize=None)
+def are_mdx_modules_installed(content_path: str) -> bool:
+    """ Check the following once per run:
+        1. npm packages installed - see MDX_NODE_MODULES for specific pack details.
+        2. node interperter exists.
+    Args:
+        content_path: The content repository the node modules are installed in.
+    Returns:
+        bool: True If all req ok else False
+    """
+    missing_module = []
+    valid = True
+    # Check node exist
+    stdout, stderr, exit_code = run_command_os('node -v', cwd=content_path)
+    if exit_code:
+        print_warning(f'There is no node installed on the machine, Test Skipped, error - {stderr}, {stdout}')
+        valid = False
+    else:
+        # Check npm modules exsits
+        for pack in MDX_NODE_MODULES:
+            stdout, stderr, exit_code = run_command_os(f'npm ls {pack}', cwd=content_path)
+            if exit_code:
+                missing_module.append(pack)
+    if missing_module:
+        valid = False
+        print_warning(f"The npm modules: {missing_module} are not installed, Test Skipped, use "
+                      f"'npm install <module>' to install all required node dependencies")
+    return valid
+
+
+class MDXServer:
+    """A node process which parses README files with mdx-parse.js in server mode, so all the README files of a run
+    are parsed by a single node process instead of a node process per file.
+
+    Attributes:
+        process (Popen): The node process, which reads the files to parse from its stdin and writes the results to
+            its stdout, one JSON line per file.
+        parse_timeout (float): The seconds to wait for the result of a file.
+    """
+
+    def __init__(self, content_path: str, node_modules_path: Path, mdx_parse_path: Path = MDX_PARSE_PATH,
+                 parse_timeout: float = MDX_SERVER_PARSE_TIMEOUT):
+        self.process = Popen(['node', str(mdx_parse_path), '--server'], cwd=content_path,
+                             env=get_node_env(node_modules_path), stdin=PIPE, stdout=PIPE, stderr=DEVNULL,
+                             universal_newlines=True)
+        if self.process.stdin is None or self.process.stdout is None:
+            raise OSError('The pipes of the MDX server were not opened')
+        self._stdin: IO[str] = self.process.stdin
+        self._stdout: IO[str] = self.process.stdout
+        self.parse_timeout = parse_timeout
+        # The results are read by a thread of their own, so a hung server does not block the validation
+        self._responses: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self):
+        """Reads the server results until it exits, which is marked by an empty result."""
+        for response in iter(self._stdout.readline, ''):
+            self._responses.put(response)
+        self._responses.put('')
+
+    def parse(self, file_path) -> Optional[str]:
+        """Parses an MDX file.
+
+        Args:
+            file_path: The path of the file, relative to the content path or absolute.
+
+        Returns:
+            str. The parse error as mdx-parse.js prints it for a single file, or None if the file was parsed.
+
+        Raises:
+            OSError: if the server is not running, or did not parse the file within the parse timeout.
+            ValueError: if the server response could not be read.
+        """
+        self._stdin.write(f'{json.dumps({"file": str(file_path)})}\n')
+        self._stdin.flush()
+        try:
+            response = self._responses.get(timeout=self.parse_timeout)
+        except queue.Empty:
+            raise TimeoutError(f'The MDX server did not parse {file_path} within {self.parse_timeout} seconds')
+        if not response:
+            raise OSError(f'The MDX server exited with code {self.process.wait()}')
+
+        return json.loads(response)['error']
+
+    def stop(self):
+        """Stops the server, which exits once its stdin is closed."""
+        try:
+            self._stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, TimeoutExpired):
+            self.process.kill()
+
+
+def get_mdx_server(content_path: str, node_modules_path: Path) -> MDXServer:
+    """Returns the MDX server of this process, starting it on the first call."""
+    server_key = (os.getpid(), str(content_path))
+    if server_key not in _MDX_SERVERS:
+        _MDX_SERVERS[server_key] = MDXServer(content_path, node_modules_path)
+    return _MDX_SERVERS[server_key]
+
+
+@atexit.register
+def stop_mdx_servers():
+    """Stops the MDX servers of this process."""
+    for server_key in [server_key for server_key in _MDX_SERVERS if server_key[0] == os.getpid()]:
+        _MDX_SERVERS.pop(server_key).stop()
 
 
 class ReadMeValidator(BaseValidator):
@@ -44,44 +173,38 @@ class ReadMeValidator(BaseValidator):
         html = self.is_html_doc()
         valid = self.are_modules_installed_for_verify()
         if valid and not html:
-            mdx_parse = Path(__file__).parent.parent / 'mdx-parse.js'
-            # add to env var the directory of node modules
-            os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
-            # run the java script mdx parse validator
-            _, stderr, is_valid = run_command_os(f'node {mdx_parse} -f {self.file_path}', cwd=self.content_path, env=os.environ)
-            if is_valid:
-                error_message, error_code = Errors.readme_error(stderr)
+            parse_error = self.parse_mdx()
+            if parse_error is not None:
+                error_message, error_code = Errors.readme_error(parse_error)
                 if self.handle_error(error_message, error_code, file_path=self.file_path):
                     return False
 
         return True
 
+    def parse_mdx(self) -> Optional[str]:
+        """Parses the readme file with the MDX server of this run. If the server fails, the file is parsed by a
+        node process of its own, and a new server is started for the next file.
+        Returns:
+            str: The parse error, or None if the file was parsed.
+        """
+        server_key = (os.getpid(), str(self.content_path))
+        try:
+            return get_mdx_server(self.content_path, self.node_modules_path).parse(self.file_path)
+        except (OSError, ValueError):
+            if server_key in _MDX_SERVERS:
+                _MDX_SERVERS.pop(server_key).stop()
+
+        # run the java script mdx parse validator
+        _, stderr, exit_code = run_command_os(f'node {MDX_PARSE_PATH} -f {self.file_path}', cwd=self.content_path,
+                                              env=get_node_env(self.node_modules_path))
+        return stderr if exit_code else None
+
     def are_modules_installed_for_verify(self) -> bool:
-        """ Check the following:
-            1. npm packages installed - see packs var for specific pack details.
-            2. node interperter exists.
+        """ Check that node and the npm packages required for the verification are installed, once per run.
         Returns:
             bool: True If all req ok else False
         """
-        missing_module = []
-        valid = True
-        # Check node exist
-        stdout, stderr, exit_code = run_command_os('node -v', cwd=self.content_path)
-        if exit_code:
-            print_warning(f'There is no node installed on the machine, Test Skipped, error - {stderr}, {stdout}')
-            valid = False
-        else:
-            # Check npm modules exsits
-            packs = ['@mdx-js/mdx', 'fs-extra', 'commander']
-            for pack in packs:
-                stdout, stderr, exit_code = run_command_os(f'npm ls {pack}', cwd=self.content_path)
-                if exit_code:
-                    missing_module.append(pack)
-        if missing_module:
-            valid = False
-            print_warning(f"The npm modules: {missing_module} are not installed, Test Skipped, use "
-                          f"'npm install <module>' to install all required node dependencies")
-        return valid
+        return are_mdx_modules_installed(self.content_path)
 
     def is_html_doc(self) -> bool:
         txt = ''
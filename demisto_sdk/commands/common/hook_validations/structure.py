@@ -5,9 +5,10 @@ Module contains validation of schemas, ids and paths.
 import json
 import logging
 import os
-import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 
+import pykwalify
 import yaml
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -16,13 +17,63 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import (checked_type,
+from demisto_sdk.commands.common.tools import (GITHUB_FALLBACK_ENV_VAR,
+                                               RegexTable, checked_type,
                                                get_content_file_type_dump,
-                                               get_matching_regex,
-                                               get_remote_file)
+                                               get_remote_file, print_warning)
 from demisto_sdk.commands.format.format_constants import \
     OLD_FILE_DEFAULT_1_FROMVERSION
+from pykwalify.compat import yaml as pykwalify_yaml
 from pykwalify.core import Core
+from pykwalify.rule import Rule
+
+SCHEMAS_DIR = os.path.normpath(os.path.join(__file__, '..', '..', 'schemas'))
+
+SCHEMA_REGEX_TABLE = RegexTable(SCHEMA_TO_REGEX)
+FILE_TYPES_PATHS_REGEX_TABLE = RegexTable(FILE_TYPES_PATHS_TO_VALIDATE)
+
+
+class CompiledSchema(NamedTuple):
+    """A schema file with its pykwalify rules, built once per process."""
+    schema: dict
+    root_rule: Rule
+    partial_rules: Dict[str, Rule]
+
+
+@lru_cache(maxsize=None)
+def get_compiled_schema(scheme_name: FileType) -> CompiledSchema:
+    """Loads the schema of a file type and builds its pykwalify rules, once per file type.
+
+    Args:
+        scheme_name: the file type to get the schema of.
+
+    Returns:
+        CompiledSchema. The schema and its rules.
+    """
+    scheme_file_name = 'integration' if scheme_name == FileType.BETA_INTEGRATION else scheme_name.value
+    with open(os.path.join(SCHEMAS_DIR, f'{scheme_file_name}.yml'), 'r') as schema_file:
+        schema = pykwalify_yaml.safe_load(schema_file)
+
+    partial_rules = {key.split(';', 1)[1]: Rule(schema=value) for key, value in schema.items()
+                     if key.startswith('schema;')}
+    root_rule = Rule(schema={key: value for key, value in schema.items() if not key.startswith('schema;')})
+    return CompiledSchema(schema=schema, root_rule=root_rule, partial_rules=partial_rules)
+
+
+class CompiledSchemaCore(Core):
+    """A pykwalify Core which validates a file or already loaded data with the rules of a compiled schema, instead of
+    loading the schema file and building its rules for every validation."""
+
+    def __init__(self, compiled_schema: CompiledSchema, source_file=None, source_data=None):
+        super().__init__(source_file=source_file, source_data=source_data, schema_data=compiled_schema.schema)
+        self.compiled_schema = compiled_schema
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # the partial schemas are looked up by name during the validation, and may differ between schemas
+        pykwalify.partial_schemas.update(self.compiled_schema.partial_rules)
+        self.root_rule = self.compiled_schema.root_rule
+        self._validate(value, self.root_rule, '', [])
 
 
 class StructureValidator(BaseValidator):
@@ -62,9 +113,27 @@ class StructureValidator(BaseValidator):
         if is_new_file or predefined_scheme:
             self.old_file = {}
         else:
-            self.old_file = get_remote_file(old_file_path if old_file_path else file_path, tag=tag)
+            self.old_file = self.get_old_file(old_file_path if old_file_path else file_path, tag)
         self.configuration = configuration
 
+    @staticmethod
+    def get_old_file(old_file_path, tag):
+        # type: (str, str) -> dict
+        """Reads the old version of a modified file, which the backward compatibility checks compare it to, from the
+        local git repository - or from GitHub if the DEMISTO_SDK_GITHUB_FALLBACK environment variable is set.
+
+        Returns:
+            (dict): The old version of the file, or an empty dict if it is not found
+        """
+        github_fallback = bool(os.environ.get(GITHUB_FALLBACK_ENV_VAR))
+        old_file = get_remote_file(old_file_path, tag=tag, github_fallback=github_fallback)
+        if not old_file and old_file_path.endswith(('.yml', '.json')):
+            print_warning(f'Could not find the old entity file "{old_file_path}" under "{tag}".\n'
+                          'please make sure that you did not break backward compatibility.' +
+                          ('' if github_fallback else
+                           f' Set the {GITHUB_FALLBACK_ENV_VAR} environment variable to fetch it from GitHub.'))
+        return old_file
+
     def is_valid_file(self):
         # type: () -> bool
         """Checks if given file is valid
@@ -95,9 +164,9 @@ class StructureValidator(BaseValidator):
             (str): Type of file by scheme name
         """
 
-        for scheme_name, regex_list in SCHEMA_TO_REGEX.items():
-            if get_matching_regex(self.file_path, regex_list):
-                return scheme_name
+        scheme_name = SCHEMA_REGEX_TABLE.match(self.file_path)
+        if scheme_name:
+            return scheme_name
 
         pretty_formatted_string_of_regexes = json.dumps(SCHEMA_TO_REGEX, indent=4, sort_keys=True)
 
@@ -122,11 +191,12 @@ class StructureValidator(BaseValidator):
             # disabling massages of level INFO and beneath of pykwalify such as: INFO:pykwalify.core:validation.valid
             log = logging.getLogger('pykwalify.core')
             log.setLevel(logging.WARNING)
-            scheme_file_name = 'integration' if self.scheme_name.value == 'betaintegration' else self.scheme_name.value
-            path = os.path.normpath(
-                os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
+            compiled_schema = get_compiled_schema(self.scheme_name)
+            if self.file_path.endswith('.json'):
+                core = CompiledSchemaCore(compiled_schema, source_data=self.current_file)
+            else:
+                # pykwalify loads yml files as YAML 1.2, which differs from self.current_file, e.g. in yes/no keys
+                core = CompiledSchemaCore(compiled_schema, source_file=self.file_path)
             core.validate(raise_exception=True)
         except Exception as err:
             try:
@@ -270,11 +340,7 @@ class StructureValidator(BaseValidator):
                 return self.scheme_name
             return self.scheme_name.value
 
-        for file_type, regexes in FILE_TYPES_PATHS_TO_VALIDATE.items():
-            for regex in regexes:
-                if re.search(regex, self.file_path, re.IGNORECASE):
-                    return file_type
-        return None
+        return FILE_TYPES_PATHS_REGEX_TABLE.match(self.file_path)
 
     def is_valid_file_path(self):
         """Returns is valid filepath exists.
@@ -0,0 +1,104 @@
+import json
+from typing import Callable, Dict, Iterable, List, Optional
+
+from demisto_sdk.commands.common.update_id_set import (IDSetEntry,
+                                                       build_id_set_index)
+
+# The prefixes and suffixes which are added to an item name to form its id, e.g. incident fields ids.
+ID_ALIAS_FORMATS = ['{}', 'incident_{}', 'indicator_{}', '{}-mapper']
+
+
+class IdSetSection(list):
+    """A section of the id_set - a list of single key {id: data} dicts, with lazily built lookup indexes.
+
+    The indexes are built on the first query and are not updated, the section should not be changed after it
+    was queried.
+    """
+
+    def __init__(self, items: Iterable[dict] = ()):
+        super().__init__(items)
+        self._indexes: Dict[str, Dict[str, List[dict]]] = {}
+
+    @classmethod
+    def of(cls, items: Iterable[dict]) -> 'IdSetSection':
+        """Returns the given items as an IdSetSection, without copying them if they already are one."""
+        return items if isinstance(items, cls) else cls(items)
+
+    def _get_index(self, index_name: str, get_keys: Callable[[str, dict], Iterable]) -> Dict[str, List[dict]]:
+        """Returns the index of the section items by the keys which get_keys returns for every item."""
+        if index_name not in self._indexes:
+            index: Dict[str, List[dict]] = {}
+            for item in self:
+                item_id, item_data = next(iter(item.items()))
+                for key in dict.fromkeys(get_keys(item_id, item_data)):
+                    index.setdefault(key, []).append(item)
+            self._indexes[index_name] = index
+
+        return self._indexes[index_name]
+
+    def build_indexes(self):
+        """Builds the id index of the section ahead of the first query."""
+        self._get_index('id', lambda item_id, _: [item_id])
+
+    def get_by_id(self, item_id: str) -> List[dict]:
+        return self._get_index('id', lambda item_id, _: [item_id]).get(item_id, [])
+
+    def get_by_name(self, name: str) -> List[dict]:
+        return self._get_index('name', lambda _, data: [data.get('name', '')]).get(name, [])
+
+    def get_by_pack(self, pack: str) -> List[dict]:
+        return self._get_index('pack', lambda _, data: [data.get('pack')]).get(pack, [])
+
+    def get_by_command(self, command: str) -> List[dict]:
+        return self._get_index('command', lambda _, data: data.get('commands', [])).get(command, [])
+
+    def get_by_name_or_id_alias(self, name: str) -> List[dict]:
+        """Returns the items which are named by the given name, or which id is the name or one of its aliases."""
+        items = [item for alias_format in ID_ALIAS_FORMATS for item in self.get_by_id(alias_format.format(name))]
+        items.extend(self.get_by_name(name))
+        return list({id(item): item for item in items}.values())
+
+
+class IdSet(dict):
+    """The id_set, loaded once and queried through the indexes of its sections.
+
+    It is a dict of IdSetSection lists, so it is serialized to the same JSON as the id_set file.
+    """
+
+    def __init__(self, id_set: Optional[dict] = None):
+        super().__init__((section, IdSetSection.of(items) if isinstance(items, list) else items)
+                         for section, items in (id_set or {}).items())
+        self._entries_index: Optional[Dict[str, List[IDSetEntry]]] = None
+
+    @classmethod
+    def of(cls, id_set: dict) -> 'IdSet':
+        """Returns the given id_set as an IdSet, without copying it if it already is one."""
+        return id_set if isinstance(id_set, cls) else cls(id_set)
+
+    @classmethod
+    def load(cls, id_set_path: str) -> 'IdSet':
+        with open(id_set_path, 'r') as id_set_file:
+            return cls(json.load(id_set_file))
+
+    def save(self, id_set_path: str):
+        with open(id_set_path, 'w') as id_set_file:
+            json.dump(self, id_set_file, indent=4)
+
+    def get_section(self, section: str) -> IdSetSection:
+        """Returns the given section, or an empty section if it does not exist in the id_set."""
+        return self.get(section) or IdSetSection()
+
+    def build_indexes(self):
+        """Builds the id indexes of the id_set and of its sections ahead of the first query, e.g. when the id_set is
+        loaded for validating many files."""
+        for section in self.values():
+            if isinstance(section, IdSetSection):
+                section.build_indexes()
+        if self._entries_index is None:
+            self._entries_index = build_id_set_index(self)
+
+    def get_entries(self, item_id: str) -> List[IDSetEntry]:
+        """Returns the entries of the given id from all the id_set sections, with their parsed version range."""
+        if self._entries_index is None:
+            self._entries_index = build_id_set_index(self)
+        return self._entries_index.get(item_id, [])
@@ -1,18 +1,51 @@
 const cli = require('commander');
 const {readFile} = require('fs-extra');
 const mdx = require('@mdx-js/mdx');
+const readline = require('readline');
+const util = require('util');
 
 cli.version('0.1.0')
-cli.requiredOption("-f --file <mdx file to parse>")
+cli.option("-f --file <mdx file to parse>")
+cli.option("-s --server", "parse the files given as JSON lines of the form {\"file\": <mdx file to parse>} in the " +
+    "standard input, writing a JSON line of the form {\"file\": <mdx file>, \"error\": <parse error or null>} " +
+    "to the standard output for each of them")
 cli.parse(process.argv)
 
 async function parseMDX(file) {
     const contents = await readFile(file, 'utf8');
-    parsed = await mdx(contents)
-    console.log(`${parsed}`)
+    return await mdx(contents)
 }
 
-parseMDX(cli.file).catch((reason) => {
-    console.error(reason)
+function runServer() {
+    const lines = readline.createInterface({input: process.stdin, terminal: false})
+    // the files are parsed one at a time, so the results are written in the order of the requests
+    let parsing = Promise.resolve()
+    lines.on('line', (line) => {
+        parsing = parsing.then(async () => {
+            let file = null
+            let error = null
+            try {
+                file = JSON.parse(line).file
+                await parseMDX(file)
+            } catch (reason) {
+                // the error as it is printed by console.error when parsing a single file
+                error = `${util.format(reason)}\n`
+            }
+            process.stdout.write(`${JSON.stringify({file: file, error: error})}\n`)
+        })
+    })
+}
+
+if (cli.server) {
+    runServer()
+} else if (cli.file) {
+    parseMDX(cli.file).then((parsed) => {
+        console.log(`${parsed}`)
+    }).catch((reason) => {
+        console.error(reason)
+        process.exit(1)
+    })
+} else {
+    console.error("error: one of the options '-f --file <mdx file to parse>' or '-s --server' is required")
     process.exit(1)
-})
+}
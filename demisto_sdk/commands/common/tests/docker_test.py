@@ -1,9 +1,11 @@
 import os
+from datetime import timedelta
 from unittest.mock import patch
 
 import mock
 import pytest
 from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.hook_validations import docker
 from demisto_sdk.commands.common.hook_validations.docker import \
     DockerImageValidator
 from demisto_sdk.commands.common.tools import get_yaml
@@ -309,3 +311,70 @@ def test_is_docker_image_latest_tag_without_tag():
         assert docker_image_validator.is_docker_image_latest_tag() is False
         assert docker_image_validator.is_latest_tag is False
         assert docker_image_validator.is_docker_image_valid() is False
+
+
+STAND_IN_REGISTRY = 'http://localhost:5000'
+
+
+@pytest.fixture
+def stand_in_registry(monkeypatch, requests_mock):
+    """A local registry the docker image tags are fetched from, which does not require authentication"""
+    monkeypatch.setenv(docker.DOCKER_REGISTRY_ENV_VAR, STAND_IN_REGISTRY)
+    requests_mock.get(f'{STAND_IN_REGISTRY}/v2/', json={})
+    for image, tags in [('python3', ['3.8.5.100', '3.8.6.200', 'latest']), ('pyjwt', ['1.0', '1.0.0.300'])]:
+        requests_mock.get(f'{STAND_IN_REGISTRY}/v2/demisto/{image}/tags/list', json={'tags': tags})
+    return requests_mock
+
+
+def get_tags_requests(registry_mock):
+    return [request.path for request in registry_mock.request_history if request.path.endswith('/tags/list')]
+
+
+def test_get_latest_tag_from_registry_cache(stand_in_registry, mocker):
+    """
+    Given
+    - A registry with the tags of the demisto/python3 docker image.
+
+    When
+    - Getting the latest tag of the image several times, also from another process and after the cache expired.
+
+    Then
+    - Ensure the latest tag is fetched from the configured registry.
+    - Ensure the tag is fetched once per cache TTL, from the cache on disk in other processes.
+    """
+    assert DockerImageValidator.get_latest_tag_from_registry('demisto/python3') == '3.8.6.200'
+    assert DockerImageValidator.get_latest_tag_from_registry('demisto/python3') == '3.8.6.200'
+    assert get_tags_requests(stand_in_registry) == ['/v2/demisto/python3/tags/list']
+
+    # a new process loads the tags from the disk
+    mocker.patch.dict(docker._DOCKER_TAGS_CACHES, clear=True)
+    assert DockerImageValidator.get_latest_tag_from_registry('demisto/python3') == '3.8.6.200'
+    assert len(get_tags_requests(stand_in_registry)) == 1
+
+    mocker.patch.object(docker, 'DOCKER_TAGS_CACHE_TTL', timedelta(0))
+    assert DockerImageValidator.get_latest_tag_from_registry('demisto/python3') == '3.8.6.200'
+    assert len(get_tags_requests(stand_in_registry)) == 2
+
+
+def test_prefetch_latest_tags(stand_in_registry):
+    """
+    Given
+    - A registry with the tags of several docker images.
+
+    When
+    - Prefetching the latest tags of the images, and then validating a file which uses one of them.
+
+    Then
+    - Ensure the tag of every image is fetched once.
+    - Ensure the validation uses the prefetched tag.
+    - Ensure images which failed to be fetched are ignored.
+    """
+    DockerImageValidator.prefetch_latest_tags(['demisto/python3', 'demisto/pyjwt', 'demisto/pyjwt', 'demisto/missing'])
+
+    assert sorted(get_tags_requests(stand_in_registry)) == ['/v2/demisto/missing/tags/list',
+                                                            '/v2/demisto/pyjwt/tags/list',
+                                                            '/v2/demisto/python3/tags/list']
+
+    docker_image_validator = DockerImageValidator(TEST_INTEGRATION_FILE, is_modified_file=True, is_integration=True)
+    assert docker_image_validator.docker_image_latest_tag == '1.0.0.300'
+    assert len(get_tags_requests(stand_in_registry)) == 3
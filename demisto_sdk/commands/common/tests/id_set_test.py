@@ -0,0 +1,112 @@
+import json
+import os
+
+import pytest
+from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.id_set import IdSet, IdSetSection
+
+ID_SET_PATH = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', 'id_set', 'id_set.json')
+
+
+@pytest.fixture(scope='module')
+def id_set():
+    return IdSet.load(ID_SET_PATH)
+
+
+class TestIdSetSection:
+    SECTION = [
+        {'incident_city': {'name': 'City', 'pack': 'CommonTypes'}},
+        {'ip': {'name': 'ip', 'pack': 'CommonScripts', 'commands': ['ip', 'ip']}},
+        {'Mapper-mapper': {'name': 'Mapper', 'pack': 'Mappers'}},
+        {'no_pack': {'name': 'ip', 'commands': ['ip', 'domain']}},
+    ]
+
+    def test_lookups(self):
+        """
+        Given
+            - An id_set section
+
+        When
+            - querying the section indexes
+
+        Then
+            - Ensure every query returns the matching items in the section order, once per item
+        """
+        section = IdSetSection(self.SECTION)
+
+        assert section.get_by_id('ip') == [self.SECTION[1]]
+        assert section.get_by_name('ip') == [self.SECTION[1], self.SECTION[3]]
+        assert section.get_by_pack('CommonTypes') == [self.SECTION[0]]
+        assert section.get_by_command('ip') == [self.SECTION[1], self.SECTION[3]]
+        assert section.get_by_command('domain') == [self.SECTION[3]]
+        assert section.get_by_id('missing') == []
+
+    @pytest.mark.parametrize('name, expected_ids', [
+        ('city', ['incident_city']),
+        ('City', ['incident_city']),
+        ('Mapper', ['Mapper-mapper']),
+        ('missing', []),
+    ])
+    def test_get_by_name_or_id_alias(self, name, expected_ids):
+        """
+        Given
+            - An id_set section with incident fields and mappers ids
+
+        When
+            - searching an item by its name or by its id without the incident_/indicator_/-mapper alias
+
+        Then
+            - Ensure the matching items are found once
+        """
+        section = IdSetSection(self.SECTION)
+
+        assert [next(iter(item)) for item in section.get_by_name_or_id_alias(name)] == expected_ids
+
+    def test_of(self):
+        section = IdSetSection(self.SECTION)
+
+        assert IdSetSection.of(section) is section
+        assert IdSetSection.of(self.SECTION) == self.SECTION
+
+
+class TestIdSet:
+    def test_serialization(self, id_set, tmp_path):
+        """
+        Given
+            - An id_set file
+
+        When
+            - loading it as an IdSet and saving it
+
+        Then
+            - Ensure the IdSet sections are indexed and it is serialized to the original JSON
+        """
+        with open(ID_SET_PATH) as id_set_file:
+            id_set_dict = json.load(id_set_file)
+        output_path = str(tmp_path / 'id_set.json')
+
+        id_set.save(output_path)
+
+        assert isinstance(id_set['scripts'], IdSetSection)
+        assert json.dumps(id_set, indent=4) == json.dumps(id_set_dict, indent=4)
+        with open(output_path) as output_file:
+            assert json.load(output_file) == id_set_dict
+
+    def test_get_entries(self, id_set):
+        """
+        Given
+            - An IdSet
+
+        When
+            - getting the entries of a script id
+
+        Then
+            - Ensure the script entry is found with its section and versions
+        """
+        script_id = next(iter(id_set['scripts'][0]))
+
+        entries = id_set.get_entries(script_id)
+
+        assert [entry.section for entry in entries] == ['scripts']
+        assert IdSet.of(id_set) is id_set
+        assert id_set.get_section('missing') == []
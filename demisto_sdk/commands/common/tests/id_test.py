@@ -1,5 +1,12 @@
+import json
+
+from demisto_sdk.commands.common import update_id_set
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common.hook_validations import id as id_validator
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.tools import get_yaml
+from TestSuite.test_tools import ChangeCWD
 
 CONFIG = Configuration()
 
@@ -159,3 +166,58 @@ def test_duplicated_id_with_diff_versioning():
     }
     assert validator.is_id_duplicated(obj_id="test", obj_data=obj_data, obj_type="testing_set"), \
         "The id validator couldn't find id as duplicated one(In different sets)"
+
+
+def test_load_id_set_builds_indexes(mocker, tmp_path):
+    """
+    Given
+    - An id_set file.
+
+    When
+    - Loading the id_set for validating files.
+
+    Then
+    - Ensure the id indexes of the id_set and of its sections are built when it is loaded.
+    """
+    id_set_path = tmp_path / 'id_set.json'
+    id_set_path.write_text(json.dumps({'scripts': [{'test': {'name': 'test'}}], 'playbooks': []}))
+    mocker.patch.object(IDSetValidator, 'ID_SET_PATH', str(id_set_path))
+    validator = IDSetValidator(is_circle=False, is_test_run=True, configuration=CONFIG)
+
+    id_set = validator.load_id_set()
+
+    assert id_set._entries_index is not None
+    assert all('id' in section._indexes for section in id_set.values())
+    assert id_set.get_section('scripts').get_by_id('test') == [{'test': {'name': 'test'}}]
+
+
+def test_file_data_extracted_once_from_loaded_content(mocker, repo):
+    """
+    Given
+    - A new integration which is registered in the id_set, and its loaded content.
+
+    When
+    - Validating the integration registration in the id_set, and that its id is not used by another entity.
+
+    Then
+    - Ensure the integration is valid in the id_set and its id is not duplicated.
+    - Ensure the id_set data of the integration is extracted once, from the loaded content.
+    """
+    pack = repo.create_pack('Pack')
+    integration = pack.create_integration('Integration')
+    integration.create_default_integration()
+    with ChangeCWD(repo.path):
+        integration_path = 'Packs/Pack/Integrations/Integration/Integration.yml'
+        integration_content = get_yaml(integration_path)
+        integration_data = update_id_set.get_integration_data(integration_path)
+        validator = IDSetValidator(is_circle=True, is_test_run=True, configuration=CONFIG)
+        validator.id_set = IdSet({'integrations': [integration_data], 'scripts': []})
+        validator.integration_set = validator.id_set['integrations']
+        get_integration_data = mocker.spy(id_validator, 'get_integration_data')
+        parse_content_file = mocker.spy(update_id_set, 'parse_content_file')
+
+        assert validator.is_file_valid_in_set(integration_path, integration_content)
+        assert not validator.is_file_has_used_id(integration_path, integration_content)
+
+    assert get_integration_data.call_count == 1
+    assert parse_content_file.call_count == 0
@@ -171,6 +171,12 @@ class TestPlaybookValidator:
                                     '2': {'type': 'condition', 'nexttasks': {'next': ['3']}},
                                     '3': {'type': 'condition'}}
                                 }
+    NEXT_TASKS_UNCONNECTED_CYCLE = {"id": "Intezer - scan host", "version": -1, "starttaskid": "1",
+                                    "tasks": {
+                                        '1': {'type': 'title'},
+                                        '2': {'type': 'condition', 'nexttasks': {'next': ['3']}},
+                                        '3': {'type': 'condition', 'nexttasks': {'next': ['2']}}}
+                                    }
     IS_ROOT_CONNECTED_INPUTS = [
         (TASKS_NOT_EXIST, True),
         (NEXT_TASKS_NOT_EXIST_1, True),
@@ -179,6 +185,7 @@ class TestPlaybookValidator:
         (NEXT_TASKS_INVALID_EXIST_2, False),
         (NEXT_TASKS_VALID_EXIST_1, True),
         (NEXT_TASKS_VALID_EXIST_2, True),
+        (NEXT_TASKS_UNCONNECTED_CYCLE, False),
     ]
 
     @pytest.mark.parametrize("playbook_json, expected_result", IS_NO_ROLENAME_INPUTS)
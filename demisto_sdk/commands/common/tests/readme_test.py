@@ -1,8 +1,12 @@
 import os
+import shutil
 
 import pytest
 from demisto_sdk.commands.common.git_tools import git_path
-from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+from demisto_sdk.commands.common.hook_validations import readme
+from demisto_sdk.commands.common.hook_validations.readme import (
+    MDXServer, ReadMeValidator, are_mdx_modules_installed)
+from demisto_sdk.commands.common.tools import run_command_os
 
 VALID_MD = f'{git_path()}/demisto_sdk/tests/test_files/README-valid.md'
 INVALID_MD = f'{git_path()}/demisto_sdk/tests/test_files/README-invalid.md'
@@ -12,6 +16,21 @@ README_INPUTS = [
     (INVALID_MD, False),
 ]
 
+# A stand-in for mdx-parse.js in server mode, which fails to parse files containing 'invalid'
+MDX_SERVER_STAND_IN = '''
+const fs = require('fs');
+require('readline').createInterface({input: process.stdin}).on('line', (line) => {
+    const file = JSON.parse(line).file;
+    const error = fs.readFileSync(file, 'utf8').includes('invalid') ? `Error: could not parse ${file}\\n` : null;
+    process.stdout.write(`${JSON.stringify({file: file, error: error})}\\n`);
+});
+'''
+
+# A stand-in for a hung mdx-parse.js in server mode, which never responds
+MDX_SERVER_HUNG_STAND_IN = '''
+require('readline').createInterface({input: process.stdin}).on('line', () => {});
+'''
+
 
 @pytest.mark.parametrize("current, answer", README_INPUTS)
 def test_is_file_valid(current, answer):
@@ -20,3 +39,142 @@ def test_is_file_valid(current, answer):
     env_var = os.environ.get('DEMISTO_README_VALIDATION')
     if valid and env_var:
         assert readme_validator.is_valid_file() is answer
+
+
+@pytest.fixture
+def content_path(mocker):
+    mocker.patch.object(readme, 'get_content_path', return_value=git_path())
+
+
+def test_mdx_server_results_same_as_single_file(content_path):
+    """
+    Given
+    - A valid and an invalid README file.
+
+    When
+    - Parsing them with mdx-parse.js in server mode, and with a node process per file.
+
+    Then
+    - Ensure the server parse errors are the same as the errors of the single file parse.
+    """
+    readme_validator = ReadMeValidator(VALID_MD)
+    if not readme_validator.are_modules_installed_for_verify():
+        pytest.skip('The MDX node modules are not installed')
+
+    server = MDXServer(readme_validator.content_path, readme_validator.node_modules_path)
+    try:
+        for file_path in [VALID_MD, INVALID_MD, VALID_MD]:
+            _, stderr, exit_code = run_command_os(f'node {readme.MDX_PARSE_PATH} -f {file_path}',
+                                                  cwd=readme_validator.content_path,
+                                                  env=readme.get_node_env(readme_validator.node_modules_path))
+            assert server.parse(file_path) == (stderr if exit_code else None)
+    finally:
+        server.stop()
+
+
+def test_mdx_server(tmp_path):
+    """
+    Given
+    - A node process which parses README files in server mode.
+
+    When
+    - Parsing several README files with it, and stopping it.
+
+    Then
+    - Ensure the parse result of every file is returned, by a single node process.
+    - Ensure the node process exits when it is stopped.
+    """
+    if not shutil.which('node'):
+        pytest.skip('node is not installed')
+
+    mdx_parse_path = tmp_path / 'mdx-server.js'
+    mdx_parse_path.write_text(MDX_SERVER_STAND_IN)
+    valid_md, invalid_md = tmp_path / 'README-valid.md', tmp_path / 'README-invalid.md'
+    valid_md.write_text('## valid')
+    invalid_md.write_text('## invalid')
+
+    server = MDXServer(str(tmp_path), tmp_path / 'node_modules', mdx_parse_path=mdx_parse_path)
+    assert server.parse(valid_md) is None
+    assert server.parse('README-invalid.md') == 'Error: could not parse README-invalid.md\n'
+    assert server.parse(valid_md) is None
+    server.stop()
+
+    assert server.process.returncode == 0
+    with pytest.raises((OSError, ValueError)):
+        server.parse(valid_md)
+
+
+def test_mdx_server_parse_timeout(tmp_path):
+    """
+    Given
+    - A node process which parses README files in server mode, and hangs.
+
+    When
+    - Parsing a README file with it.
+
+    Then
+    - Ensure the parse fails with an OSError once the parse timeout passes, so the file is parsed by a node process
+      of its own.
+    """
+    if not shutil.which('node'):
+        pytest.skip('node is not installed')
+
+    mdx_parse_path = tmp_path / 'mdx-server.js'
+    mdx_parse_path.write_text(MDX_SERVER_HUNG_STAND_IN)
+    valid_md = tmp_path / 'README.md'
+    valid_md.write_text('## valid')
+
+    server = MDXServer(str(tmp_path), tmp_path / 'node_modules', mdx_parse_path=mdx_parse_path, parse_timeout=0.5)
+    try:
+        with pytest.raises(OSError, match='did not parse'):
+            server.parse(valid_md)
+    finally:
+        server.stop()
+
+
+def test_parse_mdx_server_failure(mocker, content_path):
+    """
+    Given
+    - An MDX server which exited.
+
+    When
+    - Validating a README file.
+
+    Then
+    - Ensure the file is parsed by a node process of its own and its error is returned.
+    - Ensure a new server is started for the next file.
+    """
+    server = mocker.Mock(spec=MDXServer)
+    server.parse.side_effect = OSError('The MDX server exited with code 1')
+    mocker.patch.object(readme, 'MDXServer', return_value=server)
+    run_command = mocker.patch.object(readme, 'run_command_os', return_value=('', 'Error: could not parse', 1))
+    readme_validator = ReadMeValidator(INVALID_MD)
+
+    assert readme_validator.parse_mdx() == 'Error: could not parse'
+    assert run_command.call_args[0][0] == f'node {readme.MDX_PARSE_PATH} -f {INVALID_MD}'
+    server.stop.assert_called_once()
+
+    readme_validator.parse_mdx()
+    assert readme.MDXServer.call_count == 2
+
+
+def test_are_modules_installed_for_verify_once(mocker, content_path):
+    """
+    Given
+    - Several README files.
+
+    When
+    - Checking that node and the MDX node modules are installed for each of them.
+
+    Then
+    - Ensure the node environment is checked once.
+    """
+    run_command = mocker.patch.object(readme, 'run_command_os', return_value=('', '', 0))
+    are_mdx_modules_installed.cache_clear()
+    try:
+        for file_path in [VALID_MD, INVALID_MD, VALID_MD]:
+            assert ReadMeValidator(file_path).are_modules_installed_for_verify()
+    finally:
+        are_mdx_modules_installed.cache_clear()
+
+    assert run_command.call_count == 1 + len(readme.MDX_NODE_MODULES)
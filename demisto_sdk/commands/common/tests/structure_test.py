@@ -1,3 +1,4 @@
+import json
 import os
 from os.path import isfile
 from shutil import copyfile
@@ -5,10 +6,11 @@ from typing import List, Tuple
 
 import pytest
 import yaml
+from demisto_sdk.commands.common.constants import FileType
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.hook_validations.structure import \
-    StructureValidator
+from demisto_sdk.commands.common.hook_validations.structure import (
+    SCHEMAS_DIR, CompiledSchemaCore, StructureValidator, get_compiled_schema)
 from demisto_sdk.tests.constants_test import (
     DASHBOARD_TARGET, DIR_LIST, INCIDENT_FIELD_TARGET,
     INDICATORFIELD_EXACT_SCHEME, INDICATORFIELD_EXTRA_FIELDS,
@@ -25,6 +27,8 @@ from demisto_sdk.tests.constants_test import (
     VALID_PLAYBOOK_ARCSIGHT_ADD_DOMAIN_PATH, VALID_PLAYBOOK_ID_PATH,
     VALID_REPUTATION_FILE, VALID_TEST_PLAYBOOK_PATH, VALID_WIDGET_PATH,
     WIDGET_TARGET)
+from pykwalify.core import Core
+from pykwalify.errors import SchemaError
 
 
 class TestStructureValidator:
@@ -198,6 +202,52 @@ class TestStructureValidator:
         (INVALID_INTEGRATION_YML_4, 'integration', pykwalify_error_4, expected_error_4),
     ]  # type: List[Tuple[str,str,str, str]]
 
+    COMPILED_SCHEMA_INPUTS = [
+        (INVALID_INTEGRATION_YML_1, FileType.INTEGRATION),
+        (INVALID_INTEGRATION_YML_4, FileType.INTEGRATION),
+        (INVALID_PLAYBOOK_PATH, FileType.PLAYBOOK),
+        (VALID_TEST_PLAYBOOK_PATH, FileType.PLAYBOOK),
+        (INVALID_LAYOUT_CONTAINER_PATH, FileType.LAYOUTS_CONTAINER),
+        (VALID_WIDGET_PATH, FileType.WIDGET),
+        (INVALID_WIDGET_PATH, FileType.WIDGET),
+        ('demisto_sdk/tests/test_files/content_repo_example/Packs/FeedAzure/Playbooks/FeedAzure_test.yml',
+         FileType.PLAYBOOK),
+    ]
+
+    @pytest.mark.parametrize('path, scheme', COMPILED_SCHEMA_INPUTS)
+    def test_compiled_schema_validation(self, path, scheme):
+        """
+        Given
+            - A content file and the file type of its schema
+
+        When
+            - validating the loaded file with the compiled schema of its file type
+
+        Then
+            - Ensure the schema is loaded once per file type
+            - Ensure the validation result is the same as validating the file with pykwalify's schema files loading
+        """
+        source_data = None
+        if path.endswith('.json'):
+            with open(path) as source_file:
+                source_data = json.load(source_file)
+        schema_path = os.path.join(SCHEMAS_DIR, f'{scheme.value}.yml')
+
+        assert get_compiled_schema(scheme) is get_compiled_schema(scheme)
+        try:
+            Core(source_file=path, schema_files=[schema_path]).validate(raise_exception=True)
+            expected_error = ''
+        except SchemaError as err:
+            expected_error = str(err)
+        try:
+            CompiledSchemaCore(get_compiled_schema(scheme), source_file=None if source_data else path,
+                               source_data=source_data).validate(raise_exception=True)
+            error = ''
+        except SchemaError as err:
+            error = str(err)
+
+        assert error == expected_error
+
     @pytest.mark.parametrize('path, scheme , error, correct', TEST_ERRORS)
     def test_print_error_msg(self, path, scheme, error, correct, mocker):
         mocker.patch.object(StructureValidator, 'scheme_of_file_by_path', return_value=scheme)
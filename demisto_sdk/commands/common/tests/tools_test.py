@@ -1,10 +1,13 @@
 import glob
 import json
 import os
+import re
+import shutil
+import timeit
 from pathlib import Path
 
 import pytest
-from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common import constants, tools
 from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
                                                    LAYOUTS_DIR,
                                                    PLAYBOOK_YML_REGEX,
@@ -41,6 +44,7 @@ from demisto_sdk.tests.constants_test import (INDICATORFIELD_EXTRA_FIELDS,
                                               VALID_REPUTATION_FILE,
                                               VALID_SCRIPT_PATH,
                                               VALID_WIDGET_PATH)
+from TestSuite.test_tools import ChangeCWD
 
 
 class TestGenericFunctions:
@@ -136,6 +140,241 @@ class TestGenericFunctions:
         assert get_code_lang(data, entity) == output
 
 
+class TestFindTypeByPath:
+    TEST_FILES_PATH = f'{git_path()}/demisto_sdk/tests/test_files'
+    # The directories of the content types in packs
+    CONTENT_TYPE_DIRS = {
+        FileType.INTEGRATION: ['Integrations'],
+        FileType.BETA_INTEGRATION: ['Integrations'],
+        FileType.SCRIPT: ['Scripts', 'TestPlaybooks'],
+        FileType.PLAYBOOK: ['Playbooks', 'TestPlaybooks'],
+        FileType.TEST_PLAYBOOK: ['TestPlaybooks'],
+        FileType.WIDGET: ['Widgets'],
+        FileType.REPORT: ['Reports'],
+        FileType.DASHBOARD: ['Dashboards'],
+        FileType.INCIDENT_FIELD: ['IncidentFields'],
+        FileType.INDICATOR_FIELD: ['IndicatorFields'],
+        FileType.INCIDENT_TYPE: ['IncidentTypes'],
+        FileType.REPUTATION: ['IndicatorTypes'],
+        FileType.LAYOUT: ['Layouts'],
+        FileType.LAYOUTS_CONTAINER: ['Layouts'],
+        FileType.CLASSIFIER: ['Classifiers'],
+        FileType.OLD_CLASSIFIER: ['Classifiers'],
+        FileType.MAPPER: ['Classifiers'],
+        FileType.CONNECTION: ['Connections'],
+    }
+
+    @pytest.mark.parametrize('path, _type', [
+        ('Packs/Pack/Widgets/widget-Pack.json', FileType.WIDGET),
+        ('./Packs/Pack/Reports/report-Pack.json', FileType.REPORT),
+        ('Packs/Pack/README.md', FileType.README),
+        ('Packs/Pack/ReleaseNotes/1_0_1.md', FileType.RELEASE_NOTES),
+        ('Packs/Pack/Integrations/Pack/Pack_image.png', FileType.IMAGE),
+        ('Packs/Pack/Integrations/Pack/Pack.py', FileType.PYTHON_FILE),
+        ('Packs/Pack/IncidentTypes/incidenttype-Pack.json', None),
+        ('Packs/Pack/Widgets/Nested/widget-Pack.json', None),
+        ('Packs/Pack/Integrations/Pack/Pack.yml', None),
+    ])
+    def test_find_type_by_path(self, path, _type):
+        assert tools.find_type_by_path(path) == _type
+
+    def test_get_yml_top_level_keys(self, tmp_path):
+        """
+        Given
+        - A block mapping yml with nested keys, comments, quoted keys, block scalars and unindented sequences.
+        - A flow mapping yml and a sequence yml.
+
+        When
+        - Reading their top level keys.
+
+        Then
+        - Ensure the top level keys of the block mapping yml are read.
+        - Ensure the keys of the flow mapping yml and the sequence yml are not read.
+        """
+        block_yml = tmp_path / 'block.yml'
+        block_yml.write_text('# comment\n---\ncommonfields:\n  id: test\n  version: -1\n"category": Utilities\n'
+                             'script: |-\n  def main():\n    return\n\n\'beta\': true\ntags:\n- test\n-\n'
+                             'name: "test: name"\n')
+        flow_yml = tmp_path / 'flow.yml'
+        flow_yml.write_text('{category: Utilities, script: ""}\n')
+        sequence_yml = tmp_path / 'sequence.yml'
+        sequence_yml.write_text('- category: Utilities\n- script: ""\n')
+
+        assert list(tools.get_yml_top_level_keys(str(block_yml))) == ['commonfields', 'category', 'script', 'beta',
+                                                                      'tags', 'name']
+        assert tools.get_yml_top_level_keys(str(flow_yml)) is None
+        assert tools.get_yml_top_level_keys(str(sequence_yml)) is None
+        assert tools.get_yml_top_level_keys(str(tmp_path / 'missing.yml')) is None
+
+    def test_find_type_consistent_with_parse(self, mocker, repo):
+        """
+        Given
+        - A repo with every content type in its directory, made of the content files of the test files.
+
+        When
+        - Finding the types of the files by their paths.
+
+        Then
+        - Ensure the types are the same as the types found by the parsed content of the files.
+        - Ensure no yml file is parsed to find its type.
+        """
+        pack = repo.create_pack('Pack')
+        pack.create_integration('Integration').create_default_integration()
+        pack.create_script('Script').create_default_script()
+        pack.create_release_notes('1_0_1', '#### Integrations')
+        pack.create_classifier('Classifier', {'id': 'Classifier', 'transformer': {}, 'keyTypeMap': {}})
+        pack.create_mapper('Mapper', {'id': 'Mapper', 'mapping': {}})
+        for content_dir, content in [('Reports', {'id': 'Report', 'orientation': 'portrait'}),
+                                     ('Connections', {'canvasContextConnections': []})]:
+            os.makedirs(os.path.join(pack.path, content_dir))
+            with open(os.path.join(pack.path, content_dir, f'{content_dir.lower()}-Pack.json'), 'w') as content_file:
+                json.dump(content, content_file)
+
+        for test_file_path in glob.glob(os.path.join(self.TEST_FILES_PATH, '**', '*.*'), recursive=True):
+            if not test_file_path.endswith(('.yml', '.json')):
+                continue
+
+            content_type = find_type(test_file_path, *get_dict_from_file(test_file_path))
+            for content_dir in self.CONTENT_TYPE_DIRS.get(content_type, []):
+                os.makedirs(os.path.join(pack.path, content_dir), exist_ok=True)
+                shutil.copy(test_file_path, os.path.join(pack.path, content_dir,
+                                                         f'{content_type.value}-{os.path.basename(test_file_path)}'))
+
+        repo_files = []
+        for root, _, file_names in os.walk(pack.path):
+            repo_files.extend(os.path.join(os.path.relpath(root, repo.path), file_name) for file_name in file_names)
+
+        with ChangeCWD(repo.path):
+            parsed_types = {file_path: find_type(file_path, *get_dict_from_file(file_path))
+                            for file_path in repo_files}
+            get_dict_from_file_spy = mocker.spy(tools, 'get_dict_from_file')
+            types = {file_path: find_type(file_path) for file_path in repo_files}
+
+        assert types == parsed_types
+        assert {parsed_type for parsed_type in parsed_types.values()}.issuperset(self.CONTENT_TYPE_DIRS)
+        assert not [call_args for call_args in get_dict_from_file_spy.call_args_list
+                    if call_args[0][0].endswith('.yml')]
+
+
+class TestGetLocalGitFiles:
+    @staticmethod
+    def init_git_repo(repo_path):
+        for command in ['git init -q', 'git config user.email test@test.com', 'git config user.name test']:
+            tools.run_command(command, cwd=repo_path)
+
+    @staticmethod
+    def commit(repo_path, message):
+        tools.run_command('git add .', cwd=repo_path)
+        tools.run_command(f'git commit -q -m {message}', cwd=repo_path)
+        return tools.run_command('git rev-parse HEAD', cwd=repo_path).strip()
+
+    def test_get_remote_file_from_local_git(self, tmp_path, mocker):
+        """
+        Given
+            - A git repository with a yml and a json file which were modified after a commit
+
+        When
+            - getting the files of the commit, and files which do not exist in it
+
+        Then
+            - Ensure the files are read from the local git repository in bulk and not from GitHub
+            - Ensure relative paths are relative to the repository root and absolute paths are supported
+            - Ensure files are read once per commit
+        """
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        self.init_git_repo(tmp_path)
+        (tmp_path / 'Packs').mkdir()
+        (tmp_path / 'Packs' / 'script.yml').write_text('commonfields:\n  id: old\n')
+        (tmp_path / 'Packs' / 'field.json').write_text('{"id": "old"}')
+        old_commit = self.commit(tmp_path, 'old')
+        (tmp_path / 'Packs' / 'script.yml').write_text('commonfields:\n  id: new\n')
+        self.commit(tmp_path, 'new')
+        popen = mocker.spy(tools, 'Popen')
+
+        with ChangeCWD(str(tmp_path / 'Packs')):
+            files = tools.get_local_git_files(['Packs/script.yml', str(tmp_path / 'Packs' / 'field.json'),
+                                               'Packs/missing.yml', 'Packs'], old_commit)
+            cat_file_calls = [call for call in popen.call_args_list if 'cat-file' in call[0][0]]
+            old_script = tools.get_remote_file('Packs/script.yml', old_commit)
+            missing_file = tools.get_remote_file('Packs/missing.yml', old_commit, github_fallback=False)
+            current_script = tools.get_remote_file('Packs/script.yml', 'HEAD')
+
+        assert files['Packs/script.yml'] == b'commonfields:\n  id: old\n'
+        assert json.loads(files[str(tmp_path / 'Packs' / 'field.json')]) == {'id': 'old'}
+        assert files['Packs/missing.yml'] is None
+        assert files['Packs'] is None
+        assert len(cat_file_calls) == 1
+        assert old_script == {'commonfields': {'id': 'old'}}
+        assert missing_file == {}
+        assert current_script == {'commonfields': {'id': 'new'}}
+        assert len([call for call in popen.call_args_list if 'cat-file' in call[0][0]]) == 2
+        assert not requests_get.called
+
+    def test_get_local_git_files_with_spaces(self, tmp_path):
+        """
+        Given
+            - A git repository with a file in a directory whose name contains spaces
+
+        When
+            - getting the file, and missing files whose paths contain spaces
+
+        Then
+            - Ensure the existing file is read and the missing files are not found
+        """
+        self.init_git_repo(tmp_path)
+        (tmp_path / 'Packs' / 'My Pack').mkdir(parents=True)
+        (tmp_path / 'Packs' / 'My Pack' / 'pack metadata.json').write_text('{"name": "My Pack"}')
+        commit = self.commit(tmp_path, 'spaces')
+
+        with ChangeCWD(str(tmp_path)):
+            files = tools.get_local_git_files(['Packs/My Pack/x.yml', 'Packs/My Pack/pack metadata.json',
+                                               'Packs/No Such Pack/x y.yml'], commit)
+
+        assert files == {'Packs/My Pack/x.yml': None, 'Packs/My Pack/pack metadata.json': b'{"name": "My Pack"}',
+                         'Packs/No Such Pack/x y.yml': None}
+
+    def test_get_remote_file_github_fallback(self, tmp_path, mocker):
+        """
+        Given
+            - A file which does not exist in the local git repository
+
+        When
+            - getting the file with and without the GitHub fallback
+
+        Then
+            - Ensure the file is fetched from GitHub by default, and only when the fallback is enabled
+        """
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        requests_get.return_value.content = b'{"id": "remote"}'
+
+        with ChangeCWD(str(tmp_path)):
+            assert tools.get_remote_file('Packs/field.json', 'master', github_fallback=False) == {}
+            assert not requests_get.called
+            assert tools.get_remote_file('Packs/field.json', 'master') == {'id': 'remote'}
+
+    def test_get_old_file_github_fallback(self, tmp_path, mocker):
+        """
+        Given
+            - An old entity file which does not exist in the local git repository
+
+        When
+            - getting the old file for the backward compatibility checks
+
+        Then
+            - Ensure the file is fetched from GitHub only when the fallback environment variable is set
+        """
+        from demisto_sdk.commands.common.hook_validations.structure import \
+            StructureValidator
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        requests_get.return_value.content = b'{"id": "remote"}'
+
+        with ChangeCWD(str(tmp_path)):
+            assert StructureValidator.get_old_file('Packs/field.json', 'master') == {}
+            assert not requests_get.called
+            mocker.patch.dict(os.environ, {tools.GITHUB_FALLBACK_ENV_VAR: 'true'})
+            assert StructureValidator.get_old_file('Packs/field.json', 'master') == {'id': 'remote'}
+
+
 class TestGetRemoteFile:
     def test_get_remote_file_sanity(self):
         hello_world_yml = tools.get_remote_file('Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.yml')
@@ -213,6 +452,104 @@ class TestGetMatchingRegex:
         assert get_matching_regex(string_to_match, regexes) == answer
 
 
+class TestRegexTable:
+    TEST_FILES_DIR = f'{git_path()}/demisto_sdk/tests/test_files/'
+    REGEX_TABLES = [table for name, table in vars(constants).items() if name.isupper() and table and (
+        isinstance(table, list) and all(isinstance(regex, str) for regex in table) or
+        isinstance(table, dict) and all(isinstance(regexes, list) and all(isinstance(regex, str) for regex in regexes)
+                                        for regexes in table.values()))]
+
+    @classmethod
+    def get_paths_corpus(cls):
+        """A corpus of content repo paths - the test files in their own directories and in a pack, and the files of
+        every content directory of a pack."""
+        paths = []
+        for path in glob.glob(os.path.join(cls.TEST_FILES_DIR, '**', '*.*'), recursive=True):
+            path_parts = os.path.relpath(path, cls.TEST_FILES_DIR).split(os.sep)
+            paths.extend(['/'.join(path_parts), '/'.join(['Packs', 'Pack'] + path_parts[-3:])])
+        for content_dir in constants.CONTENT_ENTITIES_DIRS:
+            content_dir_path = f'Packs/Pack/{content_dir}'
+            paths.extend([f'{content_dir_path}/{content_dir}-Entity.json', f'{content_dir_path}/Entity.yml',
+                          f'{content_dir_path}/script-Entity.yml', f'./{content_dir_path}/Entity/Entity.yml',
+                          f'{content_dir_path}/Entity/Entity.py', f'{content_dir_path}/Entity/Entity_test.py',
+                          f'{content_dir_path}/Entity/Entity.ps1', f'{content_dir_path}/Entity/README.md',
+                          f'{content_dir_path}/Entity/Entity_image.png'])
+        return paths
+
+    @staticmethod
+    def search_regexes_table(path, table):
+        """Searches the regexes of a table one by one, the way the regex tables were searched before RegexTable."""
+        for key, regexes in (table.items() if isinstance(table, dict) else ((regex, [regex]) for regex in table)):
+            for regex in regexes:
+                if re.search(regex, path, re.IGNORECASE):
+                    return key
+        return None
+
+    def test_match_same_as_search(self):
+        """
+        Given
+        - Every regex table of the constants module, and a corpus of content repo paths.
+
+        When
+        - Matching the paths with the compiled regex tables.
+
+        Then
+        - Ensure the key found for every path is the one of the first regex of the table which is found in the path.
+        """
+        paths = self.get_paths_corpus()
+        for table in self.REGEX_TABLES:
+            regex_table = tools.RegexTable(table)
+            for path in paths:
+                assert regex_table.match(path) == self.search_regexes_table(path, table), path
+
+    @pytest.mark.parametrize('path, expected_key', [
+        ('Packs/Pack/Integrations/Integration/Integration.yml', 'integration'),
+        ('Packs/Pack/Integrations/Integration/Other.yml', None),
+        ('packs/pack/integrations/integration/integration.YML', 'integration'),
+        ('Pac\u212as/Pack/Integrations/Integration/Integration.yml', 'integration'),
+        ('Packs/Pack/Scripts/script-Script.yml', 'script'),
+    ])
+    def test_match(self, path, expected_key):
+        """
+        Given
+        - A table with backreferences, and a path in a different case or with a non ascii character which matches
+          an ascii one case insensitively.
+
+        When
+        - Matching the path with the compiled regex table.
+
+        Then
+        - Ensure the key of the matching regex is found, as when searching the regexes one by one.
+        """
+        table = {
+            'integration': [constants.PACKS_INTEGRATION_YML_REGEX],
+            'script': [constants.PACKS_SCRIPT_YML_REGEX, constants.PACKS_SCRIPT_NON_SPLIT_YML_REGEX],
+        }
+        assert tools.RegexTable(table).match(path) == expected_key == self.search_regexes_table(path, table)
+
+    def test_match_benchmark(self):
+        """
+        Given
+        - The regex tables which are matched with every validated file, and a corpus of content repo paths.
+
+        When
+        - Matching the paths with the compiled regex tables, and searching the regexes of the tables one by one.
+
+        Then
+        - Report the matching times, which are printed with `pytest -s`. The matching results are checked by
+          test_match_same_as_search, the times are not asserted as they depend on the load of the machine.
+        """
+        paths = self.get_paths_corpus()
+        for table_name in ['CHECKED_TYPES_REGEXES', 'SCHEMA_TO_REGEX']:
+            table = getattr(constants, table_name)
+            regex_table = tools.RegexTable(table)
+            search_time = min(timeit.repeat(lambda: [self.search_regexes_table(path, table) for path in paths],
+                                            number=1, repeat=3))
+            match_time = min(timeit.repeat(lambda: [regex_table.match(path) for path in paths], number=1, repeat=3))
+            print(f'{table_name}: matched {len(paths)} paths in {match_time:.4f} seconds, '
+                  f'searched in {search_time:.4f} seconds')
+
+
 class TestServerVersionCompare:
     V5 = "5.0.0"
     V0 = "0.0.0"
@@ -4,18 +4,21 @@ import shutil
 import sys
 import tempfile
 import unittest
+from distutils.version import LooseVersion
 from tempfile import mkdtemp
 
 import pytest
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import (
-    find_duplicates, get_fields_by_script_argument,
+    ID_SET_ENTITIES, REPUTATION_COMMAND_KEY, IDSetManifest, build_id_set_index,
+    build_tasks_graph, find_duplicates, get_fields_by_script_argument, get_id_set_manifest_path,
     get_incident_fields_by_playbook_input, get_indicator_type_data,
     get_playbook_data, get_script_data, get_values_for_keys_recursively,
-    has_duplicate, process_classifier, process_dashboards,
-    process_incident_fields, process_incident_types, process_integration,
+    has_duplicate, process_classifier, process_content_path,
+    process_dashboards, process_incident_fields, process_incident_types, process_integration,
     process_layouts, process_layoutscontainer, process_mappers,
-    process_playbook, process_script, re_create_id_set)
+    process_playbook, process_script, re_create_id_set,
+    resolve_incident_fields_types, resolve_indicator_types_integrations)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 from TestSuite.utils import IsEqualFunctions
 
@@ -147,6 +150,30 @@ class TestDuplicates:
     def test_had_duplicates(id_set, id_to_check, result):
         assert result == has_duplicate(id_set, id_to_check)
 
+    @staticmethod
+    @pytest.mark.parametrize('versions, result', [
+        ([('5.0.0', '5.0.0'), ('5.0.0', '6.0.0')], True),
+        ([('5.0.0', '6.0.0'), ('5.0.0', '5.0.0')], True),
+        ([('4.0.0', '5.0.0'), ('5.0.0', '5.0.0')], True),
+        ([('5.0.0', '5.0.0'), ('5.0.0', '5.0.0')], False),
+        ([('4.0.0', '5.0.0'), ('5.0.0', '6.0.0')], False),
+    ])
+    def test_has_duplicate_same_from_version(versions, result):
+        """
+        Given
+            - Entries of the same id with the same from version, or an empty version range, in either order
+
+        When
+            - checking for duplicate
+
+        Then
+            - Ensure the result does not depend on the entries order, and is the same as the pairwise check of
+              every two entries
+        """
+        id_set = [{'Test': {'name': 'Test', 'fromversion': from_version, 'toversion': to_version}}
+                  for from_version, to_version in versions]
+        assert has_duplicate(id_set, 'Test', print_logs=False) is result
+
     ID_SET = [
         {'Access': {'typeID': 'Access', 'kind': 'edit', 'path': 'Layouts/layout-edit-Access.json'}},
         {'Access': {'typeID': 'Access', 'fromversion': '4.1.0', 'kind': 'details', 'path': 'layout-Access.json'}},
@@ -356,6 +383,28 @@ class TestScripts:
 
         assert IsEqualFunctions.is_dicts_equal(returned_data, const_data)
 
+    @staticmethod
+    def test_process_script__package_without_type(tmp_path):
+        """
+        Given
+            - A script package whose yml has no script type.
+
+        When
+            - parsing the script package
+
+        Then
+            - an error naming the missing type will be raised
+        """
+        package_path = tmp_path / 'Scripts' / 'NoTypeScript'
+        shutil.copytree(os.path.join(TESTS_DIR, 'test_files', 'Packs', 'DummyPack', 'Scripts', 'DummyScript'),
+                        package_path)
+        yml_path = package_path / 'DummyScript.yml'
+        yml_lines = yml_path.read_text().splitlines()
+        yml_path.write_text('\n'.join(line for line in yml_lines if not line.startswith('type:')))
+
+        with pytest.raises(ValueError, match='The script type of .* is None'):
+            process_script(str(package_path), False)
+
     @staticmethod
     def test_process_script__exception():
         """
@@ -518,6 +567,37 @@ class TestPlaybooks:
         assert 'domain' in playbook_data.get('skippable_tasks', [])
         assert len(playbook_data.get('skippable_tasks', [])) == 1
 
+    @staticmethod
+    def test_build_tasks_graph_mandatory_paths():
+        """
+        Given
+            - A playbook where task 3 is first reached by a skippable task and later by a mandatory task,
+              task 5 is unreachable and task 1 points to a non-existing task
+
+        When
+            - building the playbook tasks graph
+
+        Then
+            - Ensure the mandatory path is propagated to the tasks after task 3
+            - Ensure only the skippable task and the unreachable task are not mandatory
+        """
+        playbook = {
+            'id': 'Playbook',
+            'starttaskid': '0',
+            'tasks': {
+                '0': {'nexttasks': {'#none#': ['1', '2']}},
+                '1': {'skipunavailable': True, 'nexttasks': {'#none#': ['3', '6']}},
+                '2': {'nexttasks': {'#none#': ['3']}},
+                '3': {'nexttasks': {'#none#': ['4']}},
+                '4': {'nexttasks': None},
+                '5': {'nexttasks': {'#none#': ['4']}},
+            }
+        }
+        graph = build_tasks_graph(playbook, print_logs=False)
+
+        assert graph.reachable == {'0', '1', '2', '3', '4'}
+        assert graph.mandatory == {'0', '2', '3', '4'}
+
 
 class TestLayouts:
     @staticmethod
@@ -617,7 +697,7 @@ class TestIncidentFields:
         """
         test_dir = os.path.join(git_path(), 'demisto_sdk', 'commands', 'create_id_set', 'tests',
                                 'test_data', 'incidentfield-to-test.json')
-        res = process_incident_fields(test_dir, True, [])
+        res = process_incident_fields(test_dir, True)
         assert len(res) == 1
         result = res[0]
         result = result.get('incidentfield-test')
@@ -643,7 +723,7 @@ class TestIncidentFields:
         """
         test_dir = os.path.join(git_path(), 'demisto_sdk', 'commands', 'create_id_set', 'tests',
                                 'test_data', 'incidentfield-to-test-no-types_scripts.json')
-        res = process_incident_fields(test_dir, True, [])
+        res = process_incident_fields(test_dir, True)
         assert len(res) == 1
         result = res[0]
         result = result.get('incidentfield-test')
@@ -654,6 +734,33 @@ class TestIncidentFields:
         assert 'incident_types' not in result.keys()
         assert 'scripts' not in result.keys()
 
+    @staticmethod
+    def test_resolve_incident_fields_types():
+        """
+        Given
+            - An incident field associated to all the incident types and an incident field associated to one type
+
+        When
+            - resolving the incident fields types
+
+        Then
+            - Ensure the 'all' type is replaced with all the incident types
+            - Ensure the incident types key is removed when there are no incident types
+        """
+        incident_fields = [
+            {'all_field': {'name': 'all_field', 'incident_types': ['all']}},
+            {'type_field': {'name': 'type_field', 'incident_types': ['first']}},
+        ]
+        incident_types = [{'first': {'name': 'first'}}, {'second': {'name': 'second'}}]
+
+        result = resolve_incident_fields_types(incident_fields, incident_types)
+        assert result[0]['all_field']['incident_types'] == ['first', 'second']
+        assert result[1]['type_field']['incident_types'] == ['first']
+
+        result = resolve_incident_fields_types(incident_fields, [])
+        assert result[0] == {'all_field': {'name': 'all_field'}}
+        assert incident_fields[0]['all_field']['incident_types'] == ['all']
+
 
 class TestIndicatorType:
     @staticmethod
@@ -670,7 +777,8 @@ class TestIndicatorType:
         """
         test_dir = f'{git_path()}/demisto_sdk/commands/create_id_set/tests/test_data/reputation-indicatortype.json'
 
-        result = get_indicator_type_data(test_dir, [{'integration': {'commands': ['ip']}}])
+        result = resolve_indicator_types_integrations([get_indicator_type_data(test_dir)],
+                                                      [{'integration': {'commands': ['ip']}}])[0]
         result = result.get('indicator-type-dummy')
         assert 'name' in result.keys()
         assert 'file_path' in result.keys()
@@ -680,6 +788,39 @@ class TestIndicatorType:
         assert "dummy-script" in result.get('scripts')
         assert "dummy-script-2" in result.get('scripts')
         assert "dummy-script-3" in result.get('scripts')
+        assert result.get('integrations') == ['integration']
+        assert REPUTATION_COMMAND_KEY not in result
+
+    @staticmethod
+    def test_resolve_indicator_types_integrations():
+        """
+        Given
+            - Indicator types with reputation commands
+            - Integrations, two of them implementing the same command
+
+        When
+            - resolving the indicator types integrations
+
+        Then
+            - Ensure every indicator type holds the integrations implementing its reputation command
+            - Ensure the given indicator types entries are not modified
+        """
+        indicator_types = [
+            {'ip': {'name': 'ip', REPUTATION_COMMAND_KEY: 'ip', 'scripts': ['script']}},
+            {'url': {'name': 'url', REPUTATION_COMMAND_KEY: 'url'}},
+        ]
+        integrations = [
+            {'first': {'commands': ['ip', 'domain']}},
+            {'second': {'commands': ['ip']}},
+            {'no_commands': {'name': 'no_commands'}},
+        ]
+
+        result = resolve_indicator_types_integrations(indicator_types, integrations)
+
+        assert list(result[0]['ip'].items()) == [('name', 'ip'), ('integrations', ['first', 'second']),
+                                                 ('scripts', ['script'])]
+        assert result[1] == {'url': {'name': 'url'}}
+        assert indicator_types[0]['ip'][REPUTATION_COMMAND_KEY] == 'ip'
 
     @staticmethod
     def test_get_indicator_type_data_no_integration_no_scripts():
@@ -697,7 +838,7 @@ class TestIndicatorType:
         test_dir = f'{git_path()}/demisto_sdk/commands/create_id_set/tests/test_data/' \
                    f'reputation-indicatortype_no_script_no_integration.json'
 
-        result = get_indicator_type_data(test_dir, [])
+        result = resolve_indicator_types_integrations([get_indicator_type_data(test_dir)], [])[0]
         result = result.get('indicator-type-dummy')
         assert 'name' in result.keys()
         assert 'file_path' in result.keys()
@@ -1217,3 +1358,188 @@ class TestFlow(unittest.TestCase):
             assert any('dup-check-dashbaord' in i for i in dup_data)
             assert any('layout-dup-check-id' in i for i in dup_data)
             assert any('incident_account_field_dup_check' in i for i in dup_data)
+
+
+class TestIDSetManifest:
+    @staticmethod
+    def test_manifest_reuses_unchanged_paths(tmp_path):
+        """
+        Given
+            - A manifest saved with the results of two content files
+
+        When
+            - looking up the paths again after one of the files was changed
+
+        Then
+            - Ensure the result of the unchanged file is reused
+            - Ensure the changed file has to be processed again
+        """
+        first_path = tmp_path / 'first.json'
+        second_path = tmp_path / 'second.json'
+        first_path.write_text('{"id": "first"}')
+        second_path.write_text('{"id": "second"}')
+        manifest_path = str(tmp_path / 'id_set_manifest.json')
+
+        manifest = IDSetManifest(manifest_path)
+        for path in (str(first_path), str(second_path)):
+            assert manifest.lookup('Reports', path) is None
+            manifest.update('Reports', path, [{os.path.basename(path): {'name': 'report'}}])
+        manifest.save()
+
+        second_path.write_text('{"id": "second", "name": "changed"}')
+        manifest = IDSetManifest(manifest_path)
+
+        assert manifest.lookup('Reports', str(first_path))['result'] == [{'first.json': {'name': 'report'}}]
+        assert manifest.lookup('Reports', str(second_path)) is None
+        assert (manifest.reused, manifest.recomputed) == (1, 1)
+
+    @staticmethod
+    def test_manifest_full(tmp_path):
+        """
+        Given
+            - A saved manifest of a content file
+
+        When
+            - looking up the path with the full flag
+
+        Then
+            - Ensure the path has to be processed again
+        """
+        content_path = tmp_path / 'report.json'
+        content_path.write_text('{"id": "report"}')
+        manifest_path = str(tmp_path / 'id_set_manifest.json')
+        manifest = IDSetManifest(manifest_path)
+        manifest.lookup('Reports', str(content_path))
+        manifest.update('Reports', str(content_path), [])
+        manifest.save()
+
+        manifest = IDSetManifest(manifest_path, full=True)
+        assert manifest.lookup('Reports', str(content_path)) is None
+        assert (manifest.reused, manifest.recomputed) == (0, 1)
+
+    @staticmethod
+    def test_incremental_id_set_equals_full_id_set(repo, monkeypatch):
+        """
+        Given
+            - A content repo with an id_set created with a manifest
+
+        When
+            - changing a script and re-creating the id_set incrementally
+
+        Then
+            - Ensure the incremental id_set is identical to a full id_set creation
+        """
+        pack = repo.create_pack('ManifestPack')
+        pack.create_integration('Integration').create_default_integration()
+        script = pack.create_script('Script')
+        script.create_default_script()
+        pack.create_incident_type('IncidentType', {'id': 'type', 'name': 'type', 'preProcessingScript': ''})
+        pack.create_incident_field('IncidentField', {'id': 'incident_field', 'name': 'field',
+                                                     'associatedTypes': ['all']})
+        monkeypatch.chdir(repo.path)
+        incremental_path = os.path.join(repo.path, 'Tests', 'incremental_id_set.json')
+        full_path = os.path.join(repo.path, 'Tests', 'full_id_set.json')
+
+        re_create_id_set(incremental_path, print_logs=False)
+        assert os.path.isfile(get_id_set_manifest_path(incremental_path))
+
+        script.yml.update({'fromversion': '5.5.0'})
+        re_create_id_set(incremental_path, print_logs=False)
+        re_create_id_set(full_path, print_logs=False, full=True)
+
+        with open(incremental_path) as incremental_file, open(full_path) as full_file:
+            incremental_id_set = incremental_file.read()
+            assert incremental_id_set == full_file.read()
+        assert '5.5.0' in incremental_id_set
+
+
+class TestDuplicatesIndex:
+    @staticmethod
+    def test_build_id_set_index():
+        """
+        Given
+            - An id_set with the same id in two sections
+
+        When
+            - indexing the id_set
+
+        Then
+            - Ensure the entries are grouped by the id with their sections and parsed versions
+        """
+        index = build_id_set_index({
+            'scripts': [{'dup': {'name': 'dup', 'fromversion': '5.0.0'}}, {'other': {'name': 'other'}}],
+            'integrations': [{'dup': {'name': 'dup', 'toversion': '4.5.0'}}]
+        })
+
+        assert [entry.section for entry in index['dup']] == ['scripts', 'integrations']
+        assert index['dup'][0].from_version == LooseVersion('5.0.0')
+        assert index['dup'][0].to_version == LooseVersion('99.99.99')
+        assert index['dup'][1].to_version == LooseVersion('4.5.0')
+        assert len(index['other']) == 1
+
+    @staticmethod
+    def test_find_duplicates_sweep():
+        """
+        Given
+            - An id_set with several entries of the same ids, some of them with overlapping version ranges
+
+        When
+            - finding the duplicates of the id_set
+
+        Then
+            - Ensure only the ids with overlapping version ranges are returned
+            - Ensure layouts of different kinds are not considered duplicates
+            - Ensure an incident field and an indicator field with the same id are duplicates
+        """
+        id_set = {section: [] for section in ID_SET_ENTITIES}
+        id_set['scripts'] = [
+            {'overlap': {'name': 'overlap', 'fromversion': '3.0.0', 'toversion': '3.6.0'}},
+            {'overlap': {'name': 'overlap', 'fromversion': '4.5.0'}},
+            {'overlap': {'name': 'overlap', 'fromversion': '3.5.2', 'toversion': '3.5.4'}},
+            {'sequential': {'name': 'sequential', 'toversion': '4.9.9'}},
+            {'sequential': {'name': 'sequential', 'fromversion': '5.0.0', 'toversion': '5.4.9'}},
+            {'sequential': {'name': 'sequential', 'fromversion': '5.5.0'}},
+        ]
+        id_set['Layouts'] = [
+            {'layout': {'kind': 'edit'}},
+            {'layout': {'kind': 'details'}},
+        ]
+        id_set['IncidentFields'] = [{'field': {'name': 'field'}}]
+        id_set['IndicatorFields'] = [{'field': {'name': 'field'}}]
+
+        duplicates = find_duplicates(id_set, print_logs=False)
+
+        assert duplicates[ID_SET_ENTITIES.index('scripts')] == ['overlap']
+        assert duplicates[ID_SET_ENTITIES.index('Layouts')] == []
+        assert duplicates[-1] == ['field']
+        assert sum(len(section_duplicates) for section_duplicates in duplicates) == 2
+
+
+class TestParseCalls:
+    PACK_PATH = os.path.join(TESTS_DIR, 'test_files', 'Packs', 'DummyPack')
+
+    @staticmethod
+    @pytest.mark.parametrize('path, sections', [
+        (os.path.join(PACK_PATH, 'Integrations', 'UploadTest'), ['Integrations']),
+        (os.path.join(PACK_PATH, 'Scripts', 'DummyScript'), ['Scripts']),
+        (os.path.join(PACK_PATH, 'Playbooks', 'DummyPlaybook.yml'), ['Playbooks']),
+        (os.path.join(PACK_PATH, 'Playbooks', 'DummyPlaybook.yml'), ['TestPlaybooks']),
+        (os.path.join(PACK_PATH, 'Classifiers', 'classifier-aws_sns_test_classifier.json'), ['Classifiers', 'Mappers']),
+        (os.path.join(PACK_PATH, 'Layouts', 'layout-details-test_bla-V2.json'), ['Layouts', 'LayoutsContainers']),
+    ])
+    def test_process_content_path_parses_once(path, sections):
+        """
+        Given
+            - A content path processed by one or more id_set sections
+
+        When
+            - processing the path in an id_set task
+
+        Then
+            - Ensure every section has a result and the path yml or json file was parsed exactly once
+        """
+        result_path, results, parse_calls = process_content_path((path, sections), print_logs=False)
+
+        assert result_path == path
+        assert [section for section, _ in results] == sections
+        assert list(parse_calls.values()) == [1]
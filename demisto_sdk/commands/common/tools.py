@@ -7,7 +7,7 @@ import re
 import shlex
 import sys
 from distutils.version import LooseVersion
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen, check_output
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
@@ -20,18 +20,25 @@ import requests
 import urllib3
 import yaml
 from demisto_sdk.commands.common.constants import (
-    ALL_FILES_VALIDATION_IGNORE_WHITELIST, CHECKED_TYPES_REGEXES,
-    CLASSIFIERS_DIR, CONTENT_GITHUB_LINK, CONTENT_GITHUB_ORIGIN,
-    CONTENT_GITHUB_UPSTREAM, DASHBOARDS_DIR, DEF_DOCKER, DEF_DOCKER_PWSH,
-    ID_IN_COMMONFIELDS, ID_IN_ROOT, INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR,
-    INDICATOR_FIELDS_DIR, INTEGRATIONS_DIR, JSON_ALL_INDICATOR_TYPES_REGEXES,
-    LAYOUTS_DIR, PACKAGE_SUPPORTING_DIRECTORIES, PACKAGE_YML_FILE_REGEX,
-    PACKS_DIR, PACKS_DIR_REGEX, PACKS_README_FILE_NAME, PLAYBOOKS_DIR,
-    RELEASE_NOTES_DIR, RELEASE_NOTES_REGEX, REPORTS_DIR, SCRIPTS_DIR,
-    SDK_API_GITHUB_RELEASES, TEST_PLAYBOOKS_DIR, TYPE_PWSH, UNRELEASE_HEADER,
-    WIDGETS_DIR, FileType)
+    ALL_FILES_VALIDATION_IGNORE_WHITELIST, CACHE_DIR_ENV_VAR,
+    CHECKED_TYPES_REGEXES, CLASSIFIERS_DIR, CONTENT_GITHUB_LINK,
+    CONTENT_GITHUB_ORIGIN, CONTENT_GITHUB_UPSTREAM, DASHBOARDS_DIR, DEF_DOCKER,
+    DEF_DOCKER_PWSH, DEFAULT_CACHE_DIR, ID_IN_COMMONFIELDS, ID_IN_ROOT,
+    INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR,
+    INTEGRATIONS_DIR, JSON_ALL_INDICATOR_TYPES_REGEXES,
+    JSON_ALL_REPORTS_REGEXES, JSON_ALL_WIDGETS_REGEXES, LAYOUTS_DIR,
+    PACKAGE_SUPPORTING_DIRECTORIES, PACKAGE_YML_FILE_REGEX, PACKS_DIR,
+    PACKS_DIR_REGEX, PACKS_README_FILE_NAME, PLAYBOOKS_DIR, RELEASE_NOTES_DIR,
+    RELEASE_NOTES_REGEX, REPORTS_DIR, SCRIPTS_DIR, SDK_API_GITHUB_RELEASES,
+    TEST_PLAYBOOKS_DIR, TYPE_PWSH, UNRELEASE_HEADER, WIDGETS_DIR, FileType)
 from ruamel.yaml import YAML
 
+try:
+    # the regex parser is private since python 3.11, and its public alias is deprecated
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:
+    import sre_parse
+
 # disable insecure warnings
 urllib3.disable_warnings()
 
@@ -53,6 +60,12 @@ class LOG_COLORS:
 
 LOG_VERBOSE = False
 
+# A top level key of a block mapping yml, optionally quoted, followed by its value or by a nested block
+YML_TOP_LEVEL_KEY_REGEX = re.compile(r'^([\'"]?)([^\s\'"#:\-\[\]{}?&*!|>%@`][^:]*?)\1\s*:(?:\s|$)')
+
+# the regex extracts pack name from relative paths, for example: Packs/EWSv2 -> EWSv2
+PACK_NAME_REGEX = re.compile(rf'^{PACKS_DIR_REGEX}[/\\]([^/\\]+)[/\\]')
+
 LAYOUT_CONTAINER_FIELDS = {'details', 'detailsV2', 'edit', 'close', 'mobile', 'quickView', 'indicatorsQuickView',
                            'indicatorsDetails'}
 
@@ -145,7 +158,123 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
     return output
 
 
-def get_remote_file(full_file_path, tag='master'):
+def get_cache_dir(cache_name: str) -> str:
+    """Returns the directory of a demisto-sdk cache, under the 'DEMISTO_SDK_CACHE_DIR' environment variable
+    directory if it is set, or under .demisto-sdk-cache otherwise.
+
+    Args:
+        cache_name: The name of the cache, e.g. 'validate'.
+
+    Returns:
+        str. The cache directory path.
+    """
+    return os.path.join(os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR), cache_name)
+
+
+# Set to fetch old files which are not found in the local git repository from the content GitHub repository
+GITHUB_FALLBACK_ENV_VAR = 'DEMISTO_SDK_GITHUB_FALLBACK'
+# The contents of the files of the local git repository by commit and path, None for files which do not exist
+LOCAL_GIT_FILES_CACHE: Dict[Tuple[str, str], Optional[bytes]] = {}
+
+
+def resolve_local_git_revision(tag):
+    """Returns the commit sha of a revision in the local git repository, trying the origin remote branch of the
+    revision if it does not exist locally.
+
+    Args:
+        tag (str): a branch, tag or commit.
+
+    Returns:
+        str, str. The root directory of the repository and the commit sha, empty strings if the revision is not found.
+    """
+    revisions = [tag] if tag.startswith('origin/') else [tag, f'origin/{tag}']
+    for revision in revisions:
+        try:
+            process = Popen(['git', 'rev-parse', '--show-toplevel', '--verify', '--quiet', f'{revision}^{{commit}}'],
+                            stdout=PIPE, stderr=DEVNULL, universal_newlines=True)
+        except OSError:
+            break
+        output, _ = process.communicate()
+        if process.returncode == 0 and len(output.split('\n')) > 2:
+            repo_root, commit = output.split('\n')[:2]
+            return repo_root, commit
+
+    return '', ''
+
+
+def get_local_git_files(file_paths, tag='master'):
+    """Reads files of a revision from the local git object store. The files which were not read yet are read in bulk
+    by a single `git cat-file --batch` process, and are memoized for the rest of the run.
+
+    Args:
+        file_paths (Iterable[str]): paths of files, absolute or relative to the repository root.
+        tag (str): the revision to read the files from.
+
+    Returns:
+        dict. The content of every file, or None if it does not exist in the revision.
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    repo_root, commit = resolve_local_git_revision(tag)
+    if not commit:
+        return {file_path: None for file_path in file_paths}
+
+    cache_keys = {file_path: (commit, os.path.relpath(file_path, repo_root).replace('\\', '/')
+                              if os.path.isabs(file_path) else file_path.replace('\\', '/'))
+                  for file_path in file_paths}
+    paths_to_read = [file_path for file_path in file_paths if cache_keys[file_path] not in LOCAL_GIT_FILES_CACHE]
+    if paths_to_read:
+        objects = ''.join('{}:{}\n'.format(*cache_keys[file_path]) for file_path in paths_to_read)
+        process = Popen(['git', 'cat-file', '--batch'], stdin=PIPE, stdout=PIPE, stderr=DEVNULL)
+        output, _ = process.communicate(objects.encode('utf-8'))
+
+        position = 0
+        for file_path in paths_to_read:
+            header_end = output.index(b'\n', position)
+            header = output[position:header_end]
+            position = header_end + 1
+            content = None
+            # the object name of missing objects holds the path, which may contain spaces
+            if not header.endswith((b' missing', b' ambiguous')):
+                _, object_type, size = header.rsplit(b' ', 2)
+                if object_type == b'blob':
+                    content = output[position:position + int(size)]
+                # the content of a tree or another object type which is not a file is skipped
+                position += int(size) + 1
+            LOCAL_GIT_FILES_CACHE[cache_keys[file_path]] = content
+
+    return {file_path: LOCAL_GIT_FILES_CACHE[cache_keys[file_path]] for file_path in file_paths}
+
+
+def parse_remote_file_content(full_file_path, content):
+    if full_file_path.endswith('json'):
+        details = json.loads(content)
+    elif full_file_path.endswith('yml'):
+        details = yaml.safe_load(content)
+    # if neither yml nor json then probably a CHANGELOG or README file.
+    else:
+        details = {}
+    return details
+
+
+def get_remote_file(full_file_path, tag='master', github_fallback=True):
+    """Returns the parsed content of a file in a revision of the repository, read from the local git repository.
+
+    Args:
+        full_file_path (str): path of the file, absolute or relative to the repository root.
+        tag (str): the revision to read the file from.
+        github_fallback (bool): whether to fetch the file from the content GitHub repository if it is not found in
+            the local git repository.
+
+    Returns:
+        dict. The parsed file, or an empty dict if it is not found or is neither a yml nor a json file.
+    """
+    local_file = get_local_git_files([full_file_path], tag)[full_file_path]
+    if local_file is not None:
+        return parse_remote_file_content(full_file_path, local_file)
+
+    if not github_fallback:
+        return {}
+
     # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
     tag = tag.lstrip('origin/')
 
@@ -155,19 +284,10 @@ def get_remote_file(full_file_path, tag='master'):
         res = requests.get(github_path, verify=False, timeout=10)
         res.raise_for_status()
     except Exception as exc:
-        print_warning('Could not find the old entity file under "{}".\n'
-                      'please make sure that you did not break backward compatibility. '
-                      'Reason: {}'.format(github_path, exc))
+        print_warning('Could not fetch the file from "{}". Reason: {}'.format(github_path, exc))
         return {}
 
-    if full_file_path.endswith('json'):
-        details = json.loads(res.content)
-    elif full_file_path.endswith('yml'):
-        details = yaml.safe_load(res.content)
-    # if neither yml nor json then probably a CHANGELOG or README file.
-    else:
-        details = {}
-    return details
+    return parse_remote_file_content(full_file_path, res.content)
 
 
 def filter_packagify_changes(modified_files, added_files, removed_files, tag='master'):
@@ -505,13 +625,67 @@ def get_latest_release_notes_text(rn_path):
     return rn if rn else None
 
 
+class RegexTable:
+    """
+    A table of path regexes which are compiled once, each of them with the longest literal any of its matches must
+    contain, so finding the first regex of the table which matches a path searches only the regexes which literals are
+    found in the path, instead of every regex in the table.
+
+    Every regex is searched case insensitively, and the first matching regex in the table order is the one found, as
+    when the regexes are searched one by one.
+
+    Attributes:
+        regexes (list): Tuples of the required literal, the compiled regex and the key of every regex in the table -
+            the table key for tables given as dicts, or the regex itself otherwise.
+    """
+
+    def __init__(self, table: Union[dict, list, tuple]):
+        if isinstance(table, dict):
+            regexes_keys = [(regex, key) for key, regexes in table.items() for regex in regexes]
+        else:
+            regexes_keys = [(regex, regex) for regex in table]
+
+        self.regexes = [(self.get_required_literal(regex), re.compile(regex, re.IGNORECASE), key)
+                        for regex, key in regexes_keys]
+
+    @staticmethod
+    def get_required_literal(regex: str) -> str:
+        """Returns the longest run of literal characters at the top level of the regex in lower case, which any
+        match of the regex contains, or an empty string if there is none."""
+        required_literal = literal = ''
+        for op, value in sre_parse.parse(regex):
+            if op is sre_parse.LITERAL:
+                literal += chr(value)
+            else:
+                required_literal = max(required_literal, literal, key=len)
+                literal = ''
+
+        return max(required_literal, literal, key=len).lower()
+
+    def match(self, path: str) -> Optional[Any]:
+        """Returns the key of the first regex of the table which matches the path, or None if none of them does."""
+        # case insensitive matching folds some non ascii characters to ascii ones, so those paths are fully searched
+        lower_path = path.lower() if path.isascii() else None
+        for required_literal, regex, key in self.regexes:
+            if (lower_path is None or required_literal in lower_path) and regex.search(path):
+                return key
+
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_regex_table(regexes: tuple) -> RegexTable:
+    """Returns the compiled table of a tuple of regexes, which is compiled once per process."""
+    return RegexTable(regexes)
+
+
 def checked_type(file_path, compared_regexes=None, return_regex=False):
     compared_regexes = compared_regexes or CHECKED_TYPES_REGEXES
-    for regex in compared_regexes:
-        if re.search(regex, file_path, re.IGNORECASE):
-            if return_regex:
-                return regex
-            return True
+    regex = get_regex_table(tuple(compared_regexes)).match(file_path)
+    if regex is not None:
+        if return_regex:
+            return regex
+        return True
     return False
 
 
@@ -589,8 +763,7 @@ def get_pack_name(file_path):
     Returns:
         pack name (str)
     """
-    # the regex extracts pack name from relative paths, for example: Packs/EWSv2 -> EWSv2
-    match = re.search(rf'^{PACKS_DIR_REGEX}[/\\]([^/\\]+)[/\\]', file_path)
+    match = PACK_NAME_REGEX.search(file_path)
     return match.group(1) if match else None
 
 
@@ -747,15 +920,15 @@ def get_dict_from_file(path: str, use_ryaml: bool = False) -> Tuple[Dict, Union[
     return {}, None
 
 
-def find_type(path: str = '', _dict=None, file_type: Optional[str] = None, ignore_sub_categories: bool = False):  # noqa: C901
+def find_type_by_path(path: str = '') -> Optional[FileType]:
     """
-    returns the content file type
+    returns the content file type of files which type is determined by their path alone
 
     Arguments:
         path - a path to the file
 
     Returns:
-        string representing the content file type
+        FileType. The content file type, or None if the type depends on the file content
     """
     if path.endswith('.md'):
         if 'README' in path:
@@ -772,6 +945,79 @@ def find_type(path: str = '', _dict=None, file_type: Optional[str] = None, ignor
     if path.endswith('.png'):
         return FileType.IMAGE
 
+    if path.endswith('.py'):
+        return FileType.PYTHON_FILE
+
+    # the keys the types of these files are found by are required by their schemas, and are not in other schemas
+    if path.endswith('.json'):
+        if checked_type(path, JSON_ALL_WIDGETS_REGEXES):
+            return FileType.WIDGET
+
+        if checked_type(path, JSON_ALL_REPORTS_REGEXES):
+            return FileType.REPORT
+
+    return None
+
+
+def get_yml_top_level_keys(path: str) -> Optional[dict]:
+    """
+    Reads the top level keys of a yml file without parsing it, which is all the yml content types are found by
+
+    Arguments:
+        path - a path to the yml file
+
+    Returns:
+        dict. The top level keys of the file mapped to None, or None if the file is not a block mapping or could not
+        be read
+    """
+    top_level_keys: dict = {}
+    try:
+        with open(os.path.expanduser(path), mode='r', encoding='utf8') as yml_file:
+            for line in yml_file:
+                if not line.strip() or line[0] in ' \t#' or line.startswith(('---', '...', '%')):
+                    # indented lines are nested in the top level values
+                    continue
+
+                if line.startswith('-') and line[1:2].isspace():
+                    # block sequences may be written unindented under their top level key
+                    if not top_level_keys:
+                        return None
+                    continue
+
+                top_level_key = YML_TOP_LEVEL_KEY_REGEX.match(line)
+                if not top_level_key:
+                    # e.g. flow collections, top level sequences and complex keys
+                    return None
+
+                top_level_keys[top_level_key.group(2)] = None
+
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return top_level_keys
+
+
+def find_type(path: str = '', _dict=None, file_type: Optional[str] = None, ignore_sub_categories: bool = False):  # noqa: C901
+    """
+    returns the content file type
+
+    Arguments:
+        path - a path to the file
+
+    Returns:
+        string representing the content file type
+    """
+    # md and png files are found by their path even when their content is given
+    if path.endswith(('.md', '.png')) or not _dict and not file_type:
+        type_by_path = find_type_by_path(path)
+        if type_by_path:
+            return type_by_path
+
+    if not _dict and not file_type and path.endswith('.yml'):
+        top_level_keys = get_yml_top_level_keys(path)
+        if top_level_keys is not None:
+            _dict, file_type = top_level_keys, 'yml'
+
     if not _dict and not file_type:
         _dict, file_type = get_dict_from_file(path)
 
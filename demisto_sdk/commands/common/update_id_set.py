@@ -1,16 +1,17 @@
 import glob
-import itertools
+import hashlib
+import io
 import json
 import os
 import re
 import time
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from distutils.version import LooseVersion
 from functools import partial
 from multiprocessing import Pool, cpu_count
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import click
-import networkx
 from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
                                                    DASHBOARDS_DIR,
                                                    INCIDENT_FIELDS_DIR,
@@ -20,12 +21,16 @@ from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
                                                    LAYOUTS_DIR, MAPPERS_DIR,
                                                    REPORTS_DIR, SCRIPTS_DIR,
                                                    TEST_PLAYBOOKS_DIR,
+                                                   TYPE_TO_EXTENSION,
                                                    WIDGETS_DIR, FileType)
-from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type, get_json,
+from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
+                                               get_dict_from_file,
                                                get_pack_name, get_yaml,
+                                               get_yml_paths_in_dir,
                                                print_color, print_error,
                                                print_warning)
 from demisto_sdk.commands.unify.unifier import Unifier
+from pkg_resources import DistributionNotFound, get_distribution
 
 CONTENT_ENTITIES = ['Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks', 'Classifiers',
                     'Dashboards', 'IncidentFields', 'IncidentTypes', 'IndicatorFields', 'IndicatorTypes',
@@ -35,6 +40,11 @@ ID_SET_ENTITIES = ['integrations', 'scripts', 'playbooks', 'TestPlaybooks', 'Cla
                    'Dashboards', 'IncidentFields', 'IncidentTypes', 'IndicatorFields', 'IndicatorTypes',
                    'Layouts', 'Reports', 'Widgets', 'Mappers']
 
+ID_SET_MANIFEST_VERSION = 2
+
+# The reputation command of an indicator type, kept until the integrations which implement it are resolved.
+REPUTATION_COMMAND_KEY = 'reputation_command'
+
 BUILT_IN_FIELDS = [
     "name",
     "details",
@@ -71,58 +81,88 @@ BUILT_IN_FIELDS = [
     "id"
 ]
 
+# The number of times each content file was parsed by the current process.
+PARSE_CALLS: Counter = Counter()
+
+# The content files parsed by the current id_set task, shared by all the sections which process the task path.
+TASK_PARSED_FILES: Optional[dict] = None
+
 
-def build_tasks_graph(playbook_data):
+def parse_content_file(file_path: str) -> Tuple[dict, Optional[str]]:
     """
-    Builds tasks flow graph.
+    Loads a yml or json content file and counts the parse call in PARSE_CALLS.
 
     Args:
-        playbook_data (dict): playbook yml data.
+        file_path: The content file path.
 
     Returns:
-        DiGraph: all tasks of given playbook.
+        tuple. The file contents and the file type, as returned by get_dict_from_file.
     """
-    initial_task = playbook_data.get('starttaskid', '')
-    tasks = playbook_data.get('tasks', {})
+    if TASK_PARSED_FILES is not None and file_path in TASK_PARSED_FILES:
+        return TASK_PARSED_FILES[file_path]
+
+    data, file_type = get_dict_from_file(file_path)
+    if file_type in ('yml', 'json'):
+        PARSE_CALLS[file_path] += 1
+    if TASK_PARSED_FILES is not None:
+        TASK_PARSED_FILES[file_path] = data, file_type
+    return data, file_type
+
 
-    graph = networkx.DiGraph()
-    graph.add_node(initial_task, mandatory=True)  # add starting task as root of the direct graph
+class TasksGraph(NamedTuple):
+    reachable: Set[str]
+    mandatory: Set[str]
 
-    found_new_tasks = True
-    while found_new_tasks:
-        current_number_of_nodes = graph.number_of_nodes()
-        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
 
-        for leaf in leaf_nodes:
-            leaf_task = tasks.get(leaf)
-            leaf_mandatory = graph.nodes[leaf]['mandatory']
+def build_tasks_graph(playbook_data: dict, print_logs: bool = True) -> TasksGraph:
+    """
+    Builds the tasks flow graph of a playbook, visiting every task at most once per traversal.
+
+    A task is mandatory if it is reachable from the start task by a path of tasks which can't be skipped.
+
+    Args:
+        playbook_data (dict): playbook yml data.
+        print_logs (bool): whether to print warnings about missing tasks.
 
-            # In this case the playbook is invalid, starttaskid contains invalid task id.
-            if not leaf_task:
-                print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
+    Returns:
+        TasksGraph: the ids of the tasks reachable from the start task, and of the mandatory tasks.
+    """
+    initial_task = playbook_data.get('starttaskid', '')
+    tasks = playbook_data.get('tasks') or {}
+
+    if initial_task not in tasks and print_logs:
+        # In this case the playbook is invalid, starttaskid contains invalid task id.
+        print_warning(f'{playbook_data.get("id")}: No such task {initial_task} in playbook')
+
+    def traverse(only_mandatory: bool) -> Set[str]:
+        visited = {initial_task}
+        worklist = [initial_task]
+        while worklist:
+            task = tasks.get(worklist.pop())
+            if not task:
                 continue
 
-            leaf_next_tasks = sum(leaf_task.get('nexttasks', {}).values(), [])
+            for next_task_ids in (task.get('nexttasks') or {}).values():
+                for task_id in next_task_ids or []:
+                    if task_id in visited:
+                        continue
 
-            for task_id in leaf_next_tasks:
-                task = tasks.get(task_id)
-                if not task:
-                    print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
-                    continue
+                    next_task = tasks.get(task_id)
+                    if not next_task:
+                        if print_logs and not only_mandatory:
+                            print_warning(f'{playbook_data.get("id")}: No such task {task_id} in playbook')
+                        continue
 
-                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
-                mandatory = leaf_mandatory and not task.get('skipunavailable', False)
-                if task_id not in graph.nodes():
-                    graph.add_node(task_id, mandatory=mandatory)
-                else:
-                    # If task already in graph, update mandatory field.
-                    # If one of the paths to the task is mandatory - set as mandatory.
-                    graph.nodes[task_id]['mandatory'] = graph.nodes[task_id]['mandatory'] or mandatory
-                graph.add_edge(leaf, task_id)
+                    # If task can't be skipped and predecessor task is mandatory - the task is mandatory.
+                    if only_mandatory and next_task.get('skipunavailable', False):
+                        continue
+
+                    visited.add(task_id)
+                    worklist.append(task_id)
 
-        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
+        return visited
 
-    return graph
+    return TasksGraph(reachable=traverse(only_mandatory=False), mandatory=traverse(only_mandatory=True))
 
 
 def get_integration_commands(file_path):
@@ -135,7 +175,7 @@ def get_integration_commands(file_path):
     return cmd_list
 
 
-def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: networkx.DiGraph) -> tuple:
+def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: TasksGraph) -> tuple:
     implementing_ids = set()
     implementing_ids_skippable = set()
     tasks = data_dict.get('tasks', {})
@@ -144,12 +184,12 @@ def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph:
         task_details = task.get('task', {})
 
         enriched_id = task_details.get(param_to_enrich_by)
-        try:
-            skippable = not graph.nodes[task_id]['mandatory']
-        except KeyError:
+        if task_id not in graph.reachable:
             # if task id not in the graph - the task is unreachable.
             print_error(f'{data_dict["id"]}: task {task_id} is not connected')
             continue
+
+        skippable = task_id not in graph.mandatory
         if enriched_id:
             implementing_ids.add(enriched_id)
             if skippable:
@@ -179,19 +219,46 @@ def get_commands_from_playbook(data_dict: dict) -> tuple:
     return command_to_integration, list(command_to_integration_skippable)
 
 
+def get_package_script_code(package_path: str, yml_path: str, data_dictionary: dict) -> str:
+    """
+    Reads the code of a script or integration package using its already loaded yml.
+
+    Args:
+        package_path: The package directory.
+        yml_path: The package yml path.
+        data_dictionary: The package yml contents.
+
+    Returns:
+        str. The package code.
+
+    Raises:
+        ValueError: if the package yml has no script type, or an unknown one.
+    """
+    if find_type(yml_path, data_dictionary, 'yml') in (FileType.SCRIPT, FileType.TEST_SCRIPT):
+        code_type = data_dictionary.get('type')
+    else:
+        code_type = data_dictionary.get('script', {}).get('type')
+    if code_type not in TYPE_TO_EXTENSION:
+        raise ValueError(f'The script type of {yml_path} is {code_type}, expected one of: '
+                         f'{", ".join(TYPE_TO_EXTENSION)}')
+    code_path = Unifier.find_code_file(package_path.rstrip(os.sep), TYPE_TO_EXTENSION[code_type])
+    with io.open(code_path, 'r', encoding='utf-8') as code_file:
+        return code_file.read()
+
+
 def get_integration_api_modules(file_path, data_dictionary, is_unified_integration):
-    unifier = Unifier(os.path.dirname(file_path))
     if is_unified_integration:
         integration_script_code = data_dictionary.get('script', {}).get('script', '')
     else:
-        _, integration_script_code = unifier.get_script_or_integration_package_data()
+        integration_script_code = get_package_script_code(os.path.dirname(file_path), file_path, data_dictionary)
 
-    return unifier.check_api_module_imports(integration_script_code)[1]
+    return Unifier.check_api_module_imports(integration_script_code)[1]
 
 
-def get_integration_data(file_path):
+def get_integration_data(file_path, data_dictionary=None):
     integration_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = parse_content_file(file_path)[0]
 
     is_unified_integration = data_dictionary.get('script', {}).get('script', '') != '-'
 
@@ -365,9 +432,10 @@ def get_dependent_incident_and_indicator_fields(data_dictionary):
     return dependent_incident_fields, dependent_indicator_fields
 
 
-def get_playbook_data(file_path: str) -> dict:
+def get_playbook_data(file_path: str, data_dictionary: dict = None) -> dict:
     playbook_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = parse_content_file(file_path)[0]
     graph = build_tasks_graph(data_dictionary)
 
     id_ = data_dictionary.get('id', '-')
@@ -419,9 +487,10 @@ def get_playbook_data(file_path: str) -> dict:
     return {id_: playbook_data}
 
 
-def get_script_data(file_path, script_code=None):
+def get_script_data(file_path, script_code=None, data_dictionary=None):
     script_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = parse_content_file(file_path)[0]
     id_ = data_dictionary.get('commonfields', {}).get('id', '-')
     if script_code is None:
         script_code = data_dictionary.get('script', '')
@@ -516,9 +585,10 @@ def get_values_for_keys_recursively(json_object: dict, keys_to_search: list) ->
     return values
 
 
-def get_layout_data(path):
+def get_layout_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     layout = json_data.get('layout', {})
     name = layout.get('name', '-')
@@ -554,8 +624,9 @@ def get_layout_data(path):
     return {id_: data}
 
 
-def get_layoutscontainer_data(path):
-    json_data = get_json(path)
+def get_layoutscontainer_data(path, json_data=None):
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
     layouts_container_fields = ["group", "edit", "indicatorsDetails", "indicatorsQuickView", "quickView", "close",
                                 "details", "detailsV2", "mobile", "name"]
     data = OrderedDict({field: json_data[field] for field in layouts_container_fields if json_data.get(field)})
@@ -581,9 +652,10 @@ def get_layoutscontainer_data(path):
     return {id_: data}
 
 
-def get_incident_field_data(path, incidents_types_list):
+def get_incident_field_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     name = json_data.get('name', '')
@@ -601,8 +673,9 @@ def get_incident_field_data(path, incidents_types_list):
     if system_associated_types:
         all_associated_types = all_associated_types.union(set(system_associated_types))
 
+    # an associated 'all' type is resolved to all the incident types by resolve_incident_fields_types
     if 'all' in all_associated_types:
-        all_associated_types = [list(incident_type.keys())[0] for incident_type in incidents_types_list]
+        all_associated_types = {'all'}
 
     scripts = json_data.get('script')
     if scripts:
@@ -629,9 +702,10 @@ def get_incident_field_data(path, incidents_types_list):
     return {id_: data}
 
 
-def get_indicator_type_data(path, all_integrations):
+def get_indicator_type_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     name = json_data.get('details', '')
@@ -640,7 +714,6 @@ def get_indicator_type_data(path, all_integrations):
     reputation_command = json_data.get('reputationCommand')
     pack = get_pack_name(path)
     all_scripts = set()
-    associated_integrations = set()
 
     for field in ['reputationScriptName', 'enhancementScriptNames']:
         associated_scripts = json_data.get(field)
@@ -651,12 +724,6 @@ def get_indicator_type_data(path, all_integrations):
         if associated_scripts:
             all_scripts = all_scripts.union(set(associated_scripts))
 
-    for integration in all_integrations:
-        integration_name = next(iter(integration))
-        integration_commands = integration.get(integration_name).get('commands')
-        if integration_commands and reputation_command in integration_commands:
-            associated_integrations.add(integration_name)
-
     if name:
         data['name'] = name
     data['file_path'] = path
@@ -666,17 +733,19 @@ def get_indicator_type_data(path, all_integrations):
         data['fromversion'] = fromversion
     if pack:
         data['pack'] = pack
-    if associated_integrations:
-        data['integrations'] = list(associated_integrations)
+    # the integrations which implement the reputation command are resolved by resolve_indicator_types_integrations
+    if reputation_command:
+        data[REPUTATION_COMMAND_KEY] = reputation_command
     if all_scripts:
         data['scripts'] = list(all_scripts)
 
     return {id_: data}
 
 
-def get_incident_type_data(path):
+def get_incident_type_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     name = json_data.get('name', '')
@@ -703,9 +772,10 @@ def get_incident_type_data(path):
     return {id_: data}
 
 
-def get_classifier_data(path):
+def get_classifier_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     name = json_data.get('name', '')
@@ -736,9 +806,10 @@ def get_classifier_data(path):
     return {id_: data}
 
 
-def get_mapper_data(path):
+def get_mapper_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     name = json_data.get('name', '')
@@ -775,9 +846,10 @@ def get_mapper_data(path):
     return {id_: data}
 
 
-def get_general_data(path):
+def get_general_data(path, json_data=None):
     data = OrderedDict()
-    json_data = get_json(path)
+    if json_data is None:
+        json_data = parse_content_file(path)[0]
 
     id_ = json_data.get('id')
     brandname = json_data.get('brandName', '')
@@ -826,10 +898,11 @@ def process_integration(file_path: str, print_logs: bool) -> list:
     res = []
     try:
         if os.path.isfile(file_path):
-            if find_type(file_path) in (FileType.INTEGRATION, FileType.BETA_INTEGRATION):
+            data_dictionary, file_type = parse_content_file(file_path)
+            if find_type(file_path, data_dictionary, file_type) in (FileType.INTEGRATION, FileType.BETA_INTEGRATION):
                 if print_logs:
                     print(f'adding {file_path} to id_set')
-                res.append(get_integration_data(file_path))
+                res.append(get_integration_data(file_path, data_dictionary))
         else:
             # package integration
             package_name = os.path.basename(file_path)
@@ -850,17 +923,22 @@ def process_script(file_path: str, print_logs: bool) -> list:
     res = []
     try:
         if os.path.isfile(file_path):
-            if find_type(file_path) == FileType.SCRIPT:
+            data_dictionary, file_type = parse_content_file(file_path)
+            if find_type(file_path, data_dictionary, file_type) == FileType.SCRIPT:
                 if print_logs:
                     print(f'adding {file_path} to id_set')
-                res.append(get_script_data(file_path))
+                res.append(get_script_data(file_path, data_dictionary=data_dictionary))
         else:
             # package script
-            unifier = Unifier(file_path)
-            yml_path, code = unifier.get_script_or_integration_package_data()
+            _, yml_path = get_yml_paths_in_dir(file_path)
+            if not yml_path:
+                raise Exception(f'No yml files found in package path: {file_path}. '
+                                'Is this really a package dir?')
+            data_dictionary = parse_content_file(yml_path)[0]
+            code = get_package_script_code(file_path, yml_path, data_dictionary)
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_script_data(yml_path, script_code=code))
+            res.append(get_script_data(yml_path, script_code=code, data_dictionary=data_dictionary))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -871,10 +949,11 @@ def process_script(file_path: str, print_logs: bool) -> list:
 def process_playbook(file_path: str, print_logs: bool) -> list:
     res = []
     try:
-        if find_type(file_path) == FileType.PLAYBOOK:
+        data_dictionary, file_type = parse_content_file(file_path)
+        if find_type(file_path, data_dictionary, file_type) == FileType.PLAYBOOK:
             if print_logs:
                 print('adding {} to id_set'.format(file_path))
-            res.append(get_playbook_data(file_path))
+            res.append(get_playbook_data(file_path, data_dictionary))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -892,10 +971,11 @@ def process_classifier(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) in (FileType.CLASSIFIER, FileType.OLD_CLASSIFIER):
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) in (FileType.CLASSIFIER, FileType.OLD_CLASSIFIER):
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_classifier_data(file_path))
+            res.append(get_classifier_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -914,33 +994,34 @@ def process_dashboards(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.DASHBOARD:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.DASHBOARD:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_general_data(file_path))
+            res.append(get_general_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
     return res
 
 
-def process_incident_fields(file_path: str, print_logs: bool, incidents_types_list: list) -> list:
+def process_incident_fields(file_path: str, print_logs: bool) -> list:
     """
     Process a incident_fields JSON file
     Args:
         file_path: The file path from incident field folder
         print_logs: Whether to print logs to stdout.
-        incidents_types_list: List of all the incident types in the system.
 
     Returns:
         a list of incident field data.
     """
     res = []
     try:
-        if find_type(file_path) == FileType.INCIDENT_FIELD:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.INCIDENT_FIELD:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_incident_field_data(file_path, incidents_types_list))
+            res.append(get_incident_field_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -959,10 +1040,11 @@ def process_incident_types(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.INCIDENT_TYPE:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.INCIDENT_TYPE:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_incident_type_data(file_path))
+            res.append(get_incident_type_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -981,23 +1063,23 @@ def process_indicator_fields(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.INDICATOR_FIELD:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.INDICATOR_FIELD:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_general_data(file_path))
+            res.append(get_general_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
     return res
 
 
-def process_indicator_types(file_path: str, print_logs: bool, all_integrations: list) -> list:
+def process_indicator_types(file_path: str, print_logs: bool) -> list:
     """
     Process a indicator types JSON file
     Args:
         file_path: The file path from indicator type folder
         print_logs: Whether to print logs to stdout
-        all_integrations: The integrations section in the id set
 
     Returns:
         a list of indicator type data.
@@ -1005,10 +1087,12 @@ def process_indicator_types(file_path: str, print_logs: bool, all_integrations:
     res = []
     try:
         # ignore old reputations.json files
-        if not os.path.basename(file_path) == 'reputations.json' and find_type(file_path) == FileType.REPUTATION:
-            if print_logs:
-                print(f'adding {file_path} to id_set')
-            res.append(get_indicator_type_data(file_path, all_integrations))
+        if not os.path.basename(file_path) == 'reputations.json':
+            json_data, file_type = parse_content_file(file_path)
+            if find_type(file_path, json_data, file_type) == FileType.REPUTATION:
+                if print_logs:
+                    print(f'adding {file_path} to id_set')
+                res.append(get_indicator_type_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1028,10 +1112,11 @@ def process_layouts(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.LAYOUT:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.LAYOUT:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_layout_data(file_path))
+            res.append(get_layout_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1051,10 +1136,11 @@ def process_layoutscontainer(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.LAYOUTS_CONTAINER:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.LAYOUTS_CONTAINER:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_layoutscontainer_data(file_path))
+            res.append(get_layoutscontainer_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1074,10 +1160,11 @@ def process_reports(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.REPORT:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.REPORT:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_general_data(file_path))
+            res.append(get_general_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1097,10 +1184,11 @@ def process_widgets(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.WIDGET:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.WIDGET:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_general_data(file_path))
+            res.append(get_general_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1119,10 +1207,11 @@ def process_mappers(file_path: str, print_logs: bool) -> list:
     """
     res = []
     try:
-        if find_type(file_path) == FileType.MAPPER:
+        json_data, file_type = parse_content_file(file_path)
+        if find_type(file_path, json_data, file_type) == FileType.MAPPER:
             if print_logs:
                 print(f'adding {file_path} to id_set')
-            res.append(get_mapper_data(file_path))
+            res.append(get_mapper_data(file_path, json_data))
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1146,10 +1235,12 @@ def process_test_playbook_path(file_path: str, print_logs: bool) -> tuple:
     try:
         if print_logs:
             print(f'adding {file_path} to id_set')
-        if find_type(file_path) == FileType.TEST_SCRIPT:
-            script = get_script_data(file_path)
-        if find_type(file_path) == FileType.TEST_PLAYBOOK:
-            playbook = get_playbook_data(file_path)
+        data_dictionary, file_type = parse_content_file(file_path)
+        content_type = find_type(file_path, data_dictionary, file_type)
+        if content_type == FileType.TEST_SCRIPT:
+            script = get_script_data(file_path, data_dictionary=data_dictionary)
+        if content_type == FileType.TEST_PLAYBOOK:
+            playbook = get_playbook_data(file_path, data_dictionary)
     except Exception as exp:  # noqa
         print_error(f'failed to process {file_path}, Error: {str(exp)}')
         raise
@@ -1192,169 +1283,344 @@ def get_general_paths(path):
     return files
 
 
-def re_create_id_set(id_set_path: str = "./Tests/id_set.json", objects_to_create: list = None,  # noqa: C901
-                     print_logs: bool = True):
-    if objects_to_create is None:
-        objects_to_create = CONTENT_ENTITIES
+# The id_set sections by their processing order, each section is mapped to its content entity, its id_set key,
+# its processing function and the function which lists its content paths.
+ID_SET_SECTIONS: Dict[str, Tuple[str, str, Callable, Callable]] = OrderedDict([
+    ('Integrations', ('Integrations', 'integrations', process_integration, get_integrations_paths)),
+    ('Playbooks', ('Playbooks', 'playbooks', process_playbook, get_playbooks_paths)),
+    ('Scripts', ('Scripts', 'scripts', process_script, partial(get_general_paths, SCRIPTS_DIR))),
+    ('TestPlaybooks', ('TestPlaybooks', 'TestPlaybooks', process_test_playbook_path,
+                       partial(get_general_paths, TEST_PLAYBOOKS_DIR))),
+    ('Classifiers', ('Classifiers', 'Classifiers', process_classifier, partial(get_general_paths, CLASSIFIERS_DIR))),
+    ('Dashboards', ('Dashboards', 'Dashboards', process_dashboards, partial(get_general_paths, DASHBOARDS_DIR))),
+    ('IncidentTypes', ('IncidentTypes', 'IncidentTypes', process_incident_types,
+                       partial(get_general_paths, INCIDENT_TYPES_DIR))),
+    ('IncidentFields', ('IncidentFields', 'IncidentFields', process_incident_fields,
+                        partial(get_general_paths, INCIDENT_FIELDS_DIR))),
+    ('IndicatorFields', ('IndicatorFields', 'IndicatorFields', process_indicator_fields,
+                         partial(get_general_paths, INDICATOR_FIELDS_DIR))),
+    ('IndicatorTypes', ('IndicatorTypes', 'IndicatorTypes', process_indicator_types,
+                        partial(get_general_paths, INDICATOR_TYPES_DIR))),
+    ('Layouts', ('Layouts', 'Layouts', process_layouts, partial(get_general_paths, LAYOUTS_DIR))),
+    ('LayoutsContainers', ('Layouts', 'Layouts', process_layoutscontainer, partial(get_general_paths, LAYOUTS_DIR))),
+    ('Reports', ('Reports', 'Reports', process_reports, partial(get_general_paths, REPORTS_DIR))),
+    ('Widgets', ('Widgets', 'Widgets', process_widgets, partial(get_general_paths, WIDGETS_DIR))),
+    ('Mappers', ('Mappers', 'Mappers', process_mappers, partial(get_general_paths, MAPPERS_DIR))),
+])
+
+
+def process_content_path(task: tuple, print_logs: bool) -> tuple:
+    """
+    Processes a single content path in a pool worker, the path files are parsed once for all its sections.
 
-    start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
-
-    pool = Pool(processes=cpu_count() * 2)
+    Args:
+        task: A pair of the content path and the id_set section names to process it by.
+        print_logs: Whether to print logs to stdout.
 
-    print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
+    Returns:
+        tuple. The content path, the processing result of every section and the parse calls of every file.
+    """
+    global TASK_PARSED_FILES
+    path, sections = task
+    PARSE_CALLS.clear()
+    TASK_PARSED_FILES = {}
+    try:
+        results = [(section, ID_SET_SECTIONS[section][2](path, print_logs)) for section in sections]
+    finally:
+        TASK_PARSED_FILES = None
+
+    return path, results, dict(PARSE_CALLS)
+
+
+def print_parse_calls(parse_calls: Counter):
+    """
+    Prints the number of parse calls of the processed content files, and warns about files which were parsed
+    more than once.
+
+    Args:
+        parse_calls: The number of parse calls of every content file.
+    """
+    print(f'Parsed {len(parse_calls)} content files with {sum(parse_calls.values())} parse calls')
+    for file_path, count in sorted(parse_calls.items()):
+        if count > 1:
+            print_warning(f'{file_path} was parsed {count} times')
+
+
+def get_command_to_integrations(integration_list: list) -> dict:
+    """
+    Maps every integration command to the ids of the integrations which implement it.
+
+    Args:
+        integration_list: The integrations section of the id_set.
+
+    Returns:
+        dict. The command names mapped to a list of integration ids.
+    """
+    command_to_integrations: dict = {}
+    for integration in integration_list:
+        for integration_id, integration_data in integration.items():
+            for command in integration_data.get('commands', []):
+                integrations = command_to_integrations.setdefault(command, [])
+                if integration_id not in integrations:
+                    integrations.append(integration_id)
+    return command_to_integrations
+
+
+def resolve_indicator_types_integrations(indicator_types_list: list, integration_list: list) -> list:
+    """
+    Resolves the integrations of every indicator type by its reputation command.
 
-    with click.progressbar(length=len(objects_to_create), label="Progress of id set creation") as progress_bar:
-        if 'Integrations' in objects_to_create:
-            print_color("\nStarting iteration over Integrations", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_integration, print_logs=print_logs), get_integrations_paths()):
-                integration_list.extend(arr)
+    Args:
+        indicator_types_list: The indicator types entries, holding their reputation commands.
+        integration_list: The integrations section of the id_set.
 
-        progress_bar.update(1)
+    Returns:
+        list. New indicator types entries which hold the integrations implementing their reputation command.
+    """
+    command_to_integrations = get_command_to_integrations(integration_list)
+    resolved_indicator_types = []
+    for indicator_type in indicator_types_list:
+        resolved_indicator_type = OrderedDict()
+        for indicator_type_id, indicator_type_data in indicator_type.items():
+            data = OrderedDict()
+            for key, value in indicator_type_data.items():
+                if key != REPUTATION_COMMAND_KEY:
+                    data[key] = value
+                elif command_to_integrations.get(value):
+                    data['integrations'] = list(command_to_integrations[value])
+            resolved_indicator_type[indicator_type_id] = data
+        resolved_indicator_types.append(resolved_indicator_type)
+    return resolved_indicator_types
+
+
+def resolve_incident_fields_types(incident_fields_list: list, incident_types_list: list) -> list:
+    """
+    Resolves the incident types of the incident fields which are associated to all the incident types.
 
-        if 'Playbooks' in objects_to_create:
-            print_color("\nStarting iteration over Playbooks", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_playbook, print_logs=print_logs), get_playbooks_paths()):
-                playbooks_list.extend(arr)
+    Args:
+        incident_fields_list: The incident fields entries.
+        incident_types_list: The incident types section of the id_set.
 
-        progress_bar.update(1)
+    Returns:
+        list. The incident fields entries, where the 'all' incident type is replaced by all the incident types.
+    """
+    all_incident_types = [incident_type_id for incident_type in incident_types_list
+                          for incident_type_id in incident_type]
+    resolved_incident_fields = []
+    for incident_field in incident_fields_list:
+        resolved_incident_field = OrderedDict()
+        for incident_field_id, incident_field_data in incident_field.items():
+            if 'all' in incident_field_data.get('incident_types', []):
+                incident_field_data = OrderedDict(incident_field_data)
+                if all_incident_types:
+                    incident_field_data['incident_types'] = list(all_incident_types)
+                else:
+                    del incident_field_data['incident_types']
+            resolved_incident_field[incident_field_id] = incident_field_data
+        resolved_incident_fields.append(resolved_incident_field)
+    return resolved_incident_fields
 
-        if 'Scripts' in objects_to_create:
-            print_color("\nStarting iteration over Scripts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_script, print_logs=print_logs), get_general_paths(SCRIPTS_DIR)):
-                scripts_list.extend(arr)
 
-        progress_bar.update(1)
+def get_id_set_manifest_path(id_set_path: str) -> str:
+    """Returns the path of the manifest file which is kept next to the id_set output file."""
+    return f'{os.path.splitext(id_set_path)[0]}_manifest.json'
 
-        if 'TestPlaybooks' in objects_to_create:
-            print_color("\nStarting iteration over TestPlaybooks", LOG_COLORS.GREEN)
-            for pair in pool.map(partial(process_test_playbook_path, print_logs=print_logs),
-                                 get_general_paths(TEST_PLAYBOOKS_DIR)):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
 
-        progress_bar.update(1)
+def get_content_path_hash(path: str) -> str:
+    """
+    Calculates the content hash of a content path.
+    For a package directory the hash covers the names and contents of all the files in it,
+    as the extracted data relies on the package code and not only on the yml.
 
-        if 'Classifiers' in objects_to_create:
-            print_color("\nStarting iteration over Classifiers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_classifier, print_logs=print_logs), get_general_paths(CLASSIFIERS_DIR)):
-                classifiers_list.extend(arr)
+    Args:
+        path: A content file or package directory path.
 
-        progress_bar.update(1)
+    Returns:
+        str. The hex digest of the path content.
+    """
+    content_hash = hashlib.sha1()
+    if os.path.isfile(path):
+        with open(path, 'rb') as content_file:
+            content_hash.update(content_file.read())
+        return content_hash.hexdigest()
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(dir_name for dir_name in dirs if dir_name != '__pycache__')
+        for file_name in sorted(files):
+            if file_name.endswith('.pyc'):
+                continue
+            file_path = os.path.join(root, file_name)
+            content_hash.update(os.path.relpath(file_path, path).encode('utf-8'))
+            with open(file_path, 'rb') as content_file:
+                content_hash.update(content_file.read())
+    return content_hash.hexdigest()
 
-        if 'Dashboards' in objects_to_create:
-            print_color("\nStarting iteration over Dashboards", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_dashboards, print_logs=print_logs), get_general_paths(DASHBOARDS_DIR)):
-                dashboards_list.extend(arr)
 
-        progress_bar.update(1)
+def get_sdk_version() -> str:
+    try:
+        return get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        return ''
 
-        if 'IncidentTypes' in objects_to_create:
-            print_color("\nStarting iteration over Incident Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_incident_types, print_logs=print_logs),
-                                get_general_paths(INCIDENT_TYPES_DIR)):
-                incident_type_list.extend(arr)
 
-        progress_bar.update(1)
+class IDSetManifest:
+    """
+    The id_set manifest keeps the data which was extracted from every content path in the previous id_set creation,
+    keyed by the path and its content hash, so that only added or changed paths have to be processed again.
+
+    Attributes:
+        manifest_path (str): The path of the manifest file, the manifest is not persisted if empty.
+        previous_sections (dict): The sections loaded from the manifest file.
+        sections (dict): The sections of the current id_set creation.
+        reused (int): The number of paths which were reused from the manifest.
+        recomputed (int): The number of paths which were processed.
+    """
 
-        # Has to be called after 'IncidentTypes' is called
-        if 'IncidentFields' in objects_to_create:
-            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(
-                    partial(process_incident_fields, print_logs=print_logs, incidents_types_list=incident_type_list),
-                    get_general_paths(INCIDENT_FIELDS_DIR)):
-                incident_fields_list.extend(arr)
+    def __init__(self, manifest_path: str = '', full: bool = False):
+        self.manifest_path = manifest_path
+        self.previous_sections = {} if full else self.load()
+        self.sections: dict = {}
+        self.reused = 0
+        self.recomputed = 0
 
-        progress_bar.update(1)
+    def load(self) -> dict:
+        if not self.manifest_path or not os.path.isfile(self.manifest_path):
+            return {}
 
-        if 'IndicatorFields' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_indicator_fields, print_logs=print_logs),
-                                get_general_paths(INDICATOR_FIELDS_DIR)):
-                indicator_fields_list.extend(arr)
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError) as err:
+            print_warning(f'Could not load the id_set manifest {self.manifest_path}, '
+                          f'all the content files will be processed. Error: {err}')
+            return {}
 
-        progress_bar.update(1)
+        if manifest.get('version') != ID_SET_MANIFEST_VERSION or manifest.get('sdk_version') != get_sdk_version():
+            return {}
 
-        # Has to be called after 'Integrations' is called
-        if 'IndicatorTypes' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
-            for arr in pool.map(
-                    partial(process_indicator_types, print_logs=print_logs, all_integrations=integration_list),
-                    get_general_paths(INDICATOR_TYPES_DIR)):
-                indicator_types_list.extend(arr)
+        return manifest.get('sections', {})
 
-        progress_bar.update(1)
+    def save(self):
+        if not self.manifest_path:
+            return
 
-        if 'Layouts' in objects_to_create:
-            print_color("\nStarting iteration over Layouts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_layouts, print_logs=print_logs), get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
-            for arr in pool.map(partial(process_layoutscontainer, print_logs=print_logs),
-                                get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
+        # sections which were not created in this run are kept for the next runs
+        sections = dict(self.previous_sections)
+        sections.update(self.sections)
+        with open(self.manifest_path, 'w') as manifest_file:
+            json.dump({
+                'version': ID_SET_MANIFEST_VERSION,
+                'sdk_version': get_sdk_version(),
+                'sections': sections
+            }, manifest_file)
+
+    def lookup(self, section: str, path: str) -> Optional[dict]:
+        """
+        Looks up the result of a content path in the manifest.
+
+        Args:
+            section: The manifest section name.
+            path: The content path.
+
+        Returns:
+            dict. The manifest entry of the path if it was not changed since the previous run, otherwise None.
+        """
+        path_hash = get_content_path_hash(path)
+        previous_entry = self.previous_sections.get(section, {}).get(path)
+        current_section = self.sections.setdefault(section, {})
+        if previous_entry and previous_entry['hash'] == path_hash:
+            current_section[path] = previous_entry
+            self.reused += 1
+            return previous_entry
+
+        current_section[path] = {'hash': path_hash}
+        self.recomputed += 1
+        return None
+
+    def update(self, section: str, path: str, result):
+        self.sections[section][path]['result'] = result
 
-        progress_bar.update(1)
 
-        if 'Reports' in objects_to_create:
-            print_color("\nStarting iteration over Reports", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_reports, print_logs=print_logs), get_general_paths(REPORTS_DIR)):
-                reports_list.extend(arr)
+def re_create_id_set(id_set_path: str = "./Tests/id_set.json", objects_to_create: list = None,  # noqa: C901
+                     print_logs: bool = True, full: bool = False):
+    if objects_to_create is None:
+        objects_to_create = CONTENT_ENTITIES
 
-        progress_bar.update(1)
+    start_time = time.time()
+    manifest = IDSetManifest(get_id_set_manifest_path(id_set_path) if id_set_path else '', full=full)
 
-        if 'Widgets' in objects_to_create:
-            print_color("\nStarting iteration over Widgets", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_widgets, print_logs=print_logs), get_general_paths(WIDGETS_DIR)):
-                widgets_list.extend(arr)
+    print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
 
-        progress_bar.update(1)
+    sections_paths = OrderedDict((section, get_paths()) for section, (entity, _, _, get_paths)
+                                 in ID_SET_SECTIONS.items() if entity in objects_to_create)
+    results: dict = {section: {} for section in sections_paths}
+
+    # sections which share a content directory process the same paths, every path is a single task
+    path_sections: OrderedDict = OrderedDict()
+    for section, paths in sections_paths.items():
+        for path in paths:
+            entry = manifest.lookup(section, path)
+            if entry:
+                results[section][path] = entry['result']
+            else:
+                path_sections.setdefault(path, []).append(section)
+    tasks = list(path_sections.items())
+
+    processes = cpu_count() * 2
+    with click.progressbar(length=sum(len(paths) for paths in sections_paths.values()),
+                           label="Progress of id set creation") as progress_bar:
+        progress_bar.update(manifest.reused)
+        print_color(f"\nProcessing {len(tasks)} content files", LOG_COLORS.GREEN)
+
+        # All the content files are streamed through a single pool, the data which depends on
+        # other sections is resolved once all the files are processed.
+        parse_calls: Counter = Counter()
+        with Pool(processes=processes) as pool:
+            for path, path_results, task_parse_calls in pool.imap_unordered(
+                    partial(process_content_path, print_logs=print_logs), tasks,
+                    chunksize=max(1, len(tasks) // (processes * 4))):
+                for section, result in path_results:
+                    results[section][path] = result
+                    manifest.update(section, path, result)
+                parse_calls.update(task_parse_calls)
+                progress_bar.update(len(path_results))
 
-        if 'Mappers' in objects_to_create:
-            print_color("\nStarting iteration over Mappers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_mappers, print_logs=print_logs), get_general_paths(MAPPERS_DIR)):
-                mappers_list.extend(arr)
+    if print_logs:
+        print_parse_calls(parse_calls)
+
+    new_ids_dict: Dict[str, list] = OrderedDict((key, []) for key in [
+        'scripts', 'playbooks', 'integrations', 'TestPlaybooks', 'Classifiers', 'Dashboards', 'IncidentFields',
+        'IncidentTypes', 'IndicatorFields', 'IndicatorTypes', 'Layouts', 'Reports', 'Widgets', 'Mappers'])
+    for section, paths in sections_paths.items():
+        id_set_key = ID_SET_SECTIONS[section][1]
+        for path in paths:
+            if section == 'TestPlaybooks':
+                playbook, script = results[section][path]
+                if playbook:
+                    new_ids_dict['TestPlaybooks'].append(playbook)
+                if script:
+                    new_ids_dict['scripts'].append(script)
+            else:
+                new_ids_dict[id_set_key].extend(results[section][path])
 
-        progress_bar.update(1)
+    new_ids_dict['IncidentFields'] = resolve_incident_fields_types(new_ids_dict['IncidentFields'],
+                                                                   new_ids_dict['IncidentTypes'])
+    new_ids_dict['IndicatorTypes'] = resolve_indicator_types_integrations(new_ids_dict['IndicatorTypes'],
+                                                                          new_ids_dict['integrations'])
 
-    new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
     # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
-    new_ids_dict['Classifiers'] = sort(classifiers_list)
-    new_ids_dict['Dashboards'] = sort(dashboards_list)
-    new_ids_dict['IncidentFields'] = sort(incident_fields_list)
-    new_ids_dict['IncidentTypes'] = sort(incident_type_list)
-    new_ids_dict['IndicatorFields'] = sort(indicator_fields_list)
-    new_ids_dict['IndicatorTypes'] = sort(indicator_types_list)
-    new_ids_dict['Layouts'] = sort(layouts_list)
-    new_ids_dict['Reports'] = sort(reports_list)
-    new_ids_dict['Widgets'] = sort(widgets_list)
-    new_ids_dict['Mappers'] = sort(mappers_list)
+    for entries in new_ids_dict.values():
+        sort(entries)
 
     if id_set_path:
         with open(id_set_path, 'w+') as id_set_file:
             json.dump(new_ids_dict, id_set_file, indent=4)
+        manifest.save()
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
+    print_color(f'Reused {manifest.reused} entries from the id_set manifest, '
+                f'recomputed {manifest.recomputed} entries', LOG_COLORS.GREEN)
 
     duplicates = find_duplicates(new_ids_dict, print_logs)
     if any(duplicates) and print_logs:
@@ -1365,72 +1631,111 @@ def re_create_id_set(id_set_path: str = "./Tests/id_set.json", objects_to_create
     return new_ids_dict
 
 
-def find_duplicates(id_set, print_logs):
+class IDSetEntry(NamedTuple):
+    section: str
+    from_version: LooseVersion
+    to_version: LooseVersion
+    data: dict
+
+
+def build_id_set_index(id_set_sections: dict) -> Dict[str, List[IDSetEntry]]:
+    """
+    Groups the entries of the given id_set sections by their ids, parsing the version range of every entry once.
+
+    Args:
+        id_set_sections: The id_set sections to index, mapped by the section name.
+
+    Returns:
+        dict. Every id mapped to its entries in the given sections.
+    """
+    index: Dict[str, List[IDSetEntry]] = {}
+    for section, entries in id_set_sections.items():
+        for entry in entries or []:
+            for entry_id, data in entry.items():
+                index.setdefault(entry_id, []).append(IDSetEntry(
+                    section=section,
+                    from_version=LooseVersion(data.get('fromversion', '0.0.0')),
+                    to_version=LooseVersion(data.get('toversion', '99.99.99')),
+                    data=data
+                ))
+    return index
+
+
+def has_overlapping_versions(id_to_check: str, entries: List[IDSetEntry], object_type=None, print_logs=True) -> bool:
+    """
+    Checks whether the version ranges of entries which share the same id overlap,
+    by sorting the entries by their from version and sweeping over them.
+    Layouts of different kinds never overlap.
+
+    Args:
+        id_to_check: The id shared by the entries.
+        entries: The indexed entries of the id.
+        object_type: The id_set section of the entries.
+        print_logs: Whether to print a warning when the entries have different names.
+
+    Returns:
+        bool. Whether the entries are duplicates.
+    """
+    if len(entries) < 2:
+        return False
+
+    names = list(OrderedDict.fromkeys(entry.data.get('name') for entry in entries))
+    if print_logs and len(names) > 1:
+        print_warning('The following {} have the same ID ({}) but different names: {}.'.format(
+            object_type, id_to_check, ', '.join(f'"{name}"' for name in names)))
+
+    groups: Dict[str, List[IDSetEntry]] = {}
+    for entry in entries:
+        # Checks if the Layouts kind is different then they are not duplicates
+        group_key = entry.data.get('kind', '') if object_type == 'Layouts' else ''
+        groups.setdefault(group_key, []).append(entry)
+
+    for group in groups.values():
+        # Sorted by from version, and by descending to version for the same from version, so the result does not
+        # depend on the entries order - the stable sort keeps the to version order between equal from versions
+        sorted_entries = sorted(sorted(group, key=lambda group_entry: group_entry.to_version, reverse=True),
+                                key=lambda group_entry: group_entry.from_version)
+        max_to_version = None
+        for entry in sorted_entries:
+            # An empty version range (from version equal to the to version) overlaps the ranges which contain its
+            # version including their to version, and never extends the swept ranges
+            is_empty_range = entry.from_version == entry.to_version
+            if max_to_version is not None and (entry.from_version < max_to_version or
+                                               is_empty_range and entry.from_version <= max_to_version):
+                return True
+            if not is_empty_range and (max_to_version is None or entry.to_version > max_to_version):
+                max_to_version = entry.to_version
+
+    return False
+
+
+def get_duplicate_ids(index: Dict[str, List[IDSetEntry]], object_type=None, print_logs=True) -> list:
+    return [id_to_check for id_to_check, entries in index.items()
+            if has_overlapping_versions(id_to_check, entries, object_type, print_logs)]
+
+
+def find_duplicates(id_set, print_logs=True):
     lists_to_return = []
 
     for object_type in ID_SET_ENTITIES:
         if print_logs:
             print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
-        objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
-
-        dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(objects, id_to_check, object_type, print_logs):
-                dup_list.append(id_to_check)
-        lists_to_return.append(dup_list)
+        index = build_id_set_index({object_type: id_set.get(object_type)})
+        lists_to_return.append(get_duplicate_ids(index, object_type, print_logs))
 
     if print_logs:
         print_color("Checking diff for Incident and Indicator Fields", LOG_COLORS.GREEN)
 
-    fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = {list(field.keys())[0] for field in fields}
-
-    field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs):
-            field_list.append(field_to_check)
-    lists_to_return.append(field_list)
+    fields_index = build_id_set_index({'IncidentFields': id_set['IncidentFields'],
+                                       'IndicatorFields': id_set['IndicatorFields']})
+    lists_to_return.append(get_duplicate_ids(fields_index, 'Indicator and Incident Fields', print_logs))
 
     return lists_to_return
 
 
 def has_duplicate(id_set, id_to_check, object_type=None, print_logs=True):
-    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
-
-    if len(duplicates) < 2:
-        return False
-
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
-
-        if print_logs and dict1.get('name') != dict2.get('name'):
-            print_warning('The following {} have the same ID ({}) but different names: '
-                          '"{}", "{}".'.format(object_type, id_to_check, dict1.get('name'), dict2.get('name')))
-
-        # Checks if the Layouts kind is different then they are not duplicates
-        if object_type == 'Layouts':
-            if dict1.get('kind', '') != dict2.get('kind', ''):
-                return False
-
-        # A: 3.0.0 - 3.6.0
-        # B: 3.5.0 - 4.5.0
-        # C: 3.5.2 - 3.5.4
-        # D: 4.5.0 - 99.99.99
-        if any([
-            dict1_from_version <= dict2_from_version < dict1_to_version,  # will catch (B, C), (A, B), (A, C)
-            dict1_from_version < dict2_to_version <= dict1_to_version,  # will catch (B, C), (A, C)
-            dict2_from_version <= dict1_from_version < dict2_to_version,  # will catch (C, B), (B, A), (C, A)
-            dict2_from_version < dict1_to_version <= dict2_to_version,  # will catch (C, B), (C, A)
-        ]):
-            return True
-
-    return False
+    entries = build_id_set_index({object_type: [entry for entry in id_set if entry.get(id_to_check)]})
+    return has_overlapping_versions(id_to_check, entries.get(id_to_check, []), object_type, print_logs)
 
 
 def sort(data):
@@ -2,9 +2,10 @@ from demisto_sdk.commands.common.update_id_set import re_create_id_set
 
 
 class IDSetCreator:
-    def __init__(self, output: str = '', print_logs: bool = True):
+    def __init__(self, output: str = '', print_logs: bool = True, full: bool = False):
         self.output = output
         self.print_logs = print_logs
+        self.full = full
 
     def create_id_set(self):
-        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs)
+        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs, full=self.full)
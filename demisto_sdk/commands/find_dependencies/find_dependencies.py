@@ -1,12 +1,19 @@
 import glob
+import io
 import json
 import os
 import sys
+import time
+from collections import deque
+from itertools import starmap
+from multiprocessing import cpu_count, get_all_start_methods, get_context
+from typing import Optional, Set
 
 import click
 import networkx as nx
 from demisto_sdk.commands.common import constants
-from demisto_sdk.commands.common.tools import print_error
+from demisto_sdk.commands.common.id_set import IdSet, IdSetSection
+from demisto_sdk.commands.common.tools import print_error, print_warning
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
 
@@ -30,7 +37,46 @@ class VerboseFile:
         self.fd = None
 
 
-def parse_for_pack_metadata(dependency_graph, graph_root):
+class VerboseBuffer(VerboseFile):
+    """Collects dependency explanations in memory, to be written later to a VerboseFile."""
+
+    def __init__(self, enabled=False):
+        super().__init__()
+        self.fd = io.StringIO() if enabled else None
+
+    def getvalue(self):
+        return self.fd.getvalue() if self.fd else ''
+
+
+# The id set which the dependencies calculation workers inherit from the parent process when they are forked.
+_WORKER_ID_SET: Optional[dict] = None
+
+
+def calculate_first_level_dependencies(pack_id, exclude_ignored_dependencies=True, verbose=False):
+    """
+    Calculates a pack first level dependencies with the id set of the calculation workers.
+
+    Args:
+        pack_id (str): pack id, currently pack folder name is in use.
+        exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+        verbose (bool): Determines whether to collect the dependency explanations or not.
+
+    Returns:
+        tuple: the pack id, its first level dependencies or the ValueError which was raised while calculating them,
+        the dependency explanations and the calculation time in seconds.
+    """
+    start_time = time.time()
+    verbose_buffer = VerboseBuffer(verbose)
+    try:
+        dependencies = PackDependencies.get_first_level_dependencies(
+            pack_id, _WORKER_ID_SET, verbose_buffer, exclude_ignored_dependencies)
+    except ValueError as exp:
+        dependencies = exp
+
+    return pack_id, dependencies, verbose_buffer.getvalue(), time.time() - start_time
+
+
+def parse_for_pack_metadata(dependency_graph, graph_root, pack_display_names=None):
     """
     Parses calculated dependency graph and returns first and all level parsed dependency.
     Additionally returns list of displayed pack images of all graph levels.
@@ -38,18 +84,24 @@ def parse_for_pack_metadata(dependency_graph, graph_root):
     Args:
         dependency_graph (DiGraph): dependency direct graph.
         graph_root (str): graph root pack id.
+        pack_display_names (dict): cache of pack display names by pack id, shared by several graphs.
 
     Returns:
         dict: first level dependencies parsed data.
         list: all level pack dependencies ids (is used for displaying dependencies images).
 
     """
+    if pack_display_names is None:
+        pack_display_names = {}
+
     first_level_dependencies = {}
     parsed_dependency_graph = [(k, v) for k, v in dependency_graph.nodes(data=True) if
                                dependency_graph.has_edge(graph_root, k)]
 
     for dependency_id, additional_data in parsed_dependency_graph:
-        additional_data['display_name'] = find_pack_display_name(dependency_id)
+        if dependency_id not in pack_display_names:
+            pack_display_names[dependency_id] = find_pack_display_name(dependency_id)
+        additional_data['display_name'] = pack_display_names[dependency_id]
         first_level_dependencies[dependency_id] = additional_data
 
     all_level_dependencies = [n for n in dependency_graph.nodes if dependency_graph.in_degree(n) > 0]
@@ -145,7 +197,7 @@ class PackDependencies:
         Returns:
             list: collection of content pack items.
         """
-        return list(filter(lambda s: next(iter(s.values())).get('pack') == pack_id, items_list))
+        return list(IdSetSection.of(items_list).get_by_pack(pack_id))
 
     @staticmethod
     def _search_packs_by_items_names(items_names, items_list, exclude_ignored_dependencies=True):
@@ -164,9 +216,9 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
-        content_items = list(
-            filter(lambda s: list(s.values())[0].get('name', '') in items_names and 'pack' in list(s.values())[0],
-                   items_list))
+        id_set_section = IdSetSection.of(items_list)
+        content_items = [item for item_name in dict.fromkeys(items_names)
+                         for item in id_set_section.get_by_name(item_name) if 'pack' in next(iter(item.values()))]
 
         if content_items:
             pack_names = list(map(lambda s: next(iter(s.values()))['pack'], content_items))
@@ -194,13 +246,11 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
+        id_set_section = IdSetSection.of(items_list)
         for item_name in items_names:
-            item_possible_names = [item_name, f'incident_{item_name}', f'indicator_{item_name}', f'{item_name}-mapper']
-            for item_from_id_set in items_list:
-                machine_name = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                if (machine_name in item_possible_names or item_name == item_details.get('name')) \
-                        and item_details.get('pack') \
+            for item_from_id_set in id_set_section.get_by_name_or_id_alias(item_name):
+                item_details = next(iter(item_from_id_set.values()))
+                if item_details.get('pack') \
                         and (item_details['pack'] not in constants.IGNORED_DEPENDENCY_CALCULATION or
                              not exclude_ignored_dependencies):
                     packs.add(item_details.get('pack'))
@@ -219,9 +269,8 @@ class PackDependencies:
         Returns:
             set: pack id without ignored packs.
         """
-        integrations = list(
-            filter(lambda i: command in list(i.values())[0].get('commands', []) and 'pack' in list(i.values())[0],
-                   id_set['integrations']))
+        integrations = [integration for integration in IdSetSection.of(id_set['integrations']).get_by_command(command)
+                        if 'pack' in next(iter(integration.values()))]
 
         if integrations:
             pack_names = [next(iter(i.values()))['pack'] for i in integrations]
@@ -467,9 +516,10 @@ class PackDependencies:
             layout_dependencies = set()
 
             related_incident_and_indicator_types = layout_data.get('incident_and_indicator_types', [])
-            packs_found_from_incident_indicator_types = PackDependencies._search_packs_by_items_names(
-                related_incident_and_indicator_types, id_set['IncidentTypes'] + id_set['IndicatorTypes'],
-                exclude_ignored_dependencies)
+            packs_found_from_incident_indicator_types: Set[str] = set()
+            for section in ['IncidentTypes', 'IndicatorTypes']:
+                packs_found_from_incident_indicator_types.update(PackDependencies._search_packs_by_items_names(
+                    related_incident_and_indicator_types, id_set[section], exclude_ignored_dependencies) or set())
 
             if packs_found_from_incident_indicator_types:
                 pack_dependencies_data = PackDependencies. \
@@ -477,9 +527,10 @@ class PackDependencies:
                 layout_dependencies.update(pack_dependencies_data)
 
             related_incident_and_indicator_fields = layout_data.get('incident_and_indicator_fields', [])
-            packs_found_from_incident_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                related_incident_and_indicator_fields, id_set['IncidentFields'] + id_set['IndicatorFields'],
-                exclude_ignored_dependencies)
+            packs_found_from_incident_indicator_fields = set()
+            for section in ['IncidentFields', 'IndicatorFields']:
+                packs_found_from_incident_indicator_fields.update(PackDependencies._search_packs_by_items_names_or_ids(
+                    related_incident_and_indicator_fields, id_set[section], exclude_ignored_dependencies))
 
             if packs_found_from_incident_indicator_fields:
                 pack_dependencies_data = PackDependencies. \
@@ -913,44 +964,96 @@ class PackDependencies:
         return pack_dependencies
 
     @staticmethod
-    def build_dependency_graph(pack_id, id_set, verbose_file, exclude_ignored_dependencies=True):
+    def get_first_level_dependencies(pack_id, id_set, verbose_file, exclude_ignored_dependencies=True,
+                                     dependencies_cache=None):
+        """
+        Returns the first level dependencies of a pack, memoized per pack in dependencies_cache.
+
+        Args:
+            pack_id (str): pack id, currently pack folder name is in use.
+            id_set (dict): id set json.
+            verbose_file (VerboseFile): path to dependency explanations file.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            dependencies_cache (dict): the already calculated first level dependencies of packs.
+
+        Returns:
+            dict: dependency pack ids sorted and mapped to whether they are mandatory. A pack is mandatory if any of
+            the items which depend on it is mandatory.
+        """
+        if dependencies_cache is None:
+            dependencies_cache = {}
+
+        cache_key = (pack_id, exclude_ignored_dependencies)
+        if isinstance(dependencies_cache.get(cache_key), ValueError):
+            raise dependencies_cache[cache_key]
+
+        if cache_key not in dependencies_cache:
+            pack_dependencies: dict = {}
+            for dependency_name, is_mandatory in PackDependencies._find_pack_dependencies(
+                    pack_id, id_set, verbose_file=verbose_file,
+                    exclude_ignored_dependencies=exclude_ignored_dependencies):
+                pack_dependencies[dependency_name] = pack_dependencies.get(dependency_name, False) or is_mandatory
+            dependencies_cache[cache_key] = dict(sorted(pack_dependencies.items()))
+
+        return dependencies_cache[cache_key]
+
+    @staticmethod
+    def build_dependency_graph(pack_id, id_set, verbose_file, exclude_ignored_dependencies=True,
+                               dependencies_cache=None):
         """
         Builds all level of dependencies and returns dependency graph.
+        The graph is built breadth first, the first level dependencies of every pack are calculated once.
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
             id_set (dict): id set json.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            dependencies_cache (dict): the already calculated first level dependencies of packs, can be shared by
+                the graphs of several packs.
 
         Returns:
             DiGraph: all level dependencies of given pack.
         """
+        if dependencies_cache is None:
+            dependencies_cache = {}
+
         graph = nx.DiGraph()
         graph.add_node(pack_id)  # add pack id as root of the direct graph
-        found_new_dependencies = True
+        worklist = deque([pack_id])
 
-        while found_new_dependencies:
-            current_number_of_nodes = graph.number_of_nodes()
-            leaf_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0]
+        while worklist:
+            current_pack_id = worklist.popleft()
+            pack_dependencies = PackDependencies.get_first_level_dependencies(
+                current_pack_id, id_set, verbose_file, exclude_ignored_dependencies, dependencies_cache)
 
-            for leaf in leaf_nodes:
-                leaf_dependencies = PackDependencies._find_pack_dependencies(
-                    leaf, id_set, verbose_file=verbose_file, exclude_ignored_dependencies=exclude_ignored_dependencies)
+            for dependency_name, is_mandatory in pack_dependencies.items():
+                if dependency_name not in graph:
+                    graph.add_node(dependency_name, mandatory=is_mandatory)
+                    graph.add_edge(current_pack_id, dependency_name)
+                    worklist.append(dependency_name)
 
-                if leaf_dependencies:
-                    for dependency_name, is_mandatory in leaf_dependencies:
-                        if dependency_name not in graph.nodes():
-                            graph.add_node(dependency_name, mandatory=is_mandatory)
-                            graph.add_edge(leaf, dependency_name)
+        return graph
 
-            found_new_dependencies = graph.number_of_nodes() > current_number_of_nodes
+    @staticmethod
+    def get_id_set(id_set_path=''):
+        """
+        Loads the id set, or creates it if the given path does not exist.
 
-        return graph
+        Args:
+            id_set_path (str): id set json.
+
+        Returns:
+            IdSet: the id set.
+        """
+        if not id_set_path or not os.path.isfile(id_set_path):
+            return IdSet(IDSetCreator(print_logs=False).create_id_set())
+
+        return IdSet.load(id_set_path)
 
     @staticmethod
     def find_dependencies(pack_name, id_set_path='', exclude_ignored_dependencies=True, update_pack_metadata=True,
-                          silent_mode=False, debug_file_path=''):
+                          silent_mode=False, debug_file_path='', id_set=None, dependencies_cache=None):
         """
         Main function for dependencies search and pack metadata update.
 
@@ -961,21 +1064,21 @@ class PackDependencies:
             silent_mode (bool): Determines whether to echo the dependencies or not.
             update_pack_metadata (bool): Determines whether to update to pack metadata or not.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            id_set (dict): an already loaded id set, used instead of loading it from id_set_path.
+            dependencies_cache (dict): the already calculated first level dependencies of packs, can be shared by
+                several calls.
 
         Returns:
             Dict: first level dependencies of a given pack.
 
         """
-        if not id_set_path or not os.path.isfile(id_set_path):
-            id_set = IDSetCreator(print_logs=False).create_id_set()
-        else:
-            with open(id_set_path, 'r') as id_set_file:
-                id_set = json.load(id_set_file)
+        if id_set is None:
+            id_set = PackDependencies.get_id_set(id_set_path)
 
         with VerboseFile(debug_file_path) as verbose_file:
             dependency_graph = PackDependencies.build_dependency_graph(
                 pack_id=pack_name, id_set=id_set, verbose_file=verbose_file,
-                exclude_ignored_dependencies=exclude_ignored_dependencies)
+                exclude_ignored_dependencies=exclude_ignored_dependencies, dependencies_cache=dependencies_cache)
         first_level_dependencies, _ = parse_for_pack_metadata(dependency_graph, pack_name)
         if update_pack_metadata:
             update_pack_metadata_with_dependencies(pack_name, first_level_dependencies)
@@ -985,3 +1088,152 @@ class PackDependencies:
             dependency_result = json.dumps(first_level_dependencies, indent=4)
             click.echo(click.style(dependency_result, bold=True))
         return first_level_dependencies
+
+    @staticmethod
+    def calculate_packs_dependencies(pack_ids, id_set, exclude_ignored_dependencies=True, workers=1, verbose=False):
+        """
+        Calculates the first level dependencies of the given packs and of all the packs they depend on, round by round
+        on a pool of worker processes. The workers are forked after the id set is set, so they inherit it instead of
+        receiving it with every task.
+
+        Args:
+            pack_ids (list): pack ids, currently pack folder names are in use.
+            id_set (dict): id set json.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            workers (int): the number of worker processes, the packs are calculated in this process if it is 1 or if
+                processes can't be forked.
+            verbose (bool): Determines whether to collect the dependency explanations or not.
+
+        Returns:
+            dict: the dependencies cache to build the packs dependency graphs with.
+            dict: the dependency explanations of every calculated pack.
+            dict: the calculation time in seconds of every calculated pack.
+        """
+        global _WORKER_ID_SET
+        dependencies_cache: dict = {}
+        verbose_outputs = {}
+        calculation_times = {}
+        packs_to_calculate = sorted(set(pack_ids))
+
+        _WORKER_ID_SET = id_set
+        pool = get_context('fork').Pool(processes=workers) if workers > 1 and 'fork' in get_all_start_methods() \
+            else None
+        try:
+            map_function = pool.starmap if pool else starmap
+            while packs_to_calculate:
+                next_packs = set()
+                tasks = [(pack_id, exclude_ignored_dependencies, verbose) for pack_id in packs_to_calculate]
+                for pack_id, dependencies, verbose_output, calculation_time in map_function(
+                        calculate_first_level_dependencies, tasks):
+                    dependencies_cache[(pack_id, exclude_ignored_dependencies)] = dependencies
+                    verbose_outputs[pack_id] = verbose_output
+                    calculation_times[pack_id] = calculation_time
+                    if not isinstance(dependencies, ValueError):
+                        next_packs.update(dependencies)
+
+                packs_to_calculate = sorted(pack_id for pack_id in next_packs
+                                            if (pack_id, exclude_ignored_dependencies) not in dependencies_cache)
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+            _WORKER_ID_SET = None
+
+        return dependencies_cache, verbose_outputs, calculation_times
+
+    @staticmethod
+    def find_packs_dependencies(pack_names, id_set_path='', exclude_ignored_dependencies=True,
+                                update_pack_metadata=True, silent_mode=False, debug_file_path='', graph_output_path='',
+                                workers=cpu_count(), print_packs_results=True):
+        """
+        Calculates the dependencies of several packs in parallel, and updates their metadata one by one.
+
+        Args:
+            pack_names (list): pack ids, currently pack folder names are in use.
+            id_set_path (str): id set json.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            update_pack_metadata (bool): Determines whether to update the packs metadata or not.
+            silent_mode (bool): Determines whether to echo the dependencies or not.
+            debug_file_path (str): path to dependency explanations file.
+            graph_output_path (str): path to a json file to dump the packs dependency graph to.
+            workers (int): the number of worker processes to calculate the dependencies with.
+            print_packs_results (bool): Determines whether to echo the dependencies of every pack or only a summary.
+
+        Returns:
+            Dict: the first level dependencies of every pack, by pack id.
+
+        """
+        id_set = PackDependencies.get_id_set(id_set_path)
+        pack_ids = sorted(set(pack_names))
+        dependencies_cache, verbose_outputs, calculation_times = PackDependencies.calculate_packs_dependencies(
+            pack_ids, id_set, exclude_ignored_dependencies, workers, verbose=bool(debug_file_path))
+        pack_display_names: dict = {}
+        packs_dependencies = {}
+        dependency_graph_dump = {}
+
+        # the dependency explanations are written by pack order, regardless of the calculation order
+        with VerboseFile(debug_file_path) as verbose_file:
+            for pack_id in sorted(verbose_outputs):
+                verbose_file.write(verbose_outputs[pack_id], ending='')
+
+        for pack_id in pack_ids:
+            try:
+                dependency_graph = PackDependencies.build_dependency_graph(
+                    pack_id=pack_id, id_set=id_set, verbose_file=VerboseFile(),
+                    exclude_ignored_dependencies=exclude_ignored_dependencies,
+                    dependencies_cache=dependencies_cache)
+            except ValueError as exp:
+                if not silent_mode:
+                    print_warning(f'Skipping the {pack_id} pack: {exp}')
+                continue
+
+            first_level_dependencies, all_level_dependencies = parse_for_pack_metadata(
+                dependency_graph, pack_id, pack_display_names)
+            packs_dependencies[pack_id] = first_level_dependencies
+            dependency_graph_dump[pack_id] = {
+                'dependencies': first_level_dependencies,
+                'all_level_dependencies': sorted(all_level_dependencies),
+            }
+            if update_pack_metadata:
+                update_pack_metadata_with_dependencies(pack_id, first_level_dependencies)
+            if not silent_mode and print_packs_results:
+                click.echo(click.style(f"Found dependencies result for {pack_id} pack:", bold=True))
+                click.echo(click.style(json.dumps(first_level_dependencies, indent=4), bold=True))
+
+        if graph_output_path:
+            with open(graph_output_path, 'w') as graph_output_file:
+                json.dump(dependency_graph_dump, graph_output_file, indent=4)
+
+        if not silent_mode:
+            click.echo(click.style(f"Found dependencies result for {len(packs_dependencies)} packs", bold=True))
+            click.echo('Dependencies calculation time of the slowest packs:')
+            for pack_id, calculation_time in sorted(calculation_times.items(), key=lambda item: -item[1])[:10]:
+                click.echo(f'{pack_id}: {calculation_time:.2f} seconds')
+
+        return packs_dependencies
+
+    @staticmethod
+    def find_all_packs_dependencies(id_set_path='', exclude_ignored_dependencies=True, update_pack_metadata=True,
+                                    silent_mode=False, debug_file_path='', graph_output_path='', workers=cpu_count()):
+        """
+        Calculates the dependencies of all the content packs in one pass, every pack first level dependencies are
+        calculated once and are shared by the dependency graphs of all the packs which depend on it.
+
+        Args:
+            id_set_path (str): id set json.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            update_pack_metadata (bool): Determines whether to update the packs metadata or not.
+            silent_mode (bool): Determines whether to echo the dependencies or not.
+            debug_file_path (str): path to dependency explanations file.
+            graph_output_path (str): path to a json file to dump the packs dependency graph to.
+            workers (int): the number of worker processes to calculate the dependencies with.
+
+        Returns:
+            Dict: the first level dependencies of every pack, by pack id.
+
+        """
+        pack_ids = [os.path.basename(os.path.dirname(metadata_path)) for metadata_path in find_pack_path('*')]
+        return PackDependencies.find_packs_dependencies(
+            pack_ids, id_set_path=id_set_path, exclude_ignored_dependencies=exclude_ignored_dependencies,
+            update_pack_metadata=update_pack_metadata, silent_mode=silent_mode, debug_file_path=debug_file_path,
+            graph_output_path=graph_output_path, workers=workers, print_packs_results=False)
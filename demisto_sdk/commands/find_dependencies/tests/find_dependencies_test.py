@@ -865,3 +865,54 @@ class TestDependencyGraph:
         assert root_of_graph == pack_name
         assert len(pack_dependencies) > 0
         assert 'NonSupported' in pack_dependencies
+
+    def test_build_dependency_graph_memoized(self, id_set, mocker):
+        """
+        Given
+            - A pack name which has transitive dependencies.
+        When
+            - Building the dependency graph of the pack twice with a shared dependencies cache.
+        Then
+            - Ensure the dependencies of every pack in the graph are calculated exactly once.
+        """
+        pack_name = "ImpossibleTraveler"
+        find_pack_dependencies = mocker.spy(PackDependencies, '_find_pack_dependencies')
+        dependencies_cache: dict = {}
+
+        found_graph = PackDependencies.build_dependency_graph(pack_id=pack_name,
+                                                              id_set=id_set,
+                                                              verbose_file=VerboseFile(),
+                                                              dependencies_cache=dependencies_cache)
+        PackDependencies.build_dependency_graph(pack_id=pack_name,
+                                                id_set=id_set,
+                                                verbose_file=VerboseFile(),
+                                                dependencies_cache=dependencies_cache)
+        calculated_packs = [call[0][0] for call in find_pack_dependencies.call_args_list]
+
+        assert sorted(calculated_packs) == sorted(found_graph.nodes)
+
+    def test_calculate_packs_dependencies_in_parallel(self, id_set):
+        """
+        Given
+            - Pack names which have transitive dependencies.
+        When
+            - Calculating their dependencies on a pool of worker processes and in the current process.
+        Then
+            - Ensure the same dependencies and explanations are found for the packs and all the packs they depend on.
+            - Ensure the calculation time of every calculated pack is reported.
+        """
+        pack_names = ["ImpossibleTraveler", "Expanse"]
+
+        parallel_results = PackDependencies.calculate_packs_dependencies(pack_names, id_set, workers=2, verbose=True)
+        sequential_results = PackDependencies.calculate_packs_dependencies(pack_names, id_set, workers=1,
+                                                                           verbose=True)
+        dependencies_cache, verbose_outputs, calculation_times = parallel_results
+        found_graph = PackDependencies.build_dependency_graph(pack_id="ImpossibleTraveler",
+                                                              id_set=id_set,
+                                                              verbose_file=VerboseFile(),
+                                                              dependencies_cache=dependencies_cache)
+
+        assert parallel_results[:2] == sequential_results[:2]
+        assert set(found_graph.nodes) <= set(calculation_times)
+        assert set(calculation_times) == set(verbose_outputs)
+        assert all('# Pack ID: ' in verbose_outputs[pack_name] for pack_name in pack_names)
@@ -1,7 +1,7 @@
 # STD python packages
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
 # Third party packages
 # Local imports
@@ -26,7 +26,7 @@ def get_python_exec(py_num: float) -> str:
     return f"python{py_str}"
 
 
-def build_flake8_command(files: List[Path], py_num: float) -> str:
+def build_flake8_command(files: Sequence[Path], py_num: float) -> str:
     """ Build command for executing flake8 lint check
         https://flake8.pycqa.org/en/latest/user/invocation.html
     Args:
@@ -45,11 +45,12 @@ def build_flake8_command(files: List[Path], py_num: float) -> str:
     return command
 
 
-def build_bandit_command(files: List[Path]) -> str:
+def build_bandit_command(files: Sequence[Path], json_report: bool = False) -> str:
     """ Build command for executing bandit lint check
         https://github.com/PyCQA/bandit
     Args:
         files(List(Path)):  files to execute lint
+        json_report(bool): Whether to report the issues of every file in json, to lint the files of many packages
 
     Returns:
         str: bandit command
@@ -65,9 +66,14 @@ def build_bandit_command(files: List[Path]) -> str:
     command += f" --exclude={','.join(excluded_files)}"
     # only show output in the case of an error
     command += " -q"
-    # Generating path pattrens - path1,path2,path3,..
     files_list = [str(item) for item in files]
-    command += f" -r {','.join(files_list)}"
+    if json_report:
+        command += " -f json"
+        # Generating path pattrens - path1 path2 path3 ..
+        command += " " + " ".join(files_list)
+    else:
+        # Generating path pattrens - path1,path2,path3,..
+        command += f" -r {','.join(files_list)}"
 
     return command
 
@@ -1,5 +1,6 @@
 # STD python packages
 import io
+import json
 import logging
 import os
 import re
@@ -7,10 +8,11 @@ import shlex
 import shutil
 import tarfile
 import textwrap
+import threading
 from contextlib import contextmanager
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Union
+from typing import (Callable, Dict, Iterable, List, Optional, Sequence, Set,
+                    Tuple, Union)
 
 # Third party packages
 import docker
@@ -19,8 +21,10 @@ import git
 import requests
 # Local packages
 from demisto_sdk.commands.common.constants import TYPE_PWSH, TYPE_PYTHON
-from demisto_sdk.commands.common.tools import print_warning, run_command_os
+from demisto_sdk.commands.common.tools import (get_cache_dir, print_warning,
+                                               run_command_os)
 from docker.models.containers import Container
+from docker.models.images import Image
 
 # Python2 requirements
 PYTHON2_REQ = ["flake8", "vulture"]
@@ -50,6 +54,28 @@ PY_CHCEKS = ["flake8", "bandit", "mypy", "vulture", "pytest", "pylint"]
 # Line break
 RL = '\n'
 
+# The environment variable and labels of docker images which hold the python version of the image
+PYTHON_VERSION_ENV_VAR = 'PYTHON_VERSION'
+PYTHON_VERSION_LABELS = ['python_version', 'python.version']
+# The default python version, when the python version of a docker image could not be found
+DEFAULT_PYTHON_VERSION = 2.7
+
+# The maximal number of files which a host linter is executed on at once, for the lint files of many packages
+HOST_LINT_BATCH_SIZE = 500
+
+# The number of packages checked in a pooled container before it is replaced by a new container
+POOL_CONTAINER_MAX_USES = 10
+# The working directory of the test images, which the packages are copied into
+CONTAINER_WORKDIR = '/devwork'
+
+# The python versions of the docker images by image name, resolved once per process by a lock of every image
+_PYTHON_VERSIONS: Dict[str, float] = {}
+_PYTHON_VERSIONS_LOCKS: Dict[str, threading.Lock] = {}
+_PYTHON_VERSIONS_LOCK = threading.Lock()
+# The python versions caches of this process by cache path, see get_python_versions_cache
+_PYTHON_VERSIONS_CACHES: Dict[str, 'PythonVersionsCache'] = {}
+_PYTHON_VERSIONS_CACHES_LOCK = threading.Lock()
+
 logger = logging.getLogger('demisto-sdk')
 
 
@@ -258,9 +284,76 @@ def add_tmp_lint_files(content_repo: git.Repo, pack_path: Path, lint_files: List
         pass
 
 
-@lru_cache(maxsize=100)
+class PythonVersionsCache:
+    """
+    The python versions of docker images by image id, kept on disk so following runs do not resolve them again. The id
+    of an image is the digest of its content, so its python version never changes.
+
+    Attributes:
+        cache_path (str): The path of the file the python versions are kept in.
+        python_versions (dict): The python version of every docker image, by image id.
+    """
+
+    def __init__(self, cache_path: str = ''):
+        self.cache_path = cache_path or os.path.join(get_cache_dir('lint'), 'python_versions.json')
+        self.python_versions = self.load()
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, image_id: str) -> Optional[float]:
+        return self.python_versions.get(image_id)
+
+    def set(self, image_id: str, python_version: float):
+        """Keeps the python version of a docker image, along with the versions other processes saved meanwhile."""
+        with self._lock:
+            self.python_versions = {**self.load(), **self.python_versions, image_id: python_version}
+            temp_path = f'{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(temp_path, 'w') as cache_file:
+                    json.dump(self.python_versions, cache_file)
+                os.replace(temp_path, self.cache_path)
+            except OSError as err:
+                print_warning(f'Could not save the python versions to the cache {self.cache_path}. Error: {err}')
+
+
+def get_python_versions_cache() -> PythonVersionsCache:
+    """Returns the python versions cache of this process, so its lock covers all the threads which save to it."""
+    cache_path = os.path.join(get_cache_dir('lint'), 'python_versions.json')
+    with _PYTHON_VERSIONS_CACHES_LOCK:
+        if cache_path not in _PYTHON_VERSIONS_CACHES:
+            _PYTHON_VERSIONS_CACHES[cache_path] = PythonVersionsCache(cache_path)
+        return _PYTHON_VERSIONS_CACHES[cache_path]
+
+
 def get_python_version_from_image(image: str) -> float:
-    """ Get python version from docker image
+    """ Get python version from docker image, once per image in every process.
+
+    Args:
+        image(str): Docker image id or name
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..)
+    """
+    with _PYTHON_VERSIONS_LOCK:
+        image_lock = _PYTHON_VERSIONS_LOCKS.setdefault(image, threading.Lock())
+
+    # concurrent lints of packages with the same image wait for the first one to resolve its python version
+    with image_lock:
+        if image not in _PYTHON_VERSIONS:
+            _PYTHON_VERSIONS[image] = resolve_python_version_from_image(image)
+        return _PYTHON_VERSIONS[image]
+
+
+def resolve_python_version_from_image(image: str) -> float:
+    """ Resolve the python version of a docker image from its metadata, which is pulled if the image is not found
+    locally. A container of the image is run only if its metadata does not hold the python version.
 
     Args:
         image(str): Docker image id or name
@@ -269,8 +362,79 @@ def get_python_version_from_image(image: str) -> float:
         float: Python version X.Y (3.7, 3.6, ..)
     """
     docker_client = docker.from_env()
-    py_num = 2.7
-    # Run two times
+    try:
+        image_obj = get_docker_image(docker_client, image)
+    except docker.errors.APIError as err:
+        logger.debug(f'Could not get the docker image {image}, running it to get its python version. Error: {err}')
+        return get_python_version_from_container(docker_client, image) or DEFAULT_PYTHON_VERSION
+
+    python_versions_cache = get_python_versions_cache()
+    py_num = python_versions_cache.get(image_obj.id)
+    if py_num:
+        return py_num
+
+    py_num = get_python_version_from_image_attrs(image_obj.attrs)
+    if not py_num:
+        logger.debug(f'The python version of the docker image {image} is not in its metadata, running it to get it')
+        py_num = get_python_version_from_container(docker_client, image)
+    if not py_num:
+        return DEFAULT_PYTHON_VERSION
+
+    python_versions_cache.set(image_obj.id, py_num)
+    return py_num
+
+
+def get_docker_image(docker_client: docker.DockerClient, image: str) -> Image:
+    """ Get a docker image, pulling it if it is not found locally.
+
+    Args:
+        docker_client(docker.DockerClient): The docker client
+        image(str): Docker image id or name
+
+    Returns:
+        Image: The docker image
+    """
+    try:
+        return docker_client.images.get(image)
+    except docker.errors.ImageNotFound:
+        # the tag is after the last colon, unless the colon is of the registry port, e.g. localhost:5000/image
+        repository, _, tag = image.rpartition(':') if ':' in image.rsplit('/', 1)[-1] else (image, '', 'latest')
+        return docker_client.images.pull(repository, tag=tag)
+
+
+def get_python_version_from_image_attrs(image_attrs: dict) -> Optional[float]:
+    """ Get python version from the environment variables or the labels of a docker image.
+
+    Args:
+        image_attrs(dict): The attributes of the docker image, as returned by the docker images API
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..), or None if the image metadata does not hold it
+    """
+    image_config = image_attrs.get('Config') or {}
+    env_vars = dict(env_var.split('=', 1) for env_var in image_config.get('Env') or [] if '=' in env_var)
+    labels = image_config.get('Labels') or {}
+    python_versions = [env_vars.get(PYTHON_VERSION_ENV_VAR)] + [labels.get(label) for label in PYTHON_VERSION_LABELS]
+    for python_version in python_versions:
+        match = re.match(r'(\d+\.\d+)', python_version or '')
+        if match:
+            return float(match.group(1))
+
+    return None
+
+
+def get_python_version_from_container(docker_client: docker.DockerClient, image: str) -> Optional[float]:
+    """ Get python version from docker image by running python in a container of the image
+
+    Args:
+        docker_client(docker.DockerClient): The docker client
+        image(str): Docker image id or name
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..), or None if it could not be found
+    """
+    py_num = None
+    # Try two times
     for _ in range(2):
         try:
             command = "python -c \"import sys; print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))\""
@@ -283,9 +447,9 @@ def get_python_version_from_image(image: str) -> float:
             # Wait for container to finish
             container_obj.wait(condition="exited")
             # Get python version
-            py_num = container_obj.logs()
-            if isinstance(py_num, bytes):
-                py_num = float(py_num)
+            logs = container_obj.logs()
+            if isinstance(logs, bytes):
+                py_num = float(logs)
             else:
                 raise docker.errors.ContainerError
             for _ in range(2):
@@ -295,12 +459,288 @@ def get_python_version_from_image(image: str) -> float:
                     break
                 except docker.errors.APIError:
                     pass
+            break
         except (docker.errors.APIError, docker.errors.ContainerError):
             continue
 
     return py_num
 
 
+class BatchedHostLints:
+    """
+    The results of the host linters which were executed once for the lint files of all the packages, split back per
+    file - a package whose files have no batched results runs the host linters by itself.
+
+    Attributes:
+        flake8_outputs (dict): The flake8 output of every linted file, by the python executable and the file path.
+        bandit_passed_files (set): The files bandit found no issues and no errors in.
+    """
+
+    def __init__(self):
+        self.flake8_outputs: Dict[str, Dict[str, str]] = {}
+        self.bandit_passed_files: Set[str] = set()
+
+    def add_flake8_results(self, python_exec: str, files: Sequence[Path], stdout: str) -> bool:
+        """ Split the flake8 output of files, in its default format of 'path:row:col: code message' lines
+
+        Args:
+            python_exec(str): The python executable flake8 was executed by.
+            files(list): The linted files.
+            stdout(str): The flake8 output.
+
+        Returns:
+            bool. False if the output lines couldn't be matched to the linted files, so the results were not added.
+        """
+        outputs: Dict[str, List[str]] = {str(file): [] for file in files}
+        # the longest paths first, so a path which prefixes another path does not match its lines
+        paths = sorted(outputs, key=len, reverse=True)
+        file_output: Optional[List[str]] = None
+        for line in stdout.splitlines(keepends=True):
+            matched_path = next((path for path in paths if line.startswith(f'{path}:')), None)
+            if matched_path:
+                file_output = outputs[matched_path]
+            elif file_output is None:
+                return False
+            # lines which don't start with a path, such as the shown source, belong to the previous error
+            file_output.append(line)
+
+        self.flake8_outputs.setdefault(python_exec, {}).update(
+            {path: ''.join(lines) for path, lines in outputs.items()})
+        return True
+
+    def get_flake8_output(self, python_exec: str, files: Sequence[Path]) -> Optional[str]:
+        """ Get the batched flake8 output of files
+
+        Returns:
+            str. The flake8 output of the files, None if flake8 wasn't executed on all of them at once.
+        """
+        outputs = self.flake8_outputs.get(python_exec, {})
+        if not all(str(file) in outputs for file in files):
+            return None
+
+        return ''.join(outputs[str(file)] for file in files)
+
+    def add_bandit_results(self, files: Sequence[Path], stdout: str) -> bool:
+        """ Find the files bandit found no issues and no errors in, by its json report
+
+        Args:
+            files(list): The linted files.
+            stdout(str): The bandit json report.
+
+        Returns:
+            bool. False if the report couldn't be parsed, so the results were not added.
+        """
+        try:
+            report = json.loads(stdout)
+            failed_files = {issue['filename'] for issue in report['results'] + report['errors']}
+        except (ValueError, KeyError, TypeError):
+            return False
+
+        self.bandit_passed_files.update(str(file) for file in files if str(file) not in failed_files)
+        return True
+
+    def is_bandit_passed(self, files: Sequence[Path]) -> bool:
+        return bool(files) and all(str(file) in self.bandit_passed_files for file in files)
+
+
+class SharedTestImages:
+    """
+    The test images shared by the packages which are linted in different threads. Every test image is created once,
+    by the first package which requires it, while the other packages which require it wait for it behind its lock, and
+    it is released after the last package which requires it finished.
+
+    Attributes:
+        images (dict): The created test images, by test image name.
+        consumers (dict): The number of packages which still require every test image, by test image name.
+    """
+
+    def __init__(self):
+        self.images: Dict[str, str] = {}
+        self.consumers: Dict[str, int] = {}
+        self._images_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, image_name: str):
+        """Registers a package which requires the test image, so it is kept until the package releases it."""
+        with self._lock:
+            self.consumers[image_name] = self.consumers.get(image_name, 0) + 1
+
+    def get_image(self, image_name: str, create_image: Callable[[], Tuple[str, str]]) -> Tuple[str, str]:
+        """ Get the test image, and create it if no other package created it yet.
+
+        Args:
+            image_name(str): The name of the test image.
+            create_image(Callable): Creates the test image, and returns its name and the creation errors.
+
+        Returns:
+            str, str. The test image name and the creation errors - an image which failed to be created is created
+             again by the next package which requires it.
+        """
+        with self._lock:
+            image_lock = self._images_locks.setdefault(image_name, threading.Lock())
+        with image_lock:
+            if image_name in self.images:
+                return self.images[image_name], ""
+            image, errors = create_image()
+            if not errors:
+                self.images[image_name] = image
+
+            return image, errors
+
+    def release(self, image_name: str) -> bool:
+        """ Releases the test image for a package which finished using it.
+
+        Returns:
+            bool. True if it was the last package which required the test image, which is no longer kept.
+        """
+        with self._lock:
+            consumers = self.consumers.get(image_name, 0) - 1
+            if consumers > 0:
+                self.consumers[image_name] = consumers
+                return False
+
+            self.consumers.pop(image_name, None)
+            self.images.pop(image_name, None)
+            self._images_locks.pop(image_name, None)
+            return True
+
+
+class ContainersPool:
+    """
+    Long lived containers of the test images, shared by the packages linted in different threads - a package acquires
+    an idle container of its test image, copies itself into the working directory and executes its checks in it, and
+    the container is reused by the next package once the working directory is wiped.
+
+    Attributes:
+        max_containers (int): The maximal number of containers, of all the test images.
+        max_uses (int): The number of packages checked in a container before it is replaced by a new container.
+        closed (bool): Whether the pool was shut down.
+    """
+
+    def __init__(self, max_containers: int, max_uses: int = POOL_CONTAINER_MAX_USES):
+        self.max_containers = max(max_containers, 1)
+        self.max_uses = max_uses
+        self.closed = False
+        # The idle containers by test image name
+        self._idle_containers: Dict[str, List[Container]] = {}
+        # All the containers of the pool, and the number of packages checked in them
+        self._containers: Dict[str, Container] = {}
+        self._uses: Dict[str, int] = {}
+        self._containers_images: Dict[str, str] = {}
+        # The number of containers of the pool, including the containers which are being started
+        self._containers_count = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, image: str, start_container: Callable[[], Container]) -> Container:
+        """ Acquire an idle container of the test image - a new container is started if the pool isn't full, otherwise
+            an idle container of another test image is replaced, or the package waits for a released container.
+
+        Args:
+            image(str): The test image name.
+            start_container(Callable): Starts a new container of the test image.
+
+        Returns:
+            Container: The acquired container.
+
+        Raises:
+            APIError: If the pool was shut down, or the container failed to start.
+        """
+        replaced_container: Optional[Container] = None
+        with self._condition:
+            while True:
+                if self.closed:
+                    raise docker.errors.APIError("The containers pool was shut down")
+                if self._idle_containers.get(image):
+                    return self._idle_containers[image].pop()
+                if self._containers_count < self.max_containers:
+                    break
+                replaced_container = next((containers.pop() for containers in self._idle_containers.values()
+                                           if containers), None)
+                if replaced_container:
+                    self._forget(replaced_container)
+                    break
+                self._condition.wait()
+            self._containers_count += 1
+
+        if replaced_container:
+            self._remove(replaced_container)
+        try:
+            container = start_container()
+        except Exception:
+            with self._condition:
+                self._containers_count -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._containers[container.id] = container
+            self._uses[container.id] = 0
+            self._containers_images[container.id] = image
+            closed = self.closed
+        if closed:
+            self.release(container, failed=True)
+            raise docker.errors.APIError("The containers pool was shut down")
+
+        return container
+
+    def release(self, container: Container, failed: bool = False):
+        """ Release a container after a package was checked in it - the working directory is wiped and the container
+            is reused, unless it failed, was used max_uses times or the pool was shut down.
+
+        Args:
+            container(Container): The released container.
+            failed(bool): Whether running the package checks in the container failed.
+        """
+        with self._condition:
+            if container.id not in self._containers:
+                # The container was already removed by shut down
+                return
+            self._uses[container.id] += 1
+            reuse = not failed and not self.closed and self._uses[container.id] < self.max_uses
+        if reuse:
+            try:
+                exit_code, _ = container.exec_run(cmd=['find', CONTAINER_WORKDIR, '-mindepth', '1', '-delete'],
+                                                  user='root')
+                reuse = exit_code == 0
+            except docker.errors.APIError:
+                reuse = False
+
+        with self._condition:
+            if reuse and not self.closed:
+                self._idle_containers.setdefault(self._containers_images[container.id], []).append(container)
+                self._condition.notify()
+                return
+            self._forget(container)
+        self._remove(container)
+
+    def shutdown(self):
+        """Remove all the containers of the pool, including the containers which are used by packages."""
+        with self._condition:
+            self.closed = True
+            containers = list(self._containers.values())
+            for container in containers:
+                self._forget(container)
+            self._idle_containers.clear()
+            self._condition.notify_all()
+        for container in containers:
+            self._remove(container)
+
+    def _forget(self, container: Container):
+        """Stop tracking a container which is about to be removed, expected to be called under the pool lock."""
+        if self._containers.pop(container.id, None) is not None:
+            self._containers_count -= 1
+        self._uses.pop(container.id, None)
+        self._containers_images.pop(container.id, None)
+        self._condition.notify()
+
+    @staticmethod
+    def _remove(container: Container):
+        try:
+            container.remove(force=True)
+        except (docker.errors.NotFound, docker.errors.APIError) as e:
+            logger.debug(f"Unable to remove pool container {container.id} - {e}")
+
+
 def get_file_from_container(container_obj: Container, container_path: str, encoding: str = "") -> Union[str, bytes]:
     """ Copy file from container.
 
@@ -344,12 +784,11 @@ def copy_dir_to_container(container_obj: Container, host_path: Path, container_p
     """
     excluded_regex = "(__init__.py|.*.back)"
     file_like_object = io.BytesIO()
-    old_cwd = os.getcwd()
+    # The directory is added by its path rather than by changing the working directory, as packages are copied from
+    # different threads
     with tarfile.open(fileobj=file_like_object, mode='w:gz') as archive:
-        os.chdir(host_path)
-        archive.add('.', recursive=True, filter=lambda tarinfo: (
+        archive.add(str(host_path), arcname='.', recursive=True, filter=lambda tarinfo: (
             tarinfo if not re.search(excluded_regex, Path(tarinfo.name).name) else None))
-        os.chdir(old_cwd)
 
     for trial in range(2):
         status = container_obj.put_archive(path=container_path,
@@ -360,11 +799,11 @@ def copy_dir_to_container(container_obj: Container, host_path: Path, container_p
             raise docker.errors.APIError(message="unable to copy dir to container")
 
 
-def stream_docker_container_output(streamer: Generator) -> None:
+def stream_docker_container_output(streamer: Iterable[bytes]) -> None:
     """ Stream container logs
 
     Args:
-        streamer(Generator): Generator created by docker-sdk
+        streamer(Iterable): Generator created by docker-sdk, or the output chunks of an executed command
     """
     try:
         wrapper = textwrap.TextWrapper(initial_indent='\t',
@@ -6,7 +6,7 @@ import os
 import re
 import sys
 import textwrap
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import demisto_sdk.commands.common.tools as tools
 # Third party packages
@@ -20,9 +20,16 @@ from demisto_sdk.commands.common.constants import (PACKS_PACK_META_FILE_NAME,
 # Local packages
 from demisto_sdk.commands.common.logger import Colors, logging_setup
 from demisto_sdk.commands.common.tools import (print_error, print_v,
-                                               print_warning)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, PWSH_CHECKS,
-                                               PY_CHCEKS,
+                                               print_warning, run_command_os)
+from demisto_sdk.commands.lint.commands_builder import (build_bandit_command,
+                                                        build_flake8_command,
+                                                        get_python_exec)
+from demisto_sdk.commands.lint.helpers import (EXIT_CODES,
+                                               HOST_LINT_BATCH_SIZE,
+                                               PWSH_CHECKS, PY_CHCEKS, RL,
+                                               BatchedHostLints,
+                                               ContainersPool,
+                                               SharedTestImages,
                                                build_skipped_exit_code,
                                                get_test_modules, validate_env)
 from demisto_sdk.commands.lint.linter import Linter
@@ -221,7 +228,7 @@ class LintManager:
     def run_dev_packages(self, parallel: int, no_flake8: bool, no_bandit: bool, no_mypy: bool, no_pylint: bool,
                          no_vulture: bool, no_test: bool, no_pwsh_analyze: bool, no_pwsh_test: bool,
                          keep_container: bool,
-                         test_xml: str, failure_report: str) -> int:
+                         test_xml: str, failure_report: str, exec_in_container: bool = False) -> int:
         """ Runs the Lint command on all given packages.
 
         Args:
@@ -237,6 +244,8 @@ class LintManager:
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
             failure_report(str): Path for store failed packs report
+            exec_in_container(bool): Whether to copy every package into one container of its test image and execute
+             the docker checks in it, instead of building an image of every package
 
         Returns:
             int: exit code by fail exit codes by var EXIT_CODES
@@ -265,30 +274,51 @@ class LintManager:
                                                no_pylint=no_pylint, no_test=no_test, no_pwsh_analyze=no_pwsh_analyze,
                                                no_pwsh_test=no_pwsh_test, docker_engine=self._facts["docker_engine"])
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
-            return_exit_code: int = 0
-            results = []
-            # Executing lint checks in different threads
-            for pack in self._pkgs:
-                linter: Linter = Linter(pack_dir=pack,
+        # Test images shared by the packages which require them, see SharedTestImages
+        test_images = SharedTestImages()
+        # Results of the host linters executed once for all the packages, see BatchedHostLints
+        host_lints = BatchedHostLints()
+        # Long lived containers shared by the packages, when their checks are executed in one container which isn't kept
+        containers_pool = ContainersPool(max_containers=parallel) if exec_in_container and not keep_container and \
+            self._facts["docker_engine"] else None
+        linters: List[Linter] = [Linter(pack_dir=pack,
                                         content_repo="" if not self._facts["content_repo"] else
                                         Path(self._facts["content_repo"].working_dir),
                                         req_2=self._facts["requirements_2"],
                                         req_3=self._facts["requirements_3"],
-                                        docker_engine=self._facts["docker_engine"])
-                results.append(executor.submit(fn=linter.run_dev_packages,
-                                               no_flake8=no_flake8,
-                                               no_bandit=no_bandit,
-                                               no_mypy=no_mypy,
-                                               no_vulture=no_vulture,
-                                               no_pylint=no_pylint,
-                                               no_test=no_test,
-                                               no_pwsh_analyze=no_pwsh_analyze,
-                                               no_pwsh_test=no_pwsh_test,
-                                               modules=self._facts["test_modules"],
-                                               keep_container=keep_container,
-                                               test_xml=test_xml))
+                                        docker_engine=self._facts["docker_engine"],
+                                        test_images=test_images,
+                                        containers_pool=containers_pool,
+                                        host_lints=host_lints) for pack in self._pkgs]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+            return_exit_code: int = 0
+            facts_futures: List[concurrent.futures.Future] = []
+            results: List[concurrent.futures.Future] = []
             try:
+                # Gathering packages facts in different threads, in order to group the packages by their test images -
+                # every test image is created once and kept until the last package which requires it finished
+                for linter in linters:
+                    facts_futures.append(executor.submit(linter.gather_facts, modules=self._facts["test_modules"]))
+                for future, linter in zip(facts_futures, linters):
+                    future.result()
+                    linter.register_test_images()
+                self._run_batched_host_lints(executor=executor, linters=linters, host_lints=host_lints,
+                                             no_flake8=no_flake8, no_bandit=no_bandit)
+                # Executing lint checks in different threads
+                for linter in linters:
+                    results.append(executor.submit(fn=linter.run_dev_packages,
+                                                   no_flake8=no_flake8,
+                                                   no_bandit=no_bandit,
+                                                   no_mypy=no_mypy,
+                                                   no_vulture=no_vulture,
+                                                   no_pylint=no_pylint,
+                                                   no_test=no_test,
+                                                   no_pwsh_analyze=no_pwsh_analyze,
+                                                   no_pwsh_test=no_pwsh_test,
+                                                   modules=self._facts["test_modules"],
+                                                   keep_container=keep_container,
+                                                   test_xml=test_xml,
+                                                   exec_in_container=exec_in_container))
                 for future in concurrent.futures.as_completed(results):
                     pkg_status = future.result()
                     pkgs_status[pkg_status["pkg"]] = pkg_status
@@ -302,19 +332,16 @@ class LintManager:
                         pkgs_type.append(pkg_status["pack_type"])
             except KeyboardInterrupt:
                 print_warning("Stop demisto-sdk lint - Due to 'Ctrl C' signal")
-                try:
-                    executor.shutdown(wait=False)
-                except Exception:
-                    pass
+                self._shutdown(executor=executor, futures=facts_futures + results, containers_pool=containers_pool)
                 return 1
             except Exception as e:
                 print_warning(f"Stop demisto-sdk lint - Due to Exception {e}")
-                try:
-                    executor.shutdown(wait=False)
-                except Exception:
-                    pass
+                self._shutdown(executor=executor, futures=facts_futures + results, containers_pool=containers_pool)
                 return 1
 
+        if containers_pool:
+            containers_pool.shutdown()
+
         self._report_results(lint_status=lint_status,
                              pkgs_status=pkgs_status,
                              return_exit_code=return_exit_code,
@@ -324,6 +351,83 @@ class LintManager:
 
         return return_exit_code
 
+    def _run_batched_host_lints(self, executor: concurrent.futures.ThreadPoolExecutor, linters: List[Linter],
+                                host_lints: BatchedHostLints, no_flake8: bool, no_bandit: bool):
+        """ Run flake8 and bandit once for the lint files of all the python packages, instead of once for every
+            package - flake8 once for every python executable. The results are split back per file, and packages whose
+            files have no results, as the execution failed or bandit found issues, run the linters by themselves.
+            mypy and vulture are executed by every package, as mypy rejects the same module names in different
+            packages, and vulture finds unused code by the usages in all the files it is given.
+
+        Args:
+            executor(ThreadPoolExecutor): The executor of the packages threads.
+            linters(list): The packages linters, after their facts were gathered.
+            host_lints(BatchedHostLints): The results of the batched linters.
+            no_flake8(bool): Whether to skip flake8
+            no_bandit(bool): Whether to skip bandit
+        """
+        flake8_files: Dict[str, Tuple[float, List[Path]]] = {}
+        bandit_files: List[Path] = []
+        packages_count = 0
+        for linter in linters:
+            host_lint_files = linter.get_host_lint_files()
+            if not host_lint_files:
+                continue
+            py_num, lint_files, lint_unittest_files = host_lint_files
+            packages_count += 1
+            flake8_files.setdefault(get_python_exec(py_num), (py_num, []))[1].extend(lint_files + lint_unittest_files)
+            bandit_files.extend(lint_files)
+        if packages_count < 2:
+            return
+
+        content_repo = "" if not self._facts["content_repo"] else Path(self._facts["content_repo"].working_dir)
+        batches: List[Tuple[str, str, List[Path], concurrent.futures.Future]] = []
+        if not no_flake8:
+            for python_exec, (py_num, files) in flake8_files.items():
+                for i in range(0, len(files), HOST_LINT_BATCH_SIZE):
+                    batch_files = files[i:i + HOST_LINT_BATCH_SIZE]
+                    batches.append(("flake8", python_exec, batch_files,
+                                    executor.submit(run_command_os, command=build_flake8_command(batch_files, py_num),
+                                                    cwd=content_repo)))
+        if not no_bandit:
+            for i in range(0, len(bandit_files), HOST_LINT_BATCH_SIZE):
+                batch_files = bandit_files[i:i + HOST_LINT_BATCH_SIZE]
+                batches.append(("bandit", "", batch_files,
+                                executor.submit(run_command_os,
+                                                command=build_bandit_command(batch_files, json_report=True),
+                                                cwd=content_repo)))
+
+        for lint_check, python_exec, batch_files, future in batches:
+            stdout, stderr, exit_code = future.result()
+            # The output can't be split per file if the linter failed, so the packages run the linter by themselves
+            added = not stderr and exit_code in [0, 1] and (
+                host_lints.add_flake8_results(python_exec=python_exec, files=batch_files, stdout=stdout)
+                if lint_check == "flake8" else host_lints.add_bandit_results(files=batch_files, stdout=stdout))
+            logger.info(f"{lint_check} - Executed for {len(batch_files)} files of all the packages - "
+                        f"{'results split per file' if added else f'unable to split results, exit-code: {exit_code}'}")
+            if stderr:
+                logger.debug(f"{lint_check} - stderr: {RL}{stderr}")
+
+    @staticmethod
+    def _shutdown(executor: concurrent.futures.ThreadPoolExecutor, futures: List[concurrent.futures.Future],
+                  containers_pool: Optional[ContainersPool]):
+        """ Stop linting the packages - the packages which didn't start are cancelled, and the containers of the pool
+            are removed, so the checks which are executed in them stop.
+
+        Args:
+            executor(ThreadPoolExecutor): The executor of the packages threads.
+            futures(list): The futures of the packages threads.
+            containers_pool(ContainersPool): The containers pool, if the packages checks are executed in it.
+        """
+        for future in futures:
+            future.cancel()
+        if containers_pool:
+            containers_pool.shutdown()
+        try:
+            executor.shutdown(wait=False)
+        except Exception:
+            pass
+
     def _report_results(self, lint_status: dict, pkgs_status: dict, return_exit_code: int, skipped_code: int,
                         pkgs_type: list):
         """ Log report to console
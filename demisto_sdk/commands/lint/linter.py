@@ -4,8 +4,9 @@ import io
 import json
 import logging
 import os
+import shlex
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # 3-rd party packages
 import docker
@@ -20,10 +21,15 @@ from demisto_sdk.commands.common.tools import (get_all_docker_images,
 from demisto_sdk.commands.lint.commands_builder import (
     build_bandit_command, build_flake8_command, build_mypy_command,
     build_pwsh_analyze_command, build_pwsh_test_command, build_pylint_command,
-    build_pytest_command, build_vulture_command)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, RERUN, RL,
-                                               SUCCESS, add_tmp_lint_files,
+    build_pytest_command, build_vulture_command, get_python_exec)
+from demisto_sdk.commands.lint.helpers import (CONTAINER_WORKDIR, EXIT_CODES,
+                                               FAIL, RERUN, RL, SUCCESS,
+                                               BatchedHostLints,
+                                               ContainersPool,
+                                               SharedTestImages,
+                                               add_tmp_lint_files,
                                                add_typing_module,
+                                               copy_dir_to_container,
                                                get_file_from_container,
                                                get_python_version_from_image,
                                                stream_docker_container_output)
@@ -43,14 +49,29 @@ class Linter:
             req_2(list): requirements for docker using python2.
             req_3(list): requirements for docker using python3.
             docker_engine(bool):  Whether docker engine detected by docker-sdk.
+            test_images(SharedTestImages): Test images shared with the packages linted in other threads.
+            containers_pool(ContainersPool): Containers shared with the packages linted in other threads, used when
+             the package checks are executed in one container.
+            host_lints(BatchedHostLints): Results of host linters executed once for the files of all the packages.
     """
 
-    def __init__(self, pack_dir: Path, content_repo: Path, req_3: list, req_2: list, docker_engine: bool):
+    def __init__(self, pack_dir: Path, content_repo: Path, req_3: list, req_2: list, docker_engine: bool,
+                 test_images: Optional[SharedTestImages] = None, containers_pool: Optional[ContainersPool] = None,
+                 host_lints: Optional[BatchedHostLints] = None):
         self._req_3 = req_3
         self._req_2 = req_2
         self._content_repo = content_repo
         self._pack_abs_dir = pack_dir
         self._pack_name = None
+        self._test_images = test_images or SharedTestImages()
+        self._registered_test_images: List[str] = []
+        # The container of the test image the package is copied into, if the checks are executed in one container
+        self._pack_container: Optional[docker.models.containers.Container] = None
+        self._pack_container_entrypoint: List[str] = []
+        self._containers_pool = containers_pool
+        self._host_lints = host_lints or BatchedHostLints()
+        # Whether to skip the package, known once the facts are gathered
+        self._skip: Optional[bool] = None
         # Docker client init
         if docker_engine:
             self._docker_client: docker.DockerClient = docker.from_env()
@@ -82,7 +103,7 @@ class Linter:
 
     def run_dev_packages(self, no_flake8: bool, no_bandit: bool, no_mypy: bool, no_pylint: bool, no_vulture: bool,
                          no_pwsh_analyze: bool, no_pwsh_test: bool, no_test: bool, modules: dict, keep_container: bool,
-                         test_xml: str) -> dict:
+                         test_xml: str, exec_in_container: bool = False) -> dict:
         """ Run lint and tests on single package
         Performing the follow:
             1. Run the lint on OS - flake8, bandit, mypy.
@@ -100,14 +121,15 @@ class Linter:
             modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
+            exec_in_container(bool): Whether to copy the package into one container of its test image and execute the
+             docker checks in it, instead of building an image of the package
 
         Returns:
             dict: lint and test all status, pkg status)
         """
         # Gather information for lint check information
-        skip = self._gather_facts(modules)
         # If not python pack - skip pack
-        if skip:
+        if self.gather_facts(modules):
             return self._pkg_lint_status
 
         # Locate mandatory files in pack path - for more info checkout the context manager LintFiles
@@ -130,10 +152,53 @@ class Linter:
                                                no_pwsh_analyze=no_pwsh_analyze,
                                                no_pwsh_test=no_pwsh_test,
                                                keep_container=keep_container,
-                                               test_xml=test_xml)
+                                               test_xml=test_xml,
+                                               exec_in_container=exec_in_container)
 
         return self._pkg_lint_status
 
+    def gather_facts(self, modules: dict) -> bool:
+        """ Gathering facts about the package once - LintManager gathers them before running the packages, in order
+            to group the packages by their test images
+
+        Args:
+            modules(dict): Test mandatory modules to be ignore in lint check
+
+        Returns:
+            bool: Indicating if to continue further or not, if False exit Thread, Else continue.
+        """
+        if self._skip is None:
+            self._skip = self._gather_facts(modules)
+
+        return self._skip
+
+    def register_test_images(self) -> List[str]:
+        """ Register the package for the test images it requires, by the base images and the requirements hash, so
+            they are kept until the package finished
+
+        Returns:
+            list: The registered test images names, empty if the package is skipped or docker engine isn't detected.
+        """
+        if self._skip is False and self._facts["docker_engine"]:
+            self._registered_test_images = [image_name for image_name in
+                                            map(self._get_test_image_name, self._facts["images"]) if image_name]
+            for image_name in self._registered_test_images:
+                self._test_images.register(image_name)
+
+        return self._registered_test_images
+
+    def get_host_lint_files(self) -> Optional[Tuple[float, List[Path], List[Path]]]:
+        """ Get the files of the package which the host linters check, to execute them once for all the packages
+
+        Returns:
+            tuple: The python version flake8 uses, the lint files and the unit test files, None if the package isn't a
+             python package which is checked.
+        """
+        if self._skip is not False or self._pkg_lint_status["pack_type"] != TYPE_PYTHON or not self._facts["images"]:
+            return None
+
+        return self._facts["images"][0][1], self._facts["lint_files"], self._facts["lint_unittest_files"]
+
     def _gather_facts(self, modules: dict) -> bool:
         """ Gathering facts about the package - python version, docker images, valid docker image, yml parsing
         Args:
@@ -305,6 +370,11 @@ class Linter:
         """
         log_prompt = f"{self._pack_name} - Flake8"
         logger.info(f"{log_prompt} - Start")
+        batched_output = self._host_lints.get_flake8_output(python_exec=get_python_exec(py_num), files=lint_files)
+        if batched_output is not None:
+            logger.info(f"{log_prompt} - Finished by the flake8 execution of all the packages")
+            return (FAIL, batched_output) if batched_output else (SUCCESS, "")
+
         stdout, stderr, exit_code = run_command_os(command=build_flake8_command(lint_files, py_num),
                                                    cwd=self._content_repo)
         logger.debug(f"{log_prompt} - Finished exit-code: {exit_code}")
@@ -333,6 +403,11 @@ class Linter:
         """
         log_prompt = f"{self._pack_name} - Bandit"
         logger.info(f"{log_prompt} - Start")
+        if self._host_lints.is_bandit_passed(files=lint_files):
+            # Packages with bandit issues run it by themselves, for the bandit report of the package
+            logger.info(f"{log_prompt} - Successfully finished by the bandit execution of all the packages")
+            return SUCCESS, ""
+
         stdout, stderr, exit_code = run_command_os(command=build_bandit_command(lint_files),
                                                    cwd=self._pack_abs_dir)
         logger.debug(f"{log_prompt} - Finished exit-code: {exit_code}")
@@ -411,7 +486,7 @@ class Linter:
         return SUCCESS, ""
 
     def _run_lint_on_docker_image(self, no_pylint: bool, no_test: bool, no_pwsh_analyze: bool, no_pwsh_test: bool,
-                                  keep_container: bool, test_xml: str):
+                                  keep_container: bool, test_xml: str, exec_in_container: bool = False):
         """ Run lint check on docker image
 
         Args:
@@ -421,6 +496,8 @@ class Linter:
             no_pwsh_test(bool): whether to skip powershell tests
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
+            exec_in_container(bool): Whether to copy the package into one container of its test image and execute the
+             docker checks in it, instead of building an image of the package
         """
         for image in self._facts["images"]:
             # Docker image status - visualize
@@ -437,9 +514,13 @@ class Linter:
             image_id = ""
             errors = ""
             for trial in range(2):
-                image_id, errors = self._docker_image_create(docker_base_image=image)
+                image_id, errors = self._docker_image_create(docker_base_image=image, copy_pack=not exec_in_container)
                 if not errors:
                     break
+            if exec_in_container and image_id and not errors:
+                errors = self._docker_start_pack_container(test_image=image_id)
+            # Whether a check failed to run, so the package container shouldn't be reused
+            container_failed = False
 
             if image_id and not errors:
                 # Set image creation status
@@ -468,6 +549,7 @@ class Linter:
                                 exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
                                                                                keep_container=keep_container)
 
+                        container_failed |= exit_code == RERUN
                         if (exit_code != RERUN or trial == 2) and exit_code:
                             self._pkg_lint_status["exit_code"] |= EXIT_CODES[check]
                             status[f"{check}_errors"] = output
@@ -480,11 +562,19 @@ class Linter:
 
             # Add image status to images
             self._pkg_lint_status["images"].append(status)
+            if exec_in_container:
+                # The test image is shared with other packages, only the package container is removed or released
+                self._docker_stop_pack_container(keep_container=keep_container, failed=container_failed)
+                continue
             try:
                 self._docker_client.images.remove(image_id)
             except (docker.errors.ImageNotFound, docker.errors.APIError):
                 pass
 
+        # The test images are kept until the last package which shares them finished
+        for image_name in self._registered_test_images:
+            self._test_images.release(image_name)
+
     def _docker_login(self) -> bool:
         """ Login to docker-hub using environment variables:
                 1. DOCKERHUB_USER - User for docker hub.
@@ -504,43 +594,132 @@ class Linter:
         except docker.errors.APIError:
             return False
 
-    def _docker_image_create(self, docker_base_image: List[Any]) -> Tuple[str, str]:
+    @staticmethod
+    def _get_dockerfile_template():
+        file_loader = FileSystemLoader(Path(__file__).parent / 'templates')
+        env = Environment(loader=file_loader, lstrip_blocks=True, trim_blocks=True, autoescape=True)
+        return env.get_template('dockerfile.jinja2')
+
+    def _render_test_image_dockerfile(self, docker_base_image: List[Any]) -> str:
+        """ Render the Dockerfile of the test image, which installs the dev requirements on the base image
+
+        Args:
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+
+        Returns:
+            str: The test image Dockerfile.
+
+        Raises:
+            TemplateError: If the Dockerfile template failed to render.
+        """
+        # Get requirements file for image
+        requirements = []
+        if 2 < docker_base_image[1] < 3:
+            requirements = self._req_2
+        elif docker_base_image[1] > 3:
+            requirements = self._req_3
+
+        return self._get_dockerfile_template().render(image=docker_base_image[0],
+                                                      pypi_packs=requirements + self._facts["additional_requirements"],
+                                                      pack_type=self._pkg_lint_status["pack_type"],
+                                                      copy_pack=False)
+
+    @staticmethod
+    def _get_test_image_name_from_dockerfile(docker_base_image: List[Any], dockerfile: str) -> str:
+        return f'devtest{docker_base_image[0]}-{hashlib.md5(dockerfile.encode("utf-8")).hexdigest()}'
+
+    def _get_test_image_name(self, docker_base_image: List[Any]) -> str:
+        """ Get the test image name - the packages which share the base image and the requirements share the image
+
+        Args:
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+
+        Returns:
+            str: The test image name, empty if the Dockerfile template failed to render.
+        """
+        try:
+            dockerfile = self._render_test_image_dockerfile(docker_base_image)
+        except exceptions.TemplateError:
+            return ""
+
+        return self._get_test_image_name_from_dockerfile(docker_base_image, dockerfile)
+
+    def _docker_image_create(self, docker_base_image: List[Any], copy_pack: bool = True) -> Tuple[str, str]:
         """ Create docker image:
             1. Installing 'build base' if required in alpine images version - https://wiki.alpinelinux.org/wiki/GCC
             2. Installing pypi packs - if only pylint required - only pylint installed otherwise all pytest and pylint
                installed, packages which being install can be found in path demisto_sdk/commands/lint/dev_envs
             3. The docker image build done by Dockerfile template located in
                 demisto_sdk/commands/lint/templates/dockerfile.jinja2
+            The test image of steps 1-2 is created once for all the packages which share it, see SharedTestImages.
 
         Args:
             docker_base_image(list): docker image to use as base for installing dev deps and python version.
+            copy_pack(bool): Whether to build an image of the package, which copies the pack dir to the test image.
 
         Returns:
             str, str. image name to use and errors string.
         """
         log_prompt = f"{self._pack_name} - Image create"
         test_image_id = ""
-        # Get requirements file for image
-        requirements = []
-        if 2 < docker_base_image[1] < 3:
-            requirements = self._req_2
-        elif docker_base_image[1] > 3:
-            requirements = self._req_3
         # Using DockerFile template
-        file_loader = FileSystemLoader(Path(__file__).parent / 'templates')
-        env = Environment(loader=file_loader, lstrip_blocks=True, trim_blocks=True, autoescape=True)
-        template = env.get_template('dockerfile.jinja2')
+        template = self._get_dockerfile_template()
         try:
-            dockerfile = template.render(image=docker_base_image[0],
-                                         pypi_packs=requirements + self._facts["additional_requirements"],
-                                         pack_type=self._pkg_lint_status["pack_type"],
-                                         copy_pack=False)
+            dockerfile = self._render_test_image_dockerfile(docker_base_image)
         except exceptions.TemplateError as e:
             logger.debug(f"{log_prompt} - Error when build image - {e.message()}")
             return test_image_id, str(e)
+        test_image_name = self._get_test_image_name_from_dockerfile(docker_base_image, dockerfile)
+        test_image_name, errors = self._test_images.get_image(
+            image_name=test_image_name,
+            create_image=lambda: self._docker_test_image_create(docker_base_image=docker_base_image,
+                                                                test_image_name=test_image_name,
+                                                                dockerfile=dockerfile))
+        if not copy_pack:
+            return test_image_name, errors
+
+        for trial in range(2):
+            dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
+            try:
+                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
+                dockerfile = template.render(image=test_image_name,
+                                             copy_pack=True)
+                with open(file=dockerfile_path, mode="+x") as file:
+                    file.write(str(dockerfile))
+
+                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
+                                                                      dockerfile=dockerfile_path.stem,
+                                                                      forcerm=True)
+                test_image_name = docker_image_final[0].short_id
+                break
+            except (docker.errors.ImageNotFound, docker.errors.APIError, urllib3.exceptions.ReadTimeoutError,
+                    exceptions.TemplateError) as e:
+                logger.info(f"{log_prompt} - errors occurred when copy pack dir {e}")
+                if trial == 2:
+                    errors = str(e)
+        if dockerfile_path.exists():
+            dockerfile_path.unlink()
+
+        if test_image_id:
+            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+
+        return test_image_name, errors
+
+    def _docker_test_image_create(self, docker_base_image: List[Any], test_image_name: str,
+                                  dockerfile: str) -> Tuple[str, str]:
+        """ Pull the test image, or build it and push it if it isn't found
+
+        Args:
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+            test_image_name(str): The test image name.
+            dockerfile(str): The test image Dockerfile.
+
+        Returns:
+            str, str. The test image name and errors string.
+        """
+        log_prompt = f"{self._pack_name} - Image create"
         # Trying to pull image based on dockerfile hash, will check if something changed
         errors = ""
-        test_image_name = f'devtest{docker_base_image[0]}-{hashlib.md5(dockerfile.encode("utf-8")).hexdigest()}'
         test_image = None
         try:
             logger.info(f"{log_prompt} - Trying to pull existing image {test_image_name}")
@@ -575,32 +754,153 @@ class Linter:
         else:
             logger.info(f"{log_prompt} - Found existing image {test_image_name}")
 
-        for trial in range(2):
-            dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
+        return test_image_name, errors
+
+    def _docker_start_pack_container(self, test_image: str) -> str:
+        """ Start the package container of the test image, or acquire an idle one from the containers pool, and copy
+            the package into it, in order to run all the checks of the package as execs in it - instead of building an
+            image of the package and running a container of every check
+
+        Args:
+            test_image(str): test image id/name
+
+        Returns:
+            str: The errors, empty if the package container started.
+        """
+        log_prompt = f'{self._pack_name} - Pack container - Image {test_image}'
+        try:
+            # The checks commands are executed by the image entrypoint, as when running them in a new container
+            self._pack_container_entrypoint = self._docker_client.images.get(test_image).attrs["Config"].get(
+                "Entrypoint") or []
+            if self._containers_pool:
+                self._pack_container = self._containers_pool.acquire(
+                    image=test_image,
+                    start_container=lambda: self._docker_run_pack_container(test_image=test_image))
+            else:
+                container_name = f"{self._pack_name}-pack"
+                # Check if previous run left container a live if it do, we remove it
+                try:
+                    self._docker_client.containers.get(container_name).remove(force=True)
+                except docker.errors.NotFound:
+                    pass
+                self._pack_container = self._docker_run_pack_container(test_image=test_image,
+                                                                       container_name=container_name)
+            logger.info(f"{log_prompt} - Copy pack dir to container {self._pack_container.name}")
+            copy_dir_to_container(container_obj=self._pack_container,
+                                  host_path=self._pack_abs_dir,
+                                  container_path=Path(CONTAINER_WORKDIR))
+        except (docker.errors.ImageNotFound, docker.errors.APIError, OSError) as e:
+            logger.critical(f"{log_prompt} - Unable to start pack container - {e}")
+            self._docker_stop_pack_container(keep_container=False, failed=True)
+            return str(e)
+
+        return ""
+
+    def _docker_run_pack_container(self, test_image: str,
+                                   container_name: Optional[str] = None) -> docker.models.containers.Container:
+        """ Run a container of the test image which is kept running until it is removed, to execute checks in it
+
+        Args:
+            test_image(str): test image id/name
+            container_name(str): The container name, generated by docker if not given
+
+        Returns:
+            Container: The running container.
+        """
+        return self._docker_client.containers.run(name=container_name,
+                                                  image=test_image,
+                                                  entrypoint=["tail"],
+                                                  command=["-f", "/dev/null"],
+                                                  user=f"{os.getuid()}:4000",
+                                                  detach=True,
+                                                  environment=self._facts["env_vars"])
+
+    def _docker_stop_pack_container(self, keep_container: bool, failed: bool = False):
+        """ Release the package container to the containers pool, or remove it unless it should be kept
+
+        Args:
+            keep_container(bool): True if to keep container after execution finished
+            failed(bool): Whether running the package checks in the container failed, so it shouldn't be reused
+        """
+        if not self._pack_container:
+            return
+
+        if self._containers_pool:
+            self._containers_pool.release(self._pack_container, failed=failed)
+        elif keep_container:
+            print(f"{self._pack_name} - Pack container - container name {self._pack_container.name}")
+        else:
             try:
-                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
-                dockerfile = template.render(image=test_image_name,
-                                             copy_pack=True)
-                with open(file=dockerfile_path, mode="+x") as file:
-                    file.write(str(dockerfile))
+                self._pack_container.remove(force=True)
+            except (docker.errors.NotFound, docker.errors.APIError) as e:
+                logger.critical(f"{self._pack_name} - Pack container - Unable to delete container - {e}")
+        self._pack_container = None
 
-                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
-                                                                      dockerfile=dockerfile_path.stem,
-                                                                      forcerm=True)
-                test_image_name = docker_image_final[0].short_id
-                break
-            except (docker.errors.ImageNotFound, docker.errors.APIError, urllib3.exceptions.ReadTimeoutError,
-                    exceptions.TemplateError) as e:
-                logger.info(f"{log_prompt} - errors occurred when copy pack dir {e}")
-                if trial == 2:
-                    errors = str(e)
-        if dockerfile_path.exists():
-            dockerfile_path.unlink()
+    def _docker_run_command(self, test_image: str, container_name: str,
+                            command: Union[str, List[str]]) -> Tuple[docker.models.containers.Container, int, str]:
+        """ Run a check command as an exec in the package container if it is started, otherwise in a new container of
+            the test image
 
-        if test_image_id:
-            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+        Args:
+            test_image(str): test image id/name
+            container_name(str): The name of the new container
+            command(str or list): The check command
 
-        return test_image_name, errors
+        Returns:
+            Container: The container the command ran in.
+            int: The command exit code.
+            str: The command output.
+
+        Raises:
+            ImageNotFound, APIError: If the command failed to run.
+        """
+        if self._pack_container:
+            exec_command = command if isinstance(command, list) else shlex.split(command)
+            exit_code, output = self._pack_container.exec_run(cmd=self._pack_container_entrypoint + exec_command,
+                                                              user=f"{os.getuid()}:4000",
+                                                              environment=self._facts["env_vars"])
+            stream_docker_container_output([output])
+            return self._pack_container, exit_code, output.decode("utf-8")
+
+        # Check if previous run left container a live if it do, we remove it
+        container_obj: docker.models.containers.Container
+        try:
+            container_obj = self._docker_client.containers.get(container_name)
+            container_obj.remove(force=True)
+        except docker.errors.NotFound:
+            pass
+
+        container_obj = self._docker_client.containers.run(name=container_name,
+                                                           image=test_image,
+                                                           command=command,
+                                                           user=f"{os.getuid()}:4000",
+                                                           detach=True,
+                                                           environment=self._facts["env_vars"])
+        stream_docker_container_output(container_obj.logs(stream=True))
+        # wait for container to finish
+        container_status = container_obj.wait(condition="exited")
+
+        return container_obj, container_status.get("StatusCode"), container_obj.logs().decode("utf-8")
+
+    def _docker_remove_container(self, container_obj: docker.models.containers.Container, keep_container: bool,
+                                 log_prompt: str):
+        """ Remove the container of a check, unless it should be kept or it is the package container
+
+        Args:
+            container_obj(Container): The container the check ran in.
+            keep_container(bool): True if to keep container after execution finished
+            log_prompt(str): The check log prompt
+        """
+        if container_obj is self._pack_container:
+            return
+
+        if keep_container:
+            print(f"{log_prompt} - container name {container_obj.name}")
+        else:
+            try:
+                container_obj.remove(force=True)
+            except docker.errors.NotFound as e:
+                logger.critical(f"{log_prompt} - Unable to delete container - {e}")
 
     def _docker_run_pylint(self, test_image: str, keep_container: bool) -> Tuple[int, str]:
         """ Run Pylint in created test image
@@ -616,32 +916,14 @@ class Linter:
         log_prompt = f'{self._pack_name} - Pylint - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pylint"
-        # Check if previous run left container a live if it do, we remove it
-        container_obj: docker.models.containers.Container
-        try:
-            container_obj = self._docker_client.containers.get(container_name)
-            container_obj.remove(force=True)
-        except docker.errors.NotFound:
-            pass
-
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=[
-                                                                   build_pylint_command(self._facts["lint_files"])],
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_command(
+                test_image=test_image,
+                container_name=container_name,
+                command=[build_pylint_command(self._facts["lint_files"])])
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [1, 2]:
                 # 1-fatal message issued
@@ -662,13 +944,8 @@ class Linter:
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
             # Keeping container if needed or remove it
-            if keep_container:
-                print(f"{log_prompt} - container name {container_name}")
-            else:
-                try:
-                    container_obj.remove(force=True)
-                except docker.errors.NotFound as e:
-                    logger.critical(f"{log_prompt} - Unable to delete container - {e}")
+            self._docker_remove_container(container_obj=container_obj, keep_container=keep_container,
+                                          log_prompt=log_prompt)
         except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
             logger.critical(f"{log_prompt} - Unable to run pylint - {e}")
             exit_code = RERUN
@@ -691,32 +968,16 @@ class Linter:
         log_prompt = f'{self._pack_name} - Pytest - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pytest"
-        # Check if previous run left container a live if it does, Remove it
-        container_obj: docker.models.containers.Container
-        try:
-            container_obj = self._docker_client.containers.get(container_name)
-            container_obj.remove(force=True)
-        except docker.errors.NotFound:
-            pass
         # Collect tests
         exit_code = SUCCESS
         output = ''
         test_json = {}
         try:
             # Running pytest container
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=[
-                                                                   build_pytest_command(test_xml=test_xml, json=True)],
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # Waiting for container to be finished
-            container_status: dict = container_obj.wait(condition="exited")
-            # Getting container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
+            container_obj, container_exit_code, container_log = self._docker_run_command(
+                test_image=test_image,
+                container_name=container_name,
+                command=[build_pytest_command(test_xml=test_xml, json=True)])
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [0, 1, 2, 5]:
                 # 0-All tests passed
@@ -740,7 +1001,7 @@ class Linter:
                     logger.info(f"{log_prompt} - Successfully finished")
                     exit_code = SUCCESS
                 elif container_exit_code in [2]:
-                    output = container_obj.logs().decode('utf-8')
+                    output = container_log
                     exit_code = FAIL
                 else:
                     logger.info(f"{log_prompt} - Finished errors found")
@@ -750,15 +1011,10 @@ class Linter:
                 # 4-pytest command line usage error
                 logger.critical(f"{log_prompt} - Usage error")
                 exit_code = RERUN
-                output = container_obj.logs().decode('utf-8')
+                output = container_log
             # Remove container if not needed
-            if keep_container:
-                print(f"{log_prompt} - Container name {container_name}")
-            else:
-                try:
-                    container_obj.remove(force=True)
-                except docker.errors.NotFound as e:
-                    logger.critical(f"{log_prompt} - Unable to remove container {e}")
+            self._docker_remove_container(container_obj=container_obj, keep_container=keep_container,
+                                          log_prompt=log_prompt)
         except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
             logger.critical(f"{log_prompt} - Unable to run pytest container {e}")
             exit_code = RERUN
@@ -779,32 +1035,14 @@ class Linter:
         log_prompt = f'{self._pack_name} - Powershell analyze - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pwsh-analyze"
-        # Check if previous run left container a live if it do, we remove it
-        container_obj: docker.models.containers.Container
-        try:
-            container_obj = self._docker_client.containers.get(container_name)
-            container_obj.remove(force=True)
-        except docker.errors.NotFound:
-            pass
-
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=build_pwsh_analyze_command(
-                                                                   self._facts["lint_files"][0]),
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_command(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pwsh_analyze_command(self._facts["lint_files"][0]))
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -815,13 +1053,8 @@ class Linter:
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
             # Keeping container if needed or remove it
-            if keep_container:
-                print(f"{log_prompt} - container name {container_name}")
-            else:
-                try:
-                    container_obj.remove(force=True)
-                except docker.errors.NotFound as e:
-                    logger.critical(f"{log_prompt} - Unable to delete container - {e}")
+            self._docker_remove_container(container_obj=container_obj, keep_container=keep_container,
+                                          log_prompt=log_prompt)
         except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
             logger.critical(f"{log_prompt} - Unable to run powershell test - {e}")
             exit_code = RERUN
@@ -842,31 +1075,14 @@ class Linter:
         log_prompt = f'{self._pack_name} - Powershell test - Image {test_image}'
         logger.info(f"{log_prompt} - Start")
         container_name = f"{self._pack_name}-pwsh-test"
-        # Check if previous run left container a live if it do, we remove it
-        container_obj: docker.models.containers.Container
-        try:
-            container_obj = self._docker_client.containers.get(container_name)
-            container_obj.remove(force=True)
-        except docker.errors.NotFound:
-            pass
-
         # Run container
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=build_pwsh_test_command(),
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_command(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pwsh_test_command())
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -877,13 +1093,8 @@ class Linter:
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
             # Keeping container if needed or remove it
-            if keep_container:
-                print(f"{log_prompt} - container name {container_name}")
-            else:
-                try:
-                    container_obj.remove(force=True)
-                except docker.errors.NotFound as e:
-                    logger.critical(f"{log_prompt} - Unable to delete container - {e}")
+            self._docker_remove_container(container_obj=container_obj, keep_container=keep_container,
+                                          log_prompt=log_prompt)
         except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
             logger.critical(f"{log_prompt} - Unable to run powershell test - {e}")
             exit_code = RERUN
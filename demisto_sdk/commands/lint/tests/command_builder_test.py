@@ -35,6 +35,18 @@ def test_build_bandit_command(files):
     assert expected == output
 
 
+@pytest.mark.parametrize(argnames="files", argvalues=values)
+def test_build_bandit_json_command(files):
+    """Build bandit command with a json report of the issues of every file"""
+    from demisto_sdk.commands.lint.commands_builder import build_bandit_command
+    output = build_bandit_command(files, json_report=True)
+    files = [str(file) for file in files]
+    expected = f"python3 -m bandit -lll -iii -a file --exclude=CommonServerPython.py,demistomock.py," \
+               f"CommonServerUserPython.py," \
+               f"conftest.py,venv -q -f json {' '.join(files)}"
+    assert expected == output
+
+
 @pytest.mark.parametrize(argnames="files, py_num", argvalues=[(values[0], "2.7"), (values[1], "3.7")])
 def test_build_mypy_command(files, py_num):
     """Build Mypy command"""
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 
@@ -40,11 +42,286 @@ def test_build_skipped_exit_code(no_flake8: bool, no_bandit: bool, no_mypy: bool
 @pytest.mark.parametrize(argnames="image, output, expected", argvalues=[('alpine', b'3.7\n', 3.7),
                                                                         ('alpine-3', b'2.7\n', 2.7)])
 def test_get_python_version_from_image(image: str, output: bytes, expected: float, mocker):
+    """
+    Given
+    - Docker images without the python version in their metadata.
+
+    When
+    - Getting the python version of the images twice, the second time in a new process.
+
+    Then
+    - Ensure the python version is found by running python in a container of the image, only the first time.
+    """
     from demisto_sdk.commands.lint import helpers
-    mocker.patch.object(helpers, 'docker')
-    helpers.docker.from_env().containers.run().logs.return_value = output
+    mocker.patch.dict(helpers._PYTHON_VERSIONS, clear=True)
+    mocker.patch.dict(helpers._PYTHON_VERSIONS_CACHES, clear=True)
+    docker_client = mocker.patch.object(helpers.docker, 'from_env').return_value
+    docker_client.images.get.return_value.id = f'sha256:{image}'
+    docker_client.images.get.return_value.attrs = {'Config': {'Env': ['PATH=/usr/bin'], 'Labels': None}}
+    docker_client.containers.run.return_value.logs.return_value = output
+
+    assert expected == helpers.get_python_version_from_image(image)
+    helpers._PYTHON_VERSIONS.clear()
+    helpers._PYTHON_VERSIONS_CACHES.clear()
     assert expected == helpers.get_python_version_from_image(image)
 
+    assert docker_client.containers.run.call_count == 1
+
+
+@pytest.mark.parametrize(argnames="image_config, expected", argvalues=[
+    ({'Env': ['PATH=/usr/bin', 'PYTHON_VERSION=3.8.6', 'PYTHON_PIP_VERSION=20.2.4']}, 3.8),
+    ({'Env': ['PATH=/usr/bin'], 'Labels': {'python_version': '2.7.18'}}, 2.7),
+])
+def test_get_python_version_from_image_metadata(image_config: dict, expected: float, mocker):
+    """
+    Given
+    - A docker image with the python version in its environment variables or labels, which is not found locally.
+
+    When
+    - Getting the python version of the image from concurrent threads.
+
+    Then
+    - Ensure the image is pulled and the python version is found in its metadata once, without running a container.
+    - Ensure the python version is kept on disk by the image id.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.dict(helpers._PYTHON_VERSIONS, clear=True)
+    docker_client = mocker.patch.object(helpers.docker, 'from_env').return_value
+    docker_client.images.get.side_effect = helpers.docker.errors.ImageNotFound('not found')
+    docker_client.images.pull.return_value.id = 'sha256:image-id'
+    docker_client.images.pull.return_value.attrs = {'Config': image_config}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        python_versions = list(executor.map(helpers.get_python_version_from_image,
+                                            ['localhost:5000/demisto/python3:3.8.6.1'] * 4))
+
+    assert python_versions == [expected] * 4
+    docker_client.images.pull.assert_called_once_with('localhost:5000/demisto/python3', tag='3.8.6.1')
+    docker_client.containers.run.assert_not_called()
+    assert helpers.PythonVersionsCache().get('sha256:image-id') == expected
+
+
+def test_shared_test_images():
+    """
+    Given
+    - Test images shared by two registered packages, and a test image which failed to be created at first.
+
+    When
+    - Getting the test images from concurrent threads, and releasing them.
+
+    Then
+    - Ensure every test image is created once while it is created successfully, and kept until the last release.
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint.helpers import SharedTestImages
+    created_images = []
+
+    def create_image(image_name: str, errors: str = ''):
+        def _create_image():
+            time.sleep(0.01)
+            created_images.append(image_name)
+            return image_name, errors
+        return _create_image
+
+    test_images = SharedTestImages()
+    test_images.register('devtest-image')
+    test_images.register('devtest-image')
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        images = list(executor.map(lambda _: test_images.get_image('devtest-image', create_image('devtest-image')),
+                                   range(4)))
+
+    assert images == [('devtest-image', '')] * 4
+    assert created_images == ['devtest-image']
+    assert test_images.get_image('failed-image', create_image('failed-image', 'error')) == ('failed-image', 'error')
+    assert test_images.get_image('failed-image', create_image('failed-image')) == ('failed-image', '')
+    assert created_images == ['devtest-image', 'failed-image', 'failed-image']
+
+    assert not test_images.release('devtest-image')
+    assert 'devtest-image' in test_images.images
+    assert test_images.release('devtest-image')
+    assert 'devtest-image' not in test_images.images
+
+
+class TestBatchedHostLints:
+    def test_flake8_results(self):
+        """
+        Given
+        - The flake8 output of the files of two packages, with a path which prefixes another path and a shown source.
+
+        When
+        - Splitting the output per file.
+
+        Then
+        - Ensure every package gets the output lines of its files, and files without errors get an empty output.
+        - Ensure files which flake8 wasn't executed on at once have no output.
+        """
+        from demisto_sdk.commands.lint.helpers import BatchedHostLints
+        files = [Path('/content/Pack/A.py'), Path('/content/Pack/A.py.py'), Path('/content/Other/B.py')]
+        stdout = "/content/Pack/A.py:1:1: F401 'os' imported but unused\n" \
+                 "/content/Pack/A.py.py:2:2: E225 missing whitespace around operator\n" \
+                 "x=1\n" \
+                 "/content/Pack/A.py:3:1: E302 expected 2 blank lines\n"
+        host_lints = BatchedHostLints()
+
+        assert host_lints.add_flake8_results(python_exec='python3', files=files, stdout=stdout)
+        assert host_lints.get_flake8_output('python3', files[:2]) == \
+            "/content/Pack/A.py:1:1: F401 'os' imported but unused\n" \
+            "/content/Pack/A.py:3:1: E302 expected 2 blank lines\n" \
+            "/content/Pack/A.py.py:2:2: E225 missing whitespace around operator\nx=1\n"
+        assert host_lints.get_flake8_output('python3', files[2:]) == ''
+        assert host_lints.get_flake8_output('python', files[2:]) is None
+        assert host_lints.get_flake8_output('python3', [Path('/content/Other/C.py')]) is None
+
+    def test_flake8_unknown_output(self):
+        """
+        Given
+        - A flake8 output which doesn't start with a linted file path.
+
+        When
+        - Splitting the output per file.
+
+        Then
+        - Ensure no results are added, so the packages run flake8 by themselves.
+        """
+        from demisto_sdk.commands.lint.helpers import BatchedHostLints
+        host_lints = BatchedHostLints()
+
+        assert not host_lints.add_flake8_results(python_exec='python3', files=[Path('/content/A.py')],
+                                                 stdout='There was a critical error\n')
+        assert host_lints.get_flake8_output('python3', [Path('/content/A.py')]) is None
+
+    @pytest.mark.parametrize(argnames="stdout, expected_passed_files", argvalues=[
+        ('{"errors": [{"filename": "/content/B.py", "reason": "syntax error"}], '
+         '"results": [{"filename": "/content/A.py", "test_id": "B103"}]}', ['/content/C.py']),
+        ('Run started', [])
+    ])
+    def test_bandit_results(self, stdout: str, expected_passed_files: list):
+        """
+        Given
+        - A bandit json report with issues and errors, or an output which isn't a json report.
+
+        When
+        - Finding the files bandit found no issues and no errors in.
+
+        Then
+        - Ensure only packages whose files all passed are considered passed.
+        """
+        from demisto_sdk.commands.lint.helpers import BatchedHostLints
+        files = [Path('/content/A.py'), Path('/content/B.py'), Path('/content/C.py')]
+        host_lints = BatchedHostLints()
+
+        assert host_lints.add_bandit_results(files=files, stdout=stdout) == bool(expected_passed_files)
+        assert sorted(host_lints.bandit_passed_files) == expected_passed_files
+        assert host_lints.is_bandit_passed([Path('/content/C.py')]) == bool(expected_passed_files)
+        assert not host_lints.is_bandit_passed([Path('/content/A.py'), Path('/content/C.py')])
+        assert not host_lints.is_bandit_passed([])
+
+
+class TestContainersPool:
+    @staticmethod
+    def start_container(mocker, image: str, started_containers: list):
+        def _start_container():
+            container = mocker.MagicMock(id=f'{image}-{len(started_containers)}')
+            container.exec_run.return_value = (0, b'')
+            started_containers.append(container)
+            return container
+        return _start_container
+
+    def test_reuse_and_recycle(self, mocker):
+        """
+        Given
+        - A containers pool which reuses a container twice.
+
+        When
+        - Acquiring and releasing containers of a test image.
+
+        Then
+        - Ensure a released container is wiped and reused, and replaced by a new container after max uses or a failure.
+        """
+        from demisto_sdk.commands.lint.helpers import ContainersPool
+        started_containers: list = []
+        pool = ContainersPool(max_containers=1, max_uses=2)
+        start_container = self.start_container(mocker, 'image', started_containers)
+
+        first = pool.acquire('image', start_container)
+        pool.release(first)
+        first.exec_run.assert_called_once_with(cmd=['find', '/devwork', '-mindepth', '1', '-delete'], user='root')
+        assert pool.acquire('image', start_container) is first
+        pool.release(first)
+        first.remove.assert_called_once_with(force=True)
+
+        second = pool.acquire('image', start_container)
+        assert second is not first
+        pool.release(second, failed=True)
+        second.remove.assert_called_once_with(force=True)
+        second.exec_run.assert_not_called()
+        assert len(started_containers) == 2
+
+    def test_max_containers(self, mocker):
+        """
+        Given
+        - A containers pool of one container, with an idle container of another test image.
+
+        When
+        - Acquiring a container of a test image.
+
+        Then
+        - Ensure the idle container of the other test image is replaced.
+        - Ensure a package waits for a released container of its test image when all the containers are used.
+        """
+        import threading
+
+        from demisto_sdk.commands.lint.helpers import ContainersPool
+        started_containers: list = []
+        pool = ContainersPool(max_containers=1)
+        other_image_container = pool.acquire('other-image', self.start_container(mocker, 'other-image',
+                                                                                 started_containers))
+        pool.release(other_image_container)
+        container = pool.acquire('image', self.start_container(mocker, 'image', started_containers))
+        other_image_container.remove.assert_called_once_with(force=True)
+
+        acquired = []
+        waiting_package = threading.Thread(target=lambda: acquired.append(
+            pool.acquire('image', self.start_container(mocker, 'image', started_containers))))
+        waiting_package.start()
+        waiting_package.join(timeout=0.1)
+        assert not acquired
+        pool.release(container)
+        waiting_package.join(timeout=5)
+        assert acquired == [container]
+        assert len(started_containers) == 2
+
+    def test_shutdown(self, mocker):
+        """
+        Given
+        - A containers pool with an idle container and a container which is used by a package.
+
+        When
+        - Shutting down the pool, as when lint is stopped by Ctrl-C.
+
+        Then
+        - Ensure all the containers are removed, and no container is acquired after shutdown.
+        """
+        from demisto_sdk.commands.lint.helpers import ContainersPool, docker
+        started_containers: list = []
+        pool = ContainersPool(max_containers=2)
+        start_container = self.start_container(mocker, 'image', started_containers)
+        idle_container = pool.acquire('image', start_container)
+        used_container = pool.acquire('image', start_container)
+        pool.release(idle_container)
+
+        pool.shutdown()
+        pool.release(used_container)
+
+        idle_container.remove.assert_called_once_with(force=True)
+        used_container.remove.assert_called_once_with(force=True)
+        with pytest.raises(docker.errors.APIError):
+            pool.acquire('image', start_container)
+
 
 @pytest.mark.parametrize(argnames="archive_response, expected_count, expected_exception",
                          argvalues=[
@@ -98,3 +98,67 @@ def test_create_failed_unit_tests_report_no_failed_tests():
     lint_manager.LintManager._create_failed_packs_report(lint_status, path)
     file_path = f'{path}/failed_lint_report.txt'
     assert not os.path.isfile(file_path)
+
+
+def test_shutdown(mocker):
+    """
+    Given
+    - Packages threads which are running or didn't start, with checks executed in pooled containers.
+
+    When
+    - Stopping lint, as on Ctrl-C.
+
+    Then
+    - Ensure the packages which didn't start are cancelled and the containers of the pool are removed.
+    """
+    from demisto_sdk.commands.lint import lint_manager
+    executor = MagicMock()
+    futures = [MagicMock(), MagicMock()]
+    containers_pool = MagicMock()
+    lint_manager.LintManager._shutdown(executor=executor, futures=futures, containers_pool=containers_pool)
+
+    assert all(future.cancel.called for future in futures)
+    containers_pool.shutdown.assert_called_once()
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+def test_run_batched_host_lints(mocker):
+    """
+    Given
+    - Two python packages which use the same python executable, and a package which isn't checked on host.
+
+    When
+    - Running the host linters once for all the packages.
+
+    Then
+    - Ensure flake8 and bandit are executed once, and their results are split back per file.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    from demisto_sdk.commands.lint import lint_manager
+    from demisto_sdk.commands.lint.helpers import BatchedHostLints
+    mocker.patch.object(lint_manager, 'logger', create=True)
+    files = [Path('/content/A/A.py'), Path('/content/A/A_test.py'), Path('/content/B/B.py')]
+    linters = [MagicMock(), MagicMock(), MagicMock()]
+    linters[0].get_host_lint_files.return_value = (3.7, files[:1], files[1:2])
+    linters[1].get_host_lint_files.return_value = (3.8, files[2:], [])
+    linters[2].get_host_lint_files.return_value = None
+    flake8_output = "/content/A/A_test.py:1:1: F401 'os' imported but unused\n"
+    bandit_report = '{"errors": [], "results": [{"filename": "/content/B/B.py"}]}'
+    run_command_os = mocker.patch.object(lint_manager, 'run_command_os',
+                                         side_effect=[(flake8_output, '', 1), (bandit_report, '', 1)])
+    manager = lint_manager.LintManager.__new__(lint_manager.LintManager)
+    manager._facts = {"content_repo": None}
+    host_lints = BatchedHostLints()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        manager._run_batched_host_lints(executor=executor, linters=linters, host_lints=host_lints,
+                                        no_flake8=False, no_bandit=False)
+
+    assert run_command_os.call_count == 2
+    assert run_command_os.call_args_list[0].kwargs['command'].startswith('python3 -m flake8')
+    assert host_lints.get_flake8_output('python3', files[:1]) == ''
+    assert host_lints.get_flake8_output('python3', files[1:2]) == flake8_output
+    assert host_lints.is_bandit_passed(files[:1])
+    assert not host_lints.is_bandit_passed(files[2:])
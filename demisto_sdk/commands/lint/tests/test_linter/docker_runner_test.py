@@ -41,6 +41,49 @@ class TestCreateImage:
         assert act_test_image_id == exp_test_image_id
         assert act_errors == exp_errors
 
+    def test_build_image_shared_by_packages(self, linter_obj: Linter, demisto_content, create_integration, mocker):
+        """
+        Given
+        - Two packages with the same base image and requirements, and a package with other requirements.
+
+        When
+        - Creating the images of the packages.
+
+        Then
+        - Ensure the packages are registered for the test images they share.
+        - Ensure a test image is built and pushed once for the packages which share it.
+        - Ensure the pack dir is copied to an image of every package.
+        """
+        from demisto_sdk.commands.lint.helpers import SharedTestImages
+        pack_dir = create_integration(content_path=demisto_content)
+        mocker.patch.object(linter, 'io')
+        test_images = SharedTestImages()
+        linters = [Linter(pack_dir=pack_dir, content_repo=demisto_content, req_3=["pytest==3.0"], req_2=[],
+                          docker_engine=True, test_images=test_images) for _ in range(3)]
+        linters[2]._facts["additional_requirements"] = ["mock"]
+        for linter_runner in linters:
+            linter_runner._pkg_lint_status["pack_type"] = TYPE_PYTHON
+            mocker.patch.object(linter_runner, '_docker_client')
+            linter_runner._docker_client.images.pull.return_value = None
+            linter_runner._docker_hub_login = True
+            linter_runner._facts["images"] = [['demisto/python3:3.8.6.1', 3.8]]
+            linter_runner._skip = False
+            linter_runner.register_test_images()
+
+        assert sorted(test_images.consumers.values()) == [1, 2]
+        for linter_runner in linters:
+            linter_runner._docker_image_create(docker_base_image=['demisto/python3:3.8.6.1', 3.8])
+
+        shared_test_images = {linter_runner._get_test_image_name(['demisto/python3:3.8.6.1', 3.8])
+                              for linter_runner in linters}
+        assert len(shared_test_images) == 2
+        assert sorted(test_images.images) == sorted(shared_test_images)
+        pushed_images = [call_args[0][0] for linter_runner in linters
+                         for call_args in linter_runner._docker_client.images.push.call_args_list]
+        assert sorted(pushed_images) == sorted(shared_test_images)
+        assert all(linter_runner._docker_client.images.build.call_args.kwargs.get('dockerfile') == '.Dockerfile'
+                   for linter_runner in linters)
+
 
 class TestPylint:
     def test_run_pylint_no_errors(self, mocker, linter_obj: Linter):
@@ -149,3 +192,84 @@ class TestRunLintInContainer:
             linter_obj._docker_run_pwsh_analyze.assert_called_once()
         elif not no_pwsh_test and pack_type == TYPE_PWSH:
             linter_obj._docker_run_pwsh_test.assert_called_once()
+
+    def test_run_checks_in_pack_container(self, mocker, linter_obj, lint_files):
+        """
+        Given
+        - A python package with lint files and tests.
+
+        When
+        - Running the docker checks in the package container.
+
+        Then
+        - Ensure the package is copied to one container of the test image, without building an image of the package.
+        - Ensure pylint and pytest are executed in the package container by the image entrypoint.
+        - Ensure only the package container is removed when the checks finished.
+        """
+        mocker.patch.dict(linter_obj._facts, {
+            "images": [["image", 3.7]],
+            "test": True,
+            "lint_files": lint_files,
+            "additional_requirements": []
+        })
+        mocker.patch.dict(linter_obj._pkg_lint_status, {"pack_type": TYPE_PYTHON})
+        mocker.patch.object(linter_obj, '_docker_image_create', return_value=("test-image", ""))
+        mocker.patch.object(linter_obj, '_docker_client')
+        mocker.patch.object(linter, 'copy_dir_to_container')
+        mocker.patch.object(linter, 'get_file_from_container')
+        mocker.patch.object(linter, 'json')
+        linter_obj._docker_client.images.get.return_value.attrs = {"Config": {"Entrypoint": ["/bin/sh", "-c"]}}
+        pack_container = linter_obj._docker_client.containers.run.return_value
+        pack_container.exec_run.return_value = (0, b"")
+
+        linter_obj._run_lint_on_docker_image(no_pylint=False, no_test=False, no_pwsh_analyze=True, no_pwsh_test=True,
+                                             keep_container=False, test_xml="", exec_in_container=True)
+
+        assert linter_obj._pkg_lint_status["exit_code"] == 0b0
+        linter_obj._docker_image_create.assert_called_once_with(docker_base_image=["image", 3.7], copy_pack=False)
+        linter_obj._docker_client.containers.run.assert_called_once()
+        linter.copy_dir_to_container.assert_called_once()
+        assert linter.copy_dir_to_container.call_args.kwargs["container_obj"] is pack_container
+        executed_commands = [call_args.kwargs["cmd"] for call_args in pack_container.exec_run.call_args_list]
+        assert [command[:2] for command in executed_commands] == [["/bin/sh", "-c"]] * 2
+        assert executed_commands[0][2].startswith("python -m pylint")
+        assert executed_commands[1][2].startswith("python -m pytest")
+        pack_container.remove.assert_called_once_with(force=True)
+        linter_obj._docker_client.images.remove.assert_not_called()
+        assert linter_obj._pack_container is None
+
+    @pytest.mark.parametrize(argnames="exec_exit_code, expected_failed", argvalues=[(0, False), (32, True)])
+    def test_run_checks_in_pooled_container(self, mocker, linter_obj, lint_files, exec_exit_code: int,
+                                            expected_failed: bool):
+        """
+        Given
+        - A python package with lint files, which is checked in a container of the containers pool.
+
+        When
+        - Running the docker checks in the package container, successfully or with a pylint usage error.
+
+        Then
+        - Ensure the package container is acquired from the pool and released, as failed if a check failed to run.
+        """
+        mocker.patch.dict(linter_obj._facts, {
+            "images": [["image", 3.7]],
+            "test": False,
+            "lint_files": lint_files,
+            "additional_requirements": []
+        })
+        mocker.patch.dict(linter_obj._pkg_lint_status, {"pack_type": TYPE_PYTHON})
+        mocker.patch.object(linter_obj, '_docker_image_create', return_value=("test-image", ""))
+        mocker.patch.object(linter_obj, '_docker_client')
+        mocker.patch.object(linter, 'copy_dir_to_container')
+        linter_obj._docker_client.images.get.return_value.attrs = {"Config": {"Entrypoint": ["/bin/sh", "-c"]}}
+        linter_obj._containers_pool = mocker.MagicMock()
+        pack_container = linter_obj._containers_pool.acquire.return_value
+        pack_container.exec_run.return_value = (exec_exit_code, b"")
+
+        linter_obj._run_lint_on_docker_image(no_pylint=False, no_test=True, no_pwsh_analyze=True, no_pwsh_test=True,
+                                             keep_container=False, test_xml="", exec_in_container=True)
+
+        assert linter_obj._containers_pool.acquire.call_args.kwargs["image"] == "test-image"
+        linter_obj._docker_client.containers.run.assert_not_called()
+        linter_obj._containers_pool.release.assert_called_once_with(pack_container, failed=expected_failed)
+        pack_container.remove.assert_not_called()
@@ -6,6 +6,31 @@ from demisto_sdk.commands.lint.linter import Linter
 
 
 class TestFlake8:
+    @pytest.mark.parametrize(argnames="batched_output, expected_exit_code",
+                             argvalues=[("", 0b0), ("file.py:1:1: F401\n", 0b1)])
+    def test_run_flake8_batched(self, linter_obj: Linter, lint_files: List[Path], mocker, batched_output: str,
+                                expected_exit_code: int):
+        """
+        Given
+        - The output of flake8 which was executed once for the files of all the packages.
+
+        When
+        - Running flake8 for the package.
+
+        Then
+        - Ensure the batched output is used, without running flake8 again.
+        """
+        from demisto_sdk.commands.lint import linter
+
+        mocker.patch.object(linter, 'run_command_os')
+        linter_obj._host_lints.flake8_outputs['python3'] = {str(lint_files[0]): batched_output}
+
+        exit_code, output = linter_obj._run_flake8(lint_files=lint_files, py_num=3.7)
+
+        assert exit_code == expected_exit_code
+        assert output == batched_output
+        linter.run_command_os.assert_not_called()
+
     def test_run_flake8_success(self, linter_obj: Linter, lint_files: List[Path], mocker):
         from demisto_sdk.commands.lint import linter
 
@@ -43,6 +68,28 @@ class TestFlake8:
 
 
 class TestBandit:
+    def test_run_bandit_batched_passed(self, linter_obj: Linter, lint_files: List[Path], mocker):
+        """
+        Given
+        - Lint files which bandit found no issues in, when it was executed once for the files of all the packages.
+
+        When
+        - Running bandit for the package.
+
+        Then
+        - Ensure the package passes without running bandit again.
+        """
+        from demisto_sdk.commands.lint import linter
+
+        mocker.patch.object(linter, 'run_command_os')
+        linter_obj._host_lints.bandit_passed_files.update(str(lint_file) for lint_file in lint_files)
+
+        exit_code, output = linter_obj._run_bandit(lint_files=lint_files)
+
+        assert exit_code == 0b0
+        assert output == ''
+        linter.run_command_os.assert_not_called()
+
     def test_run_bandit_success(self, linter_obj: Linter, lint_files: List[Path], mocker):
         from demisto_sdk.commands.lint import linter
 
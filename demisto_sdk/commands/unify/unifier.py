@@ -230,20 +230,30 @@ class Unifier:
         :rtype: str
         """
 
+        if self.package_path.endswith('/'):
+            self.package_path = self.package_path[:-1]  # remove the last / as we use os.path.join
+
+        return Unifier.find_code_file(self.package_path, script_type)
+
+    @staticmethod
+    def find_code_file(package_path: str, script_type: str) -> str:
+        """Return the first code file in a package directory, without loading the package yml
+        :param package_path: path to the package directory, without a trailing /
+        :param script_type: script type: .py, .js, .ps1
+        :return: path to found code file
+        """
         ignore_regex = (r'CommonServerPython\.py|CommonServerUserPython\.py|demistomock\.py|_test\.py'
                         r'|conftest\.py|__init__\.py|ApiModule\.py|vulture_whitelist\.py'
                         r'|CommonServerPowerShell\.ps1|CommonServerUserPowerShell\.ps1|demistomock\.ps1|\.Tests\.ps1')
-        if self.package_path.endswith('/'):
-            self.package_path = self.package_path[:-1]  # remove the last / as we use os.path.join
-        if self.package_path.endswith(os.path.join('Scripts', 'CommonServerPython')):
-            return os.path.join(self.package_path, 'CommonServerPython.py')
-        if self.package_path.endswith(os.path.join('Scripts', 'CommonServerPowerShell')):
-            return os.path.join(self.package_path, 'CommonServerPowerShell.ps1')
-        if self.package_path.endswith('ApiModule'):
-            return os.path.join(self.package_path, os.path.basename(os.path.normpath(self.package_path)) + '.py')
+        if package_path.endswith(os.path.join('Scripts', 'CommonServerPython')):
+            return os.path.join(package_path, 'CommonServerPython.py')
+        if package_path.endswith(os.path.join('Scripts', 'CommonServerPowerShell')):
+            return os.path.join(package_path, 'CommonServerPowerShell.ps1')
+        if package_path.endswith('ApiModule'):
+            return os.path.join(package_path, os.path.basename(os.path.normpath(package_path)) + '.py')
 
         script_path = list(filter(lambda x: not re.search(ignore_regex, x, flags=re.IGNORECASE),
-                                  sorted(glob.glob(os.path.join(self.package_path, '*' + script_type)))))[0]
+                                  sorted(glob.glob(os.path.join(package_path, '*' + script_type)))))[0]
 
         return script_path
 
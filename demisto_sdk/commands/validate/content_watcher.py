@@ -0,0 +1,89 @@
+"""
+Polls content paths for changed files, so the validation of a pack which is being edited can run again only on the
+files which were changed, in a process which keeps the schemas, the id_set and the caches loaded.
+"""
+import os
+import time
+from typing import Dict, Iterable, List, Tuple
+
+# The seconds between two polls of the watched paths
+WATCH_POLL_INTERVAL = 0.5
+
+
+class ContentWatcher:
+    """
+    Watches content files and directories by polling the modification time and size of their files.
+
+    Attributes:
+        paths (list): The watched files and directories.
+        interval (float): The seconds between two polls.
+        snapshot (dict): The modification time and size of every watched file, by its path.
+    """
+    IGNORED_DIRS = {'__pycache__', 'node_modules'}
+    # temporary files of editors, which are written while the watched files are saved
+    IGNORED_FILE_PREFIXES = ('.#',)
+    IGNORED_FILE_SUFFIXES = ('~', '.swp', '.swx', '.tmp', '.pyc')
+
+    def __init__(self, paths: Iterable[str], interval: float = WATCH_POLL_INTERVAL):
+        self.paths = list(paths)
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def is_watched_file(self, file_name: str) -> bool:
+        return not file_name.startswith(self.IGNORED_FILE_PREFIXES) and not file_name.endswith(
+            self.IGNORED_FILE_SUFFIXES)
+
+    def take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Returns the modification time and size of every watched file, by its path."""
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for path in self.paths:
+            if os.path.isfile(path):
+                self.add_to_snapshot(snapshot, path)
+                continue
+
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names[:] = sorted(dir_name for dir_name in dir_names
+                                      if dir_name not in self.IGNORED_DIRS and not dir_name.startswith('.'))
+                for file_name in file_names:
+                    if self.is_watched_file(file_name):
+                        self.add_to_snapshot(snapshot, os.path.join(dir_path, file_name))
+
+        return snapshot
+
+    @staticmethod
+    def add_to_snapshot(snapshot: Dict[str, Tuple[int, int]], file_path: str):
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            # the file was deleted while the paths were polled
+            return
+        snapshot[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    def get_changes(self) -> List[str]:
+        """Polls the watched paths once.
+
+        Returns:
+            list. The sorted paths of the files which were added, modified or deleted since the last poll.
+        """
+        snapshot = self.take_snapshot()
+        changed_files = {file_path for file_path, file_stat in snapshot.items()
+                         if self.snapshot.get(file_path) != file_stat}
+        changed_files.update(set(self.snapshot) - set(snapshot))
+        self.snapshot = snapshot
+        return sorted(changed_files)
+
+    def wait_for_changes(self) -> List[str]:
+        """Polls the watched paths until files are changed, and then until they are not changed for a whole poll
+        interval, as saving a file may take more than one write.
+
+        Returns:
+            list. The sorted paths of the files which were added, modified or deleted.
+        """
+        changed_files: List[str] = []
+        while True:
+            time.sleep(self.interval)
+            changes = self.get_changes()
+            if not changes and changed_files:
+                return changed_files
+
+            changed_files = sorted(set(changed_files).union(changes))
@@ -412,7 +412,7 @@ class FilesValidator:
                 self._is_valid = False
 
             if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
+                if not self.id_set_validator.is_file_valid_in_set(file_path, structure_validator.current_file):
                     self._is_valid = False
 
             elif checked_type(file_path, YML_INTEGRATION_REGEXES) or file_type == 'integration':
@@ -605,10 +605,10 @@ class FilesValidator:
                 self._is_valid = False
 
             if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
+                if not self.id_set_validator.is_file_valid_in_set(file_path, structure_validator.current_file):
                     self._is_valid = False
 
-                if self.id_set_validator.is_file_has_used_id(file_path):
+                if self.id_set_validator.is_file_has_used_id(file_path, structure_validator.current_file):
                     self._is_valid = False
 
             elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE) or file_type == 'playbook':
@@ -6,6 +6,7 @@ from shutil import copyfile
 from typing import Any, Type, Union
 
 import pytest
+from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import CONF_PATH, TEST_PLAYBOOK
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.hook_validations.base_validator import \
@@ -450,6 +451,242 @@ class TestValidators:
                                                              id_set_path=id_set_path)
         assert not result
 
+    def test_validate_pack_dependencies_shared_id_set__validate_manager(self, mocker):
+        """
+            Given:
+                - Several packs to validate their dependencies in the same run
+            When:
+                - validating the pack unique files with git
+            Then:
+                - Ensure the id set is loaded and the core packs list is fetched only once
+                - Ensure the dependencies of every pack are calculated only once
+        """
+        from demisto_sdk.commands.common.id_set import IdSet
+        from demisto_sdk.commands.find_dependencies.find_dependencies import \
+            PackDependencies
+        load_id_set = mocker.spy(IdSet, 'load')
+        get_core_pack_list = mocker.patch('demisto_sdk.commands.validate.validate_manager.get_core_pack_list',
+                                          return_value=['Base'])
+        find_pack_dependencies = mocker.spy(PackDependencies, '_find_pack_dependencies')
+        validate_manager = ValidateManager(skip_conf_json=True, use_git=True)
+        id_set_path = os.path.normpath(
+            os.path.join(__file__, git_path(), 'demisto_sdk', 'tests', 'test_files', 'id_set', 'id_set.json'))
+
+        for pack in ['QRadar', VALID_PACK, 'QRadar']:
+            validate_manager.validate_pack_unique_files(pack, pack_error_ignore_list={}, id_set_path=id_set_path)
+        calculated_packs = [call[0][0] for call in find_pack_dependencies.call_args_list]
+
+        assert load_id_set.call_count == 1
+        assert get_core_pack_list.call_count == 1
+        assert len(calculated_packs) == len(set(calculated_packs))
+        assert 'QRadar' in calculated_packs
+
+    def test_prefetch_docker_images_latest_tags(self, mocker, repo):
+        """
+            Given:
+                - A pack with integrations and scripts which use several docker images
+            When:
+                - Prefetching the latest tags of the docker images of the pack
+            Then:
+                - Ensure the tags of the demisto docker images are prefetched at once, including the default images
+                - Ensure the tags are not prefetched when the docker checks are skipped
+        """
+        from demisto_sdk.commands.common.hook_validations.docker import \
+            DockerImageValidator
+        prefetch_latest_tags = mocker.patch.object(DockerImageValidator, 'prefetch_latest_tags')
+        pack = repo.create_pack('PackName')
+        pack.create_integration('integration').create_default_integration()
+        for name, docker_image, python_version in [('pyjwt', 'demisto/pyjwt:1.0', 'python3'),
+                                                   ('no_image', '', 'python2'),
+                                                   ('not_demisto', 'other/image:1.0', 'python3')]:
+            script = pack.create_script(name)
+            script.create_default_script()
+            script.yml.update({'dockerimage': docker_image, 'subtype': python_version})
+
+        ValidateManager(skip_conf_json=True).prefetch_docker_images_latest_tags([pack.path])
+        ValidateManager(skip_conf_json=True, no_docker_checks=True).prefetch_docker_images_latest_tags([pack.path])
+
+        prefetch_latest_tags.assert_called_once_with({'demisto/python3', 'demisto/pyjwt', 'demisto/python'})
+
+    def test_validation_cache_key(self, repo):
+        """
+            Given:
+                - An integration package in a pack
+            When:
+                - Calculating the validation cache key of the integration yml
+            Then:
+                - Ensure the key changes when the integration code or its ignored errors change
+                - Ensure the key does not change when the errors ignored for other files change
+        """
+        pack = repo.create_pack('PackName')
+        integration = pack.create_integration('integration')
+        integration.create_default_integration()
+        yml_path = os.path.join('Packs', 'PackName', 'Integrations', 'integration', 'integration.yml')
+
+        def get_key():
+            validate_manager = ValidateManager(use_cache=True)
+            pack_error_ignore_list = validate_manager.get_error_ignore_list('PackName')
+            return validate_manager.get_validation_cache_key(yml_path, pack_error_ignore_list)
+
+        with ChangeCWD(repo.path):
+            original_key = get_key()
+            assert get_key() == original_key
+
+            integration.code.write('print("changed")')
+            changed_code_key = get_key()
+            assert changed_code_key != original_key
+
+            pack.pack_ignore.write_list(['[file:other.yml]', 'ignore=BA101'])
+            assert get_key() == changed_code_key
+
+            pack.pack_ignore.write_list(['[file:integration.yml]', 'ignore=BA101'])
+            assert get_key() != changed_code_key
+
+    def test_validation_cache_key_old_file_version(self, repo):
+        """
+            Given:
+                - A modified integration yml, whose old version is read from the prev_ver branch
+            When:
+                - Calculating the validation cache key before and after the prev_ver branch is moved to a commit
+                  with another old version of the integration, while the integration itself does not change
+            Then:
+                - Ensure the key changes, so a result cached against the former old version is not replayed
+        """
+        pack = repo.create_pack('PackName')
+        integration = pack.create_integration('integration')
+        integration.create_default_integration()
+        yml_path = os.path.join('Packs', 'PackName', 'Integrations', 'integration', 'integration.yml')
+        for command in ['git init -q', 'git config user.email test@test.com', 'git config user.name test',
+                        'git add .', 'git commit -q -m old', 'git branch prev']:
+            tools.run_command(command, cwd=repo.path)
+        integration.yml.update({'display': 'new display'})
+
+        def get_key():
+            validate_manager = ValidateManager(use_cache=True, prev_ver='prev')
+            pack_error_ignore_list = validate_manager.get_error_ignore_list('PackName')
+            return validate_manager.get_validation_cache_key(yml_path, pack_error_ignore_list, is_modified=True)
+
+        with ChangeCWD(repo.path):
+            original_key = get_key()
+            assert get_key() == original_key
+
+            for command in ['git add .', 'git commit -q -m new', 'git branch -f prev HEAD']:
+                tools.run_command(command, cwd=repo.path)
+            assert get_key() != original_key
+
+    def test_validation_cache_key_unreadable_old_file(self, mocker):
+        """
+            Given:
+                - A modified file whose old version can not be read from the local git repository
+            When:
+                - Calculating the validation cache key of the file
+            Then:
+                - Ensure the file is not cached, instead of failing its validation
+        """
+        mocker.patch.object(tools, 'get_local_git_files', side_effect=ValueError('invalid header'))
+        validate_manager = ValidateManager(use_cache=True, skip_conf_json=True)
+
+        assert validate_manager.get_validation_cache_key('Packs/My Pack/Scripts/script-x.yml', {},
+                                                         is_modified=True) is None
+
+    def test_content_watcher_changes(self, tmp_path):
+        """
+            Given:
+                - A watched directory with content files
+            When:
+                - Modifying, adding and deleting files, and writing editor temporary files
+            Then:
+                - Ensure the modified, added and deleted files are found as changed, once
+                - Ensure the editor temporary files are not watched
+        """
+        from demisto_sdk.commands.validate.content_watcher import \
+            ContentWatcher
+        (tmp_path / 'modified.yml').write_text('name: modified')
+        (tmp_path / 'deleted.json').write_text('{}')
+        (tmp_path / 'unchanged.md').write_text('unchanged')
+        watcher = ContentWatcher([str(tmp_path)], interval=0)
+
+        (tmp_path / 'modified.yml').write_text('name: modified again')
+        (tmp_path / 'deleted.json').unlink()
+        (tmp_path / 'Scripts').mkdir()
+        (tmp_path / 'Scripts' / 'added.yml').write_text('name: added')
+        (tmp_path / 'Scripts' / '.added.yml.swp').write_text('swap')
+        (tmp_path / 'Scripts' / 'added.yml~').write_text('backup')
+
+        assert watcher.get_changes() == [str(tmp_path / 'Scripts' / 'added.yml'), str(tmp_path / 'deleted.json'),
+                                         str(tmp_path / 'modified.yml')]
+        assert watcher.get_changes() == []
+
+    def test_get_changed_validation_paths(self, repo):
+        """
+            Given:
+                - Changed files in a package, in a content directory and at the pack level, and a deleted package
+            When:
+                - Getting the paths to validate again in watch mode
+            Then:
+                - Ensure packages are validated for their changed files, and pack level files for their whole pack
+                - Ensure the files of a pack which is validated are not validated on their own
+        """
+        first_pack = repo.create_pack('FirstPack')
+        first_pack.create_integration('integration').create_default_integration()
+        first_pack.create_incident_field('field')
+        second_pack = repo.create_pack('SecondPack')
+        second_pack.create_script('script').create_default_script()
+        integration_path = os.path.join('Packs', 'FirstPack', 'Integrations', 'integration')
+        changed_files = [os.path.join(integration_path, 'integration.py'),
+                         os.path.join(integration_path, 'README.md'),
+                         os.path.join('Packs', 'FirstPack', 'IncidentFields', 'incident-field-field.json'),
+                         os.path.join('Packs', 'FirstPack', 'IncidentFields', 'notes.txt'),
+                         os.path.join('Packs', 'FirstPack', 'Integrations', 'deleted', 'deleted.yml'),
+                         os.path.join('Packs', 'SecondPack', 'Scripts', 'script', 'script.py'),
+                         os.path.join('Packs', 'SecondPack', '.pack-ignore')]
+
+        with ChangeCWD(repo.path):
+            validation_paths = ValidateManager.get_changed_validation_paths(changed_files, ['Packs'])
+
+        assert validation_paths == [integration_path,
+                                    os.path.join('Packs', 'FirstPack', 'IncidentFields', 'incident-field-field.json'),
+                                    os.path.join('Packs', 'SecondPack')]
+
+    def test_run_validation_in_watch_mode(self, mocker, repo):
+        """
+            Given:
+                - A pack which is validated in watch mode
+            When:
+                - A file of an integration package is changed, and then the watch is interrupted
+            Then:
+                - Ensure the package is validated again, after the errors of the first validation are cleared
+                - Ensure the exit code is the one of the last validation
+        """
+        from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS
+        from demisto_sdk.commands.validate.content_watcher import \
+            ContentWatcher
+        pack = repo.create_pack('PackName')
+        pack.create_integration('integration').create_default_integration()
+        pack_path = os.path.join('Packs', 'PackName')
+        integration_path = os.path.join(pack_path, 'Integrations', 'integration')
+
+        def validate_first_run():
+            FOUND_FILES_AND_ERRORS.append('error from the first run')
+            return 1
+
+        def validate_changed_files(paths):
+            assert FOUND_FILES_AND_ERRORS == []
+            return True
+
+        with ChangeCWD(repo.path):
+            validate_manager = ValidateManager(file_path=pack_path, skip_conf_json=True)
+            mocker.patch.object(validate_manager, 'run_validation', side_effect=validate_first_run)
+            run_validation_on_specific_files = mocker.patch.object(validate_manager,
+                                                                   'run_validation_on_specific_files',
+                                                                   side_effect=validate_changed_files)
+            mocker.patch.object(ContentWatcher, 'wait_for_changes',
+                                side_effect=[[os.path.join(integration_path, 'integration.py')], KeyboardInterrupt])
+
+            assert validate_manager.run_validation_in_watch_mode() == 0
+
+        run_validation_on_specific_files.assert_called_once_with([integration_path])
+
     FILE_PATH = [
         ([VALID_SCRIPT_PATH], 'script')
     ]
@@ -1,9 +1,17 @@
+import hashlib
+import io
 import os
 import re
+import sys
+import time
 from configparser import ConfigParser, MissingSectionHeaderError
-from typing import Optional
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
+from multiprocessing import get_all_start_methods, get_context
+from typing import Callable, List, NamedTuple, Optional
 
 import click
+import yaml
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -26,6 +34,8 @@ from demisto_sdk.commands.common.hook_validations.conf_json import \
     ConfJsonValidator
 from demisto_sdk.commands.common.hook_validations.dashboard import \
     DashboardValidator
+from demisto_sdk.commands.common.hook_validations.docker import \
+    DockerImageValidator
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
 from demisto_sdk.commands.common.hook_validations.image import ImageValidator
 from demisto_sdk.commands.common.hook_validations.incident_field import \
@@ -37,8 +47,8 @@ from demisto_sdk.commands.common.hook_validations.integration import \
 from demisto_sdk.commands.common.hook_validations.layout import (
     LayoutsContainerValidator, LayoutValidator)
 from demisto_sdk.commands.common.hook_validations.mapper import MapperValidator
-from demisto_sdk.commands.common.hook_validations.pack_unique_files import \
-    PackUniqueFilesValidator
+from demisto_sdk.commands.common.hook_validations.pack_unique_files import (
+    PackUniqueFilesValidator, get_core_pack_list)
 from demisto_sdk.commands.common.hook_validations.playbook import \
     PlaybookValidator
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
@@ -50,6 +60,7 @@ from demisto_sdk.commands.common.hook_validations.script import ScriptValidator
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
 from demisto_sdk.commands.common.hook_validations.widget import WidgetValidator
+from demisto_sdk.commands.common.id_set import IdSet
 from demisto_sdk.commands.common.tools import (checked_type,
                                                filter_packagify_changes,
                                                find_type,
@@ -60,13 +71,105 @@ from demisto_sdk.commands.common.tools import (checked_type,
                                                is_origin_content_repo,
                                                run_command)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+from demisto_sdk.commands.validate.content_watcher import (
+    WATCH_POLL_INTERVAL, ContentWatcher)
+from demisto_sdk.commands.validate.validation_cache import ValidationCache
+
+
+class FileValidationResult(NamedTuple):
+    """The result of a file validation which ran in a worker process or was kept in the validation cache, to be
+    reported by the main process."""
+    file_path: str
+    is_valid: bool
+    output: str
+    error_output: str
+    found_errors: List[str]
+    found_ignored_errors: List[str]
+    ignored_files: List[str]
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class CapturedOutput(io.StringIO):
+    """Captures the output of a worker process, keeping the colors if the stream it replaces is a terminal."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._is_tty = stream.isatty()
+
+    def isatty(self):
+        return self._is_tty
+
+
+# The validate manager which the validation workers inherit from the main process when they are forked.
+_WORKER_VALIDATE_MANAGER: Optional['ValidateManager'] = None
+
+
+def capture_file_validation(validate_manager: 'ValidateManager', file_path: str,
+                            validate_file: Callable[[], bool]) -> FileValidationResult:
+    """Runs a file validation, capturing its output, errors and ignored files.
+
+    Args:
+        validate_manager: the validate manager which validates the file.
+        file_path: the path of the validated file.
+        validate_file: runs the validation of the file.
+
+    Returns:
+        FileValidationResult. The validation result of the file.
+    """
+    found_errors_count = len(FOUND_FILES_AND_ERRORS)
+    found_ignored_errors_count = len(FOUND_FILES_AND_IGNORED_ERRORS)
+    ignored_files = set(validate_manager.ignored_files)
+    output, error_output = CapturedOutput(sys.stdout), CapturedOutput(sys.stderr)
+
+    try:
+        with redirect_stdout(output), redirect_stderr(error_output):
+            is_valid = validate_file()
+
+    except BaseException:
+        # Print what was validated before the failure, as an uncaptured validation would
+        sys.stdout.write(output.getvalue())
+        sys.stderr.write(error_output.getvalue())
+        raise
+
+    return FileValidationResult(file_path=file_path,
+                                is_valid=bool(is_valid),
+                                output=output.getvalue(),
+                                error_output=error_output.getvalue(),
+                                found_errors=FOUND_FILES_AND_ERRORS[found_errors_count:],
+                                found_ignored_errors=FOUND_FILES_AND_IGNORED_ERRORS[found_ignored_errors_count:],
+                                ignored_files=sorted(validate_manager.ignored_files - ignored_files))
+
+
+def validate_file_in_worker(task) -> FileValidationResult:
+    """Validates a file with the validate manager of the validation workers, capturing its output and errors.
+
+    Args:
+        task (tuple): the path of the file to validate and the error ignore list of its pack.
+
+    Returns:
+        FileValidationResult. The validation result of the file.
+    """
+    file_path, pack_error_ignore_list = task
+    validate_manager = _WORKER_VALIDATE_MANAGER
+    if validate_manager is None:
+        raise RuntimeError('The validation workers must be forked by run_validations_on_packs_in_parallel')
+    validation_cache = validate_manager.validation_cache
+    cache_hits, cache_misses = (validation_cache.hits, validation_cache.misses) if validation_cache else (0, 0)
+    file_validation_result = capture_file_validation(
+        validate_manager, file_path, lambda: validate_manager.run_validations_on_file(file_path, pack_error_ignore_list))
+
+    if validation_cache:
+        file_validation_result = file_validation_result._replace(cache_hits=validation_cache.hits - cache_hits,
+                                                                 cache_misses=validation_cache.misses - cache_misses)
+    return file_validation_result
 
 
 class ValidateManager:
     def __init__(self, is_backward_check=True, prev_ver=None, use_git=False, only_committed_files=False,
                  print_ignored_files=False, skip_conf_json=True, validate_id_set=False, file_path=None,
                  validate_all=False, is_external_repo=False, skip_pack_rn_validation=False, print_ignored_errors=False,
-                 silence_init_prints=False, no_docker_checks=False):
+                 silence_init_prints=False, no_docker_checks=False, workers=1, use_cache=False):
 
         # General configuration
         self.skip_docker_checks = False
@@ -82,6 +185,7 @@ class ValidateManager:
         self.print_ignored_files = print_ignored_files
         self.print_ignored_errors = print_ignored_errors
         self.compare_type = '...'
+        self.workers = workers
 
         # Class constants
         self.handle_error = BaseValidator(print_as_warnings=print_ignored_errors).handle_error
@@ -94,6 +198,15 @@ class ValidateManager:
         self.new_packs = set()
         self.skipped_file_types = (FileType.CHANGELOG, FileType.DESCRIPTION, FileType.TEST_PLAYBOOK)
 
+        # Loaded once per run and shared by all the pack dependencies validations
+        self.id_set = None
+        self.core_pack_list = None
+        self.pack_dependencies_cache: dict = {}
+
+        # Keeps the results of valid files between runs
+        self.validation_cache = ValidationCache() if use_cache else None
+        self.prev_ver_commit: Optional[str] = None
+
         if is_external_repo:
             if not self.no_configuration_prints:
                 click.echo('Running in a private repository')
@@ -113,6 +226,8 @@ class ValidateManager:
     def print_final_report(self, valid):
         self.print_ignored_files_report(self.print_ignored_files)
         self.print_ignored_errors_report(self.print_ignored_errors)
+        if self.validation_cache:
+            click.echo(f'\nValidation cache: {self.validation_cache.hits} hits, {self.validation_cache.misses} misses')
 
         if valid:
             click.secho('\nThe files are valid', fg='green')
@@ -148,12 +263,17 @@ class ValidateManager:
 
         return self.print_final_report(is_valid)
 
-    def run_validation_on_specific_files(self):
+    def run_validation_on_specific_files(self, paths=None):
         """Run validations only on specific files
+
+        Args:
+            paths (list): The files, packages, content directories and packs to validate, the input paths by default.
         """
         files_validation_result = set()
+        paths = paths or self.file_path.split(',')
+        self.prefetch_docker_images_latest_tags(paths)
 
-        for path in self.file_path.split(','):
+        for path in paths:
             error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
 
             if os.path.isfile(path):
@@ -180,6 +300,96 @@ class ValidateManager:
 
         return all(files_validation_result)
 
+    def run_validation_in_watch_mode(self, interval=WATCH_POLL_INTERVAL):
+        """Runs the validation of the input paths, and then validates again the files which are changed, until the
+        watch is interrupted. The schemas, the id_set and the caches stay loaded between the validations. (i)
+
+        Args:
+            interval (float): The seconds between two polls of the input paths.
+
+        Returns:
+            int. The exit code of the last validation.
+        """
+        watched_paths = self.file_path.split(',')
+        # the snapshot is taken before the first validation, so files changed during it are validated again
+        watcher = ContentWatcher(watched_paths, interval)
+        exit_code = self.run_validation()
+
+        try:
+            while True:
+                click.secho(f'\nWatching {", ".join(watched_paths)} for changes, press Ctrl+C to stop.',
+                            fg='bright_cyan')
+                validation_paths: List[str] = []
+                while not validation_paths:
+                    validation_paths = self.get_changed_validation_paths(watcher.wait_for_changes(), watched_paths)
+
+                self.reset_run_state()
+                start_time = time.monotonic()
+                exit_code = self.print_final_report(self.run_validation_on_specific_files(validation_paths))
+                click.echo(f'Validated the changed files in {time.monotonic() - start_time:.2f} seconds')
+
+        except KeyboardInterrupt:
+            click.echo('\nStopped watching for changes')
+
+        return exit_code
+
+    @staticmethod
+    def get_changed_validation_paths(changed_files, watched_paths):
+        """Returns the paths to validate after files were changed, the way they are validated with -i: the changed
+        files, the packages they belong to, or their packs if files at the pack level were changed, e.g.
+        pack_metadata.json or .pack-ignore, which affect the validation of the whole pack.
+
+        Args:
+            changed_files (list): The paths of the added, modified and deleted files.
+            watched_paths (list): The input paths which are watched.
+
+        Returns:
+            list. The paths to validate.
+        """
+        validation_paths: dict = {}
+        for file_path in changed_files:
+            package_path = ValidationCache.get_validated_path(file_path)
+            parent_path = os.path.dirname(file_path)
+            if file_path in watched_paths:
+                validation_path = file_path
+
+            elif package_path != file_path:
+                # the files of a package are validated with the whole package
+                validation_path = package_path
+
+            elif os.path.basename(parent_path) in CONTENT_ENTITIES_DIRS:
+                if not file_path.endswith(('.json', '.yml', '.md')):
+                    continue
+                validation_path = file_path
+
+            elif os.path.basename(os.path.dirname(parent_path)) == PACKS_DIR:
+                validation_path = parent_path
+
+            else:
+                continue
+
+            # deleted files are not validated, but the packages and packs they were in are
+            if os.path.exists(validation_path):
+                validation_paths[validation_path] = None
+
+        # the files of packs which are validated are not validated on their own
+        packs = [path for path in validation_paths if os.path.basename(os.path.dirname(path)) == PACKS_DIR]
+        return [path for path in validation_paths
+                if path in packs or not any(path.startswith(f'{pack}{os.sep}') for pack in packs)]
+
+    def reset_run_state(self):
+        """Forgets the errors, ignored files and per run caches of the last validation, keeping the schemas, the
+        id_set and the other caches loaded, so files can be validated again in the same process (--watch)."""
+        FOUND_FILES_AND_ERRORS.clear()
+        FOUND_FILES_AND_IGNORED_ERRORS.clear()
+        self.ignored_files.clear()
+        self.pack_dependencies_cache.clear()
+        if self.validation_cache:
+            self.validation_cache.reset_run()
+        self.prev_ver_commit = None
+        if self.validate_in_id_set:
+            self.id_set_validator.files_data.clear()
+
     def run_validation_on_all_packs(self):
         """Runs validations on all files in all packs in repo (-a option)
 
@@ -193,12 +403,77 @@ class ValidateManager:
             conf_json_validator = ConfJsonValidator()
             all_packs_valid.add(conf_json_validator.is_valid_conf_json())
 
-        for pack_name in os.listdir(PACKS_DIR):
-            pack_path = os.path.join(PACKS_DIR, pack_name)
-            all_packs_valid.add(self.run_validations_on_pack(pack_path))
+        pack_paths = [os.path.join(PACKS_DIR, pack_name) for pack_name in sorted(os.listdir(PACKS_DIR))]
+        if self.workers > 1 and 'fork' in get_all_start_methods():
+            all_packs_valid.add(self.run_validations_on_packs_in_parallel(pack_paths))
+
+        else:
+            for pack_path in pack_paths:
+                all_packs_valid.add(self.run_validations_on_pack(pack_path))
 
         return all(all_packs_valid)
 
+    def run_validations_on_packs_in_parallel(self, pack_paths):
+        """Runs validation on all files in the given packs on a pool of worker processes.
+        The files are validated by the workers, and their output and errors are reported pack by pack in the same
+        order as in a serial run, while the pack unique files are validated in this process.
+
+        Args:
+            pack_paths: the paths to the packs.
+
+        Returns:
+            bool. true if all files in the packs are valid, false otherwise.
+        """
+        global _WORKER_VALIDATE_MANAGER
+        packs_validation_results = set()
+        packs_files = {pack_path: self.get_pack_files(pack_path) for pack_path in pack_paths}
+        packs_error_ignore_lists = {pack_path: self.get_error_ignore_list(os.path.basename(pack_path))
+                                    for pack_path in pack_paths}
+        tasks = [(file_path, packs_error_ignore_lists[pack_path])
+                 for pack_path in pack_paths for file_path in packs_files[pack_path]]
+
+        _WORKER_VALIDATE_MANAGER = self
+        try:
+            with get_context('fork').Pool(processes=self.workers) as pool:
+                files_validation_results = pool.imap(validate_file_in_worker, tasks)
+                for pack_path in pack_paths:
+                    packs_validation_results.add(self.validate_pack_unique_files(pack_path,
+                                                                                 packs_error_ignore_lists[pack_path]))
+                    for _ in packs_files[pack_path]:
+                        packs_validation_results.add(
+                            self.report_file_validation_result(next(files_validation_results)))
+        finally:
+            _WORKER_VALIDATE_MANAGER = None
+
+        return all(packs_validation_results)
+
+    def report_file_validation_result(self, file_validation_result: FileValidationResult):
+        """Prints the output of a file validation which ran in a worker process or was kept in the validation cache,
+        and adds its errors, ignored files and cache usage to the ones of this run.
+
+        Args:
+            file_validation_result: the validation result of the file.
+
+        Returns:
+            bool. true if the file is valid, false otherwise.
+        """
+        sys.stdout.write(file_validation_result.output)
+        sys.stderr.write(file_validation_result.error_output)
+        for found_error in file_validation_result.found_errors:
+            if found_error not in FOUND_FILES_AND_ERRORS:
+                FOUND_FILES_AND_ERRORS.append(found_error)
+
+        for found_ignored_error in file_validation_result.found_ignored_errors:
+            if found_ignored_error not in FOUND_FILES_AND_IGNORED_ERRORS:
+                FOUND_FILES_AND_IGNORED_ERRORS.append(found_ignored_error)
+
+        self.ignored_files.update(file_validation_result.ignored_files)
+        if self.validation_cache:
+            self.validation_cache.hits += file_validation_result.cache_hits
+            self.validation_cache.misses += file_validation_result.cache_misses
+
+        return file_validation_result.is_valid
+
     def run_validations_on_pack(self, pack_path):
         """Runs validation on all files in given pack. (i,g,a)
 
@@ -213,13 +488,8 @@ class ValidateManager:
 
         pack_entities_validation_results.add(self.validate_pack_unique_files(pack_path, pack_error_ignore_list))
 
-        for content_dir in os.listdir(pack_path):
-            content_entity_path = os.path.join(pack_path, content_dir)
-            if content_dir in CONTENT_ENTITIES_DIRS:
-                pack_entities_validation_results.add(self.run_validation_on_content_entities(content_entity_path,
-                                                                                             pack_error_ignore_list))
-            else:
-                self.ignored_files.add(content_entity_path)
+        for file_path in self.get_pack_files(pack_path):
+            pack_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
 
         return all(pack_entities_validation_results)
 
@@ -230,37 +500,196 @@ class ValidateManager:
             bool. true if all files in directory are valid, false otherwise.
         """
         content_entities_validation_results = set()
-        for file_name in os.listdir(content_entity_dir_path):
+        for file_path in self.get_content_entities_files(content_entity_dir_path):
+            content_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
+
+        return all(content_entities_validation_results)
+
+    def run_validation_on_package(self, package_path, pack_error_ignore_list):
+        package_entities_validation_results = set()
+
+        for file_path in self.get_package_files(package_path):
+            package_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
+
+        return all(package_entities_validation_results)
+
+    def get_pack_files(self, pack_path):
+        """Returns the files to validate in a pack, sorted by path, and marks its other files as ignored.
+
+        Args:
+            pack_path: the path to the pack.
+
+        Returns:
+            list. The paths of the files to validate.
+        """
+        files_to_validate = []
+        for content_dir in sorted(os.listdir(pack_path)):
+            content_entity_path = os.path.join(pack_path, content_dir)
+            if content_dir in CONTENT_ENTITIES_DIRS:
+                files_to_validate.extend(self.get_content_entities_files(content_entity_path))
+            else:
+                self.ignored_files.add(content_entity_path)
+
+        return files_to_validate
+
+    def get_content_entities_files(self, content_entity_dir_path):
+        """Returns the files to validate in a content entities folder (Scripts, Integrations...), sorted by path,
+        and marks its other files as ignored.
+
+        Returns:
+            list. The paths of the files to validate.
+        """
+        files_to_validate = []
+        for file_name in sorted(os.listdir(content_entity_dir_path)):
             file_path = os.path.join(content_entity_dir_path, file_name)
             if os.path.isfile(file_path):
                 if file_path.endswith('.json') or file_path.endswith('.yml') or file_path.endswith('.md'):
-                    content_entities_validation_results.add(self.run_validations_on_file(file_path,
-                                                                                         pack_error_ignore_list))
+                    files_to_validate.append(file_path)
                 else:
                     self.ignored_files.add(file_path)
 
             else:
-                content_entities_validation_results.add(self.run_validation_on_package(file_path,
-                                                                                       pack_error_ignore_list))
+                files_to_validate.extend(self.get_package_files(file_path))
 
-        return all(content_entities_validation_results)
+        return files_to_validate
 
-    def run_validation_on_package(self, package_path, pack_error_ignore_list):
-        package_entities_validation_results = set()
+    def get_package_files(self, package_path):
+        """Returns the files to validate in a package, sorted by path, and marks its other files as ignored.
 
-        for file_name in os.listdir(package_path):
+        Returns:
+            list. The paths of the files to validate.
+        """
+        files_to_validate = []
+        for file_name in sorted(os.listdir(package_path)):
             file_path = os.path.join(package_path, file_name)
             if file_path.endswith('.yml') or file_path.endswith('.md'):
-                package_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
+                files_to_validate.append(file_path)
 
             else:
                 self.ignored_files.add(file_path)
 
-        return all(package_entities_validation_results)
+        return files_to_validate
 
-    # flake8: noqa: C901
     def run_validations_on_file(self, file_path, pack_error_ignore_list, is_modified=False,
                                 old_file_path=None, modified_files=None, added_files=None):
+        """Runs the validations of a single file, or replays its result from the validation cache if the file was
+        found valid by an earlier run with the same inputs. (i)
+
+        Args:
+            modified_files: A set of modified files - used for RN validation
+            added_files: A set of added files - used for RN validation
+            old_file_path: The old file path for renamed files
+            pack_error_ignore_list: A dictionary of all pack ignored errors
+            file_path: the file on which to run.
+            is_modified: whether the file is modified or added.
+
+        Returns:
+            bool. true if file is valid, false otherwise.
+        """
+        if not self.validation_cache:
+            return self.run_validators_on_file(file_path, pack_error_ignore_list, is_modified, old_file_path,
+                                               modified_files, added_files)
+
+        cache_key = self.get_validation_cache_key(file_path, pack_error_ignore_list, is_modified, old_file_path,
+                                                  modified_files, added_files)
+        if not cache_key:
+            return self.run_validators_on_file(file_path, pack_error_ignore_list, is_modified, old_file_path,
+                                               modified_files, added_files)
+
+        cached_result = self.validation_cache.get(cache_key)
+        if cached_result:
+            self.validation_cache.hits += 1
+            return self.report_file_validation_result(FileValidationResult(**cached_result))
+
+        self.validation_cache.misses += 1
+        file_validation_result = capture_file_validation(
+            self, file_path, lambda: self.run_validators_on_file(file_path, pack_error_ignore_list, is_modified,
+                                                                 old_file_path, modified_files, added_files))
+        # Invalid files are validated again on each run, so their errors are never reported from a stale result
+        if file_validation_result.is_valid:
+            self.validation_cache.set(cache_key, file_validation_result._asdict())
+
+        return self.report_file_validation_result(file_validation_result)
+
+    def get_validation_cache_key(self, file_path, pack_error_ignore_list, is_modified=False, old_file_path=None,
+                                 modified_files=None, added_files=None):
+        """Calculates the validation cache key of a file from its content and everything else its validation reads.
+
+        Args:
+            file_path: the file on which to run.
+            pack_error_ignore_list: A dictionary of all pack ignored errors
+            is_modified: whether the file is modified or added.
+            old_file_path: The old file path for renamed files
+            modified_files: A set of modified files - used for RN validation
+            added_files: A set of added files - used for RN validation
+
+        Returns:
+            str. The validation cache key of the file, or None if the file can not be cached - when the cache is
+            disabled, or the old version of a modified file can not be read from the local git repository.
+        """
+        validation_cache = self.validation_cache
+        if not validation_cache:
+            return None
+
+        cross_file_inputs = []
+        pack_name = get_pack_name(file_path)
+        if pack_name:
+            cross_file_inputs.append(os.path.join(PACKS_DIR, pack_name, PACKS_PACK_META_FILE_NAME))
+
+        if not self.skip_conf_json:
+            cross_file_inputs.append(ConfJsonValidator.CONF_PATH)
+
+        if self.validate_in_id_set:
+            cross_file_inputs.append(IDSetValidator.ID_SET_PATH)
+
+        settings = {
+            'is_modified': is_modified,
+            'old_file_path': old_file_path,
+            'modified_files': sorted(str(modified_file) for modified_file in modified_files or []),
+            'added_files': sorted(str(added_file) for added_file in added_files or []),
+            'new_packs': sorted(self.new_packs),
+            'is_backward_check': self.is_backward_check,
+            'prev_ver': self.get_prev_ver_commit(),
+            'is_circle': self.is_circle,
+            'skip_conf_json': self.skip_conf_json,
+            'skip_docker_checks': self.skip_docker_checks,
+            'skip_pack_rn_validation': self.skip_pack_rn_validation,
+            'validate_in_id_set': self.validate_in_id_set,
+            'print_ignored_errors': self.print_ignored_errors,
+            'check_only_schema': self.check_only_schema,
+            'is_tty': sys.stdout.isatty(),
+        }
+        if not self.skip_docker_checks:
+            # The latest docker image tags change over time, so the results of the docker checks expire daily
+            settings['date'] = datetime.utcnow().date().isoformat()
+
+        if is_modified or old_file_path:
+            # The backward compatibility checks compare the file to its old version
+            old_file = old_file_path or file_path
+            try:
+                old_file_content = tools.get_local_git_files([old_file], tag=self.prev_ver)[old_file]
+            except (OSError, ValueError) as err:
+                click.secho(f'Could not read the old version of {old_file}, validating it without the cache: {err}',
+                            fg='yellow')
+                return None
+            if old_file_content is None and os.environ.get(tools.GITHUB_FALLBACK_ENV_VAR):
+                return None
+            settings['old_file_hash'] = hashlib.sha1(old_file_content).hexdigest() if old_file_content else ''
+
+        return validation_cache.get_key(file_path, pack_error_ignore_list, cross_file_inputs, settings)
+
+    def get_prev_ver_commit(self):
+        """Returns the commit which prev_ver points to, resolved once per run, so validation results cached before
+        a fetch moved the prev_ver branch are not replayed. Falls back to prev_ver if it is not in the local repository.
+        """
+        if self.prev_ver_commit is None:
+            _, commit = tools.resolve_local_git_revision(self.prev_ver)
+            self.prev_ver_commit = commit or self.prev_ver
+        return self.prev_ver_commit
+
+    # flake8: noqa: C901
+    def run_validators_on_file(self, file_path, pack_error_ignore_list, is_modified=False,
+                               old_file_path=None, modified_files=None, added_files=None):
         """Choose a validator to run for a single file. (i)
 
         Args:
@@ -303,7 +732,7 @@ class ValidateManager:
 
         if self.validate_in_id_set:
             click.echo(f"Validating id set registration for {file_path}")
-            if not self.id_set_validator.is_file_valid_in_set(file_path):
+            if not self.id_set_validator.is_file_valid_in_set(file_path, structure_validator.current_file):
                 return False
 
         # Note: these file are not ignored but there are no additional validators for reports nor connections
@@ -381,6 +810,13 @@ class ValidateManager:
         modified_files, added_files, old_format_files, changed_meta_files = \
             self.get_modified_and_added_files(self.compare_type, self.prev_ver)
 
+        # the old versions of the modified files are read from the local git repository at once
+        tools.get_local_git_files([file_path[0] if isinstance(file_path, tuple) else file_path
+                                   for file_path in modified_files], tag=self.prev_ver)
+
+        self.prefetch_docker_images_latest_tags([file_path[1] if isinstance(file_path, tuple) else file_path
+                                                 for file_path in list(modified_files) + list(added_files)])
+
         validation_results = set()
 
         validation_results.add(self.validate_modified_files(modified_files))
@@ -406,6 +842,73 @@ class ValidateManager:
 
         return all(validation_results)
 
+    def prefetch_docker_images_latest_tags(self, paths):
+        """Fetches the latest tags of the docker images of the integrations and scripts about to be validated
+        concurrently, before the files are validated one by one.
+
+        Args:
+            paths: the paths of the files and directories about to be validated.
+        """
+        if self.skip_docker_checks:
+            return
+
+        docker_image_names = set()
+        for file_path in self.get_yml_files(paths):
+            try:
+                with open(file_path) as yml_file:
+                    yml_content = yaml.safe_load(yml_file)
+
+            except (OSError, yaml.YAMLError):
+                # the file is reported by its own validation
+                continue
+
+            if not isinstance(yml_content, dict):
+                continue
+
+            file_type = find_type(file_path, _dict=yml_content, file_type='yml')
+            if file_type == FileType.INTEGRATION:
+                script = yml_content.get('script') or {}
+
+            elif file_type in (FileType.SCRIPT, FileType.TEST_SCRIPT):
+                script = yml_content
+
+            else:
+                continue
+
+            docker_image = script.get('dockerimage', '')
+            if not docker_image:
+                # the default docker image of the python version
+                python_version = script.get('subtype', 'python2')
+                docker_image_names.add('demisto/python' if python_version == 'python2' else 'demisto/python3')
+
+            elif docker_image.startswith('demisto/') and ':' in docker_image:
+                docker_image_names.add(docker_image.split(':')[0])
+
+        if docker_image_names:
+            DockerImageValidator.prefetch_latest_tags(docker_image_names)
+
+    @staticmethod
+    def get_yml_files(paths):
+        """Returns the yml files of the given files and directories.
+
+        Args:
+            paths: the paths of files and directories.
+
+        Returns:
+            list. The yml file paths.
+        """
+        yml_files: List[str] = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, file_names in os.walk(path):
+                    yml_files.extend(os.path.join(root, file_name) for file_name in sorted(file_names)
+                                     if file_name.endswith('.yml'))
+
+            elif str(path).endswith('.yml') and os.path.isfile(path):
+                yml_files.append(path)
+
+        return yml_files
+
     """ ######################################## Unique Validations ####################################### """
 
     def validate_readme(self, file_path, pack_error_ignore_list):
@@ -554,13 +1057,20 @@ class ValidateManager:
         """
         print(f'\nValidating {pack_path} unique pack files')
 
+        dependencies_validation_args = {}
+        if self.use_git:
+            dependencies_validation_args = {'id_set': self.get_id_set(id_set_path),
+                                            'core_pack_list': self.get_core_pack_list(),
+                                            'dependencies_cache': self.pack_dependencies_cache}
+
         pack_unique_files_validator = PackUniqueFilesValidator(pack=os.path.basename(pack_path),
                                                                pack_path=pack_path,
                                                                ignored_errors=pack_error_ignore_list,
                                                                print_as_warnings=self.print_ignored_errors,
                                                                should_version_raise=should_version_raise,
                                                                validate_dependencies=self.use_git,
-                                                               id_set_path=id_set_path)
+                                                               id_set_path=id_set_path,
+                                                               **dependencies_validation_args)
         pack_errors = pack_unique_files_validator.validate_pack_unique_files()
         if pack_errors:
             click.secho(pack_errors, fg="bright_red")
@@ -568,6 +1078,34 @@ class ValidateManager:
 
         return True
 
+    def get_id_set(self, id_set_path=None):
+        """Loads the id set on the first call, or creates it at id_set_path if it does not exist.
+
+        Args:
+            id_set_path (str): Path of the id_set. Optional.
+
+        Returns:
+            IdSet. The id set of the run.
+        """
+        if self.id_set is None:
+            if id_set_path and os.path.isfile(id_set_path):
+                self.id_set = IdSet.load(id_set_path)
+            else:
+                self.id_set = IdSet(IDSetCreator(print_logs=False, output=id_set_path or '').create_id_set())
+
+        return self.id_set
+
+    def get_core_pack_list(self):
+        """Fetches the core packs list on the first call.
+
+        Returns:
+            list. The core packs of the run.
+        """
+        if self.core_pack_list is None:
+            self.core_pack_list = get_core_pack_list()
+
+        return self.core_pack_list
+
     def validate_modified_files(self, modified_files):
         click.secho(f'\n================= Running validation on modified files =================',
                     fg="bright_cyan")
@@ -612,9 +1150,6 @@ class ValidateManager:
 
         changed_packs = modified_packs.union(added_packs).union(changed_meta_packs)
 
-        if not os.path.isfile('Tests/id_set.json'):
-            IDSetCreator(print_logs=False, output='Tests/id_set.json').create_id_set()
-
         for pack in changed_packs:
             raise_version = False
             pack_path = tools.pack_name_to_path(pack)
@@ -0,0 +1,116 @@
+"""
+On disk cache of the validation results of content files, so files which were not changed since they were found valid
+are not validated again.
+"""
+import hashlib
+import json
+import os
+from typing import Optional
+
+from demisto_sdk.commands.common.constants import CONTENT_ENTITIES_DIRS
+from demisto_sdk.commands.common.tools import get_cache_dir, print_warning
+from demisto_sdk.commands.common.update_id_set import (get_content_path_hash,
+                                                       get_sdk_version)
+
+VALIDATION_CACHE_VERSION = 1
+
+
+class ValidationCache:
+    """
+    The validation cache keeps the results of valid files, keyed by a hash of everything the validation of the file
+    reads: the file path and content (or its whole package for package files), which determine the file type, the sdk
+    version, the relevant .pack-ignore sections, the cross file inputs (pack metadata, conf.json, id_set) and the
+    validation settings.
+
+    Attributes:
+        cache_dir (str): The directory the results are kept in.
+        hits (int): The number of files which results were replayed from the cache.
+        misses (int): The number of files which were validated.
+    """
+
+    def __init__(self, cache_dir: str = ''):
+        self.cache_dir = cache_dir or get_cache_dir('validate')
+        self.hits = 0
+        self.misses = 0
+        self._path_hashes: dict = {}
+
+    def reset_run(self):
+        """Forgets the hashes and counters of the last run, so the files which were changed since are hashed again."""
+        self.hits = 0
+        self.misses = 0
+        self._path_hashes.clear()
+
+    def get_path_hash(self, path: str) -> str:
+        """Returns the content hash of a file or a directory, or an empty string if it does not exist.
+        The hashes are calculated once per run."""
+        if path not in self._path_hashes:
+            self._path_hashes[path] = get_content_path_hash(path) if os.path.exists(path) else ''
+        return self._path_hashes[path]
+
+    @staticmethod
+    def get_validated_path(file_path: str) -> str:
+        """Returns the package directory of files in packages, which are validated with their code, image and
+        description files, or the file itself otherwise."""
+        package_path = os.path.dirname(file_path)
+        if os.path.basename(os.path.dirname(package_path)) in CONTENT_ENTITIES_DIRS:
+            return package_path
+        return file_path
+
+    def get_key(self, file_path: str, pack_error_ignore_list: dict, cross_file_inputs: list, settings: dict) -> str:
+        """
+        Calculates the cache key of a file validation.
+
+        Args:
+            file_path: The validated file path.
+            pack_error_ignore_list: The errors ignored by the .pack-ignore file of the file's pack.
+            cross_file_inputs: Paths of other files the validation reads, e.g. conf.json and the id_set.
+            settings: The validation settings which affect the result.
+
+        Returns:
+            str. The hex digest of the file validation inputs.
+        """
+        validated_path = self.get_validated_path(file_path)
+        if validated_path == file_path:
+            validated_file_names = [os.path.basename(file_path)]
+        else:
+            validated_file_names = sorted(os.listdir(validated_path))
+
+        key_data = {
+            'version': VALIDATION_CACHE_VERSION,
+            'sdk_version': get_sdk_version(),
+            'file_path': file_path,
+            'content_hash': self.get_path_hash(validated_path),
+            'ignored_errors': {file_name: pack_error_ignore_list.get(file_name)
+                               for file_name in validated_file_names if file_name in pack_error_ignore_list},
+            'cross_file_inputs': {path: self.get_path_hash(path) for path in cross_file_inputs},
+            'settings': settings,
+        }
+        return hashlib.sha1(json.dumps(key_data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def get_result_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f'{key}.json')
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the cached result of a file validation, or None if there is no valid cached result."""
+        result_path = self.get_result_path(key)
+        if not os.path.isfile(result_path):
+            return None
+
+        try:
+            with open(result_path, 'r') as result_file:
+                return json.load(result_file)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, result: dict):
+        """Keeps the result of a file validation. The result is written to a temporary file which is then renamed,
+        so concurrent validations never read a partially written result."""
+        result_path = self.get_result_path(key)
+        temp_path = f'{result_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(result_path), exist_ok=True)
+            with open(temp_path, 'w') as result_file:
+                json.dump(result, result_file)
+            os.replace(temp_path, result_path)
+        except OSError as err:
+            print_warning(f'Could not save the validation result to the cache {self.cache_dir}. Error: {err}')
@@ -1,3 +1,4 @@
+import json
 import os
 
 from click.testing import CliRunner
@@ -196,3 +197,99 @@ def test_integration_find_dependencies__with_dependency(repo):
     assert '"display_name": "FindDependencyPack1"' in result.output
     assert result.exit_code == 0
     assert result.stderr == ""
+
+
+def test_integration_find_dependencies__all_packs(repo):
+    """
+    Given
+    - Valid repo with 3 pack folders where pack3 (script) depends on pack2 (script),
+      which depends on pack1 (integration).
+
+    When
+    - Running find-dependencies on all the packs with a graph output.
+
+    Then
+    - Ensure every pack metadata is updated with its first level dependencies.
+    - Ensure the graph output has the all level dependencies of every pack.
+    """
+    packs = [repo.create_pack(f'FindDependencyPack{i}') for i in range(1, 4)]
+    for pack in packs:
+        with open(os.path.join(pack.path, 'pack_metadata.json'), 'w') as pack_metadata_file:
+            json.dump({'name': os.path.basename(pack.path)}, pack_metadata_file)
+    id_set = {section: [] for section in EMPTY_ID_SET}
+    id_set['integrations'].append({
+        'integration1': {'name': 'integration1', 'commands': ['test-command'], 'pack': 'FindDependencyPack1'}
+    })
+    id_set['scripts'].append({
+        'Script2': {'name': 'Script2', 'depends_on': ['test-command'], 'pack': 'FindDependencyPack2'}
+    })
+    id_set['scripts'].append({
+        'Script3': {'name': 'Script3', 'depends_on': ['Script2'], 'pack': 'FindDependencyPack3'}
+    })
+    repo.id_set.write_json(id_set)
+    graph_output_path = os.path.join(repo.path, 'dependency_graph.json')
+
+    # Change working dir to repo
+    with ChangeCWD(repo.path):
+        runner = CliRunner(mix_stderr=False)
+        result = runner.invoke(main, [FIND_DEPENDENCIES_CMD,
+                                      '--all-packs',
+                                      '-i', repo.id_set.path,
+                                      '--graph-output', graph_output_path,
+                                      ])
+    assert 'Found dependencies result for 3 packs' in result.output
+    assert result.exit_code == 0
+    assert result.stderr == ""
+
+    with open(os.path.join(packs[2].path, 'pack_metadata.json')) as pack_metadata_file:
+        pack_metadata = json.load(pack_metadata_file)
+    assert pack_metadata['dependencies'] == {
+        'FindDependencyPack2': {'mandatory': True, 'display_name': 'FindDependencyPack2'}
+    }
+    with open(graph_output_path) as graph_output_file:
+        dependency_graph = json.load(graph_output_file)
+    assert dependency_graph['FindDependencyPack1']['all_level_dependencies'] == []
+    assert dependency_graph['FindDependencyPack3']['all_level_dependencies'] == ['FindDependencyPack1',
+                                                                                 'FindDependencyPack2']
+
+
+def test_integration_find_dependencies__single_pack_graph_output(repo):
+    """
+    Given
+    - Valid repo with 2 pack folders where pack2 (script) depends on pack1 (integration).
+
+    When
+    - Running find-dependencies on pack2 with a graph output.
+
+    Then
+    - Ensure the pack metadata is updated with its dependencies, and the graph output is written.
+    """
+    packs = [repo.create_pack(f'FindDependencyPack{i}') for i in range(1, 3)]
+    for pack in packs:
+        with open(os.path.join(pack.path, 'pack_metadata.json'), 'w') as pack_metadata_file:
+            json.dump({'name': os.path.basename(pack.path)}, pack_metadata_file)
+    id_set = {section: [] for section in EMPTY_ID_SET}
+    id_set['integrations'].append({
+        'integration1': {'name': 'integration1', 'commands': ['test-command'], 'pack': 'FindDependencyPack1'}
+    })
+    id_set['scripts'].append({
+        'Script2': {'name': 'Script2', 'depends_on': ['test-command'], 'pack': 'FindDependencyPack2'}
+    })
+    repo.id_set.write_json(id_set)
+    graph_output_path = os.path.join(repo.path, 'dependency_graph.json')
+
+    with ChangeCWD(repo.path):
+        runner = CliRunner(mix_stderr=False)
+        result = runner.invoke(main, [FIND_DEPENDENCIES_CMD,
+                                      '-p', 'FindDependencyPack2',
+                                      '-i', repo.id_set.path,
+                                      '--graph-output', graph_output_path,
+                                      '-w', '1',
+                                      ])
+    assert 'Found dependencies result for FindDependencyPack2 pack:' in result.output
+    assert result.exit_code == 0
+    assert result.stderr == ""
+
+    with open(graph_output_path) as graph_output_file:
+        dependency_graph = json.load(graph_output_file)
+    assert dependency_graph['FindDependencyPack2']['all_level_dependencies'] == ['FindDependencyPack1']
@@ -4,6 +4,8 @@ from click.testing import CliRunner
 from demisto_sdk.__main__ import main
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import DEFAULT_IMAGE_BASE64
+from demisto_sdk.commands.common.errors import (FOUND_FILES_AND_ERRORS,
+                                                FOUND_FILES_AND_IGNORED_ERRORS)
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
@@ -1377,6 +1379,89 @@ class TestAllFilesValidator:
         assert 'The name of this v2 script is incorrect' in result.stdout
         assert result.exit_code == 1
 
+    def test_not_all_files_valid_in_parallel(self, mocker, repo):
+        """
+        Given
+        - An invalid repo with several packs.
+
+        When
+        - Running validate on it serially and with several workers.
+
+        Then
+        - Ensure the output and the exit code of both runs are identical.
+        """
+        mocker.patch.object(tools, 'is_external_repository', return_value=False)
+        mocker.patch.object(PackUniqueFilesValidator, 'validate_pack_unique_files', return_value='')
+        mocker.patch.object(ValidateManager, 'validate_readme', return_value=True)
+        mocker.patch.object(BaseValidator, 'check_file_flags', return_value='')
+        pack1 = repo.create_pack('PackName1')
+        pack1.create_integration(yml=get_yaml(join(AZURE_FEED_PACK_PATH, "Integrations/FeedAzure/FeedAzure.yml")))
+        incident_field_copy = INCIDENT_FIELD.copy()
+        incident_field_copy['content'] = False
+        pack1.create_incident_field('incident-field', content=incident_field_copy)
+        pack1.create_dashboard('dashboard', content=DASHBOARD)
+        invalid_script_yml = get_yaml(VALID_SCRIPT_PATH)
+        invalid_script_yml['name'] = invalid_script_yml['name'] + "_v2"
+        repo.create_pack('PackName2').create_script(yml=invalid_script_yml)
+        repo.create_pack('PackName3').create_script(yml=get_yaml(VALID_SCRIPT_PATH))
+
+        results = []
+        for workers in ['1', '3']:
+            FOUND_FILES_AND_ERRORS.clear()
+            FOUND_FILES_AND_IGNORED_ERRORS.clear()
+            with ChangeCWD(repo.path):
+                runner = CliRunner(mix_stderr=False)
+                results.append(runner.invoke(main, [VALIDATE_CMD, '-a', '--no-docker-checks', '--no-conf-json',
+                                                    '--workers', workers, '--no-cache'],
+                                             catch_exceptions=False))
+        serial_result, parallel_result = results
+
+        assert 'IF101' in parallel_result.stdout
+        assert 'SC100' in parallel_result.stdout
+        assert parallel_result.stdout == serial_result.stdout
+        assert parallel_result.exit_code == serial_result.exit_code == 1
+
+    def test_not_all_files_valid_with_cache(self, mocker, repo):
+        """
+        Given
+        - An invalid repo with valid and invalid files.
+
+        When
+        - Running validate on it twice, and once more without the cache.
+
+        Then
+        - Ensure the second run replays the results of the valid files from the cache and validates the invalid ones.
+        - Ensure the output of the runs is identical apart from the cache report.
+        - Ensure no results are replayed without the cache.
+        """
+        mocker.patch.object(tools, 'is_external_repository', return_value=False)
+        mocker.patch.object(PackUniqueFilesValidator, 'validate_pack_unique_files', return_value='')
+        mocker.patch.object(ValidateManager, 'validate_readme', return_value=True)
+        mocker.patch.object(BaseValidator, 'check_file_flags', return_value='')
+        invalid_script_yml = get_yaml(VALID_SCRIPT_PATH)
+        invalid_script_yml['name'] = invalid_script_yml['name'] + "_v2"
+        pack = repo.create_pack('PackName1')
+        pack.create_script(yml=invalid_script_yml)
+        pack.create_dashboard('dashboard', content=DASHBOARD)
+        repo.create_pack('PackName2').create_script(yml=get_yaml(VALID_SCRIPT_PATH))
+
+        results = []
+        for args in [[], [], ['--no-cache']]:
+            FOUND_FILES_AND_ERRORS.clear()
+            FOUND_FILES_AND_IGNORED_ERRORS.clear()
+            with ChangeCWD(repo.path):
+                runner = CliRunner(mix_stderr=False)
+                results.append(runner.invoke(main, [VALIDATE_CMD, '-a', '--no-docker-checks', '--no-conf-json'] + args,
+                                             catch_exceptions=False))
+        first_result, cached_result, no_cache_result = results
+
+        assert 'Validation cache: 0 hits, 9 misses' in first_result.stdout
+        assert 'Validation cache: 8 hits, 1 misses' in cached_result.stdout
+        assert 'Validation cache' not in no_cache_result.stdout
+        assert 'SC100' in cached_result.stdout
+        assert cached_result.stdout.replace('8 hits, 1 misses', '0 hits, 9 misses') == first_result.stdout
+        assert first_result.exit_code == cached_result.exit_code == no_cache_result.exit_code == 1
+
 
 class TestValidationUsingGit:
     def test_passing_validation_using_git(self, mocker, repo):